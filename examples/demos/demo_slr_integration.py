@@ -102,7 +102,7 @@ def main():
 
     print(f"Deduplicating {len(result_files)} result sets...")
 
-    total_before = sum(len(service.load_results(f)) for f in result_files)
+    total_before = sum(service.load_results_summary(f)['total_results'] for f in result_files)
     unique_docs = service.deduplicate_results(result_files)
 
     print(f"  Before deduplication: {total_before} documents")
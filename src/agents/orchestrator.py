@@ -97,26 +97,21 @@ class OrchestratorAgent:
         search_results = []
         errors = []
 
-        for database in strategy.databases:
-            for query in strategy.queries:
-                try:
-                    result = self.search_service.execute_search(
-                        database=database,
-                        query=query,
-                        max_results=strategy.max_results
-                    )
-
-                    if result.error:
-                        errors.append(f"{database}/{query}: {result.error}")
-                        logger.warning(f"Search failed: {database}/{query} - {result.error}")
-                    else:
-                        search_results.append(result)
-                        logger.info(f"Search succeeded: {database}/{query} - {result.total_hits} results")
-
-                except Exception as e:
-                    error_msg = f"{database}/{query}: {str(e)}"
-                    errors.append(error_msg)
-                    logger.error(f"Search exception: {error_msg}", exc_info=True)
+        searches = [(database, query) for database in strategy.databases for query in strategy.queries]
+        try:
+            summaries = self.search_service.execute_searches(searches, max_results=strategy.max_results)
+        except Exception as e:
+            errors.append(str(e))
+            logger.error(f"Search exception: {e}", exc_info=True)
+            summaries = []
+
+        for (database, query), result in zip(searches, summaries):
+            if result.error:
+                errors.append(f"{database}/{query}: {result.error}")
+                logger.warning(f"Search failed: {database}/{query} - {result.error}")
+            else:
+                search_results.append(result)
+                logger.info(f"Search succeeded: {database}/{query} - {result.total_hits} results")
 
         # Step 3: Calculate totals
         total_papers = sum(r.total_hits for r in search_results)
@@ -179,7 +174,7 @@ Respond with valid JSON only:
 Generate a search strategy that will find the most relevant academic papers."""
 
         try:
-            response = self.llm.generate(system_prompt, user_prompt)
+            response = self.llm.generate(system_prompt, user_prompt, json_mode=True)
             strategy_dict = self.llm.clean_json_response(response)
 
             # Validate databases
@@ -129,18 +129,22 @@ class SynthesizerAgent:
         loaded: List[Paper] = []
         for rf in result_files:
             try:
-                docs = self.search_service.load_results(rf)
-                for d in docs:
-                    loaded.append(Paper(
+                # Stream the rows so the raw dicts are never all held alongside the Papers
+                papers = [
+                    Paper(
                         title=d.get('title'),
                         abstract=d.get('abstract'),
                         year=d.get('year'),
                         doi=d.get('doi'),
                         provider=d.get('provider'),
                         provider_id=d.get('provider_id')
-                    ))
+                    )
+                    for d in self.search_service.iter_results(rf)
+                ]
             except Exception as e:
                 logger.warning(f"Failed to load {rf}: {e}")
+                continue
+            loaded.extend(papers)
         return loaded
 
     # ------------------------- Selection -------------------------
@@ -265,7 +269,7 @@ class SynthesizerAgent:
             "Respond ONLY in JSON with keys: synthesis, bullets, methods, trends, gaps."
         )
         try:
-            raw = self.llm.generate(system_prompt, user_prompt)
+            raw = self.llm.generate(system_prompt, user_prompt, json_mode=True)
             data = self.llm.clean_json_response(raw)
             synthesis = data.get('synthesis', '')
             bullets = data.get('bullets', [])
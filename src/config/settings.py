@@ -137,6 +137,35 @@ class LLMConfig(BaseSettings):
         default=False,
         description="Enable response caching"
     )
+    cache_max_entries: int = Field(
+        default=2000,
+        gt=0,
+        description="Maximum cached LLM responses kept (oldest evicted first)"
+    )
+    semantic_cache_threshold: float = Field(
+        default=0.93,
+        ge=0.0,
+        le=1.0,
+        description="Cosine similarity above which a near-duplicate idea reuses a cached context"
+    )
+    response_semantic_threshold: Optional[float] = Field(
+        default=None,
+        ge=0.0,
+        le=1.0,
+        description="Cosine similarity for reusing LLM responses to near-identical prompts (None = exact matches only)"
+    )
+
+    # Pipeline behaviour
+    fused_framing: bool = Field(
+        default=True,
+        description="Run Stage 1 critique and refine as a single LLM call"
+    )
+    skip_refine_threshold: Optional[int] = Field(
+        default=9,
+        ge=1,
+        le=10,
+        description="Feasibility score at which a critique with no specific issues skips the refine call (None = always refine)"
+    )
 
     @field_validator("openai_api_key")
     @classmethod
@@ -192,6 +221,14 @@ class ValidationConfig(BaseSettings):
         default=86400,  # 24 hours
         description="Cache TTL in seconds"
     )
+    openalex_cache_path: Path = Field(
+        default=Path(".cache/openalex_validation.json"),
+        description="File persisting OpenAlex term lookups across runs"
+    )
+    known_terms_path: Optional[Path] = Field(
+        default=None,
+        description="Newline-separated list of established terms accepted without an OpenAlex lookup"
+    )
 
 
 class BaseConfig(BaseSettings):
@@ -7,8 +7,12 @@ the pipeline stages.
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
 from enum import Enum
+from functools import partial
 from typing import Any, Dict, List, Optional
 
+# C-level callable for timestamp defaults (avoids a Python lambda frame per field)
+_utcnow = partial(datetime.now, UTC)
+
 
 class ApprovalStatus(str, Enum):
     """Status of an artifact in the HITL approval workflow."""
@@ -25,7 +29,7 @@ class ModelMetadata:
     model_name: str
     mode: str  # e.g., "llm", "slm", "hybrid"
     prompt_version: Optional[str] = None
-    generated_at: datetime = field(default_factory=lambda: datetime.now(UTC))
+    generated_at: datetime = field(default_factory=_utcnow)
     notes: Optional[str] = None
 
 
@@ -40,8 +44,8 @@ class ProjectContext:
     application_area: Optional[str] = None
     constraints: Dict[str, Any] = field(default_factory=dict)
     initial_keywords: List[str] = field(default_factory=list)
-    created_at: datetime = field(default_factory=lambda: datetime.now(UTC))
-    updated_at: datetime = field(default_factory=lambda: datetime.now(UTC))
+    created_at: datetime = field(default_factory=_utcnow)
+    updated_at: datetime = field(default_factory=_utcnow)
     status: ApprovalStatus = ApprovalStatus.DRAFT
     model_metadata: Optional[ModelMetadata] = None
     user_notes: Optional[str] = None
@@ -58,14 +62,16 @@ class ProblemFraming:
     stakeholders: List[str] = field(default_factory=list)
     research_gap: Optional[str] = None  # What's missing in current literature
     critique_report: Optional[str] = None  # AI critique + validation report
-    created_at: datetime = field(default_factory=lambda: datetime.now(UTC))
-    updated_at: datetime = field(default_factory=lambda: datetime.now(UTC))
+    created_at: datetime = field(default_factory=_utcnow)
+    updated_at: datetime = field(default_factory=_utcnow)
     status: ApprovalStatus = ApprovalStatus.DRAFT
     model_metadata: Optional[ModelMetadata] = None
     user_notes: Optional[str] = None
 
 
-@dataclass
+# Leaf items below are created in bulk on every run; slots drop the
+# per-instance __dict__. Only declared fields may be assigned.
+@dataclass(slots=True)
 class Concept:
     """A key concept extracted from the problem framing."""
     id: str
@@ -90,14 +96,14 @@ class ConceptModel:
     project_id: str
     concepts: List[Concept] = field(default_factory=list)
     relations: List[Relation] = field(default_factory=list)
-    created_at: datetime = field(default_factory=lambda: datetime.now(UTC))
-    updated_at: datetime = field(default_factory=lambda: datetime.now(UTC))
+    created_at: datetime = field(default_factory=_utcnow)
+    updated_at: datetime = field(default_factory=_utcnow)
     status: ApprovalStatus = ApprovalStatus.DRAFT
     model_metadata: Optional[ModelMetadata] = None
     user_notes: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ResearchQuestion:
     """A single research question with metadata."""
     id: str
@@ -113,14 +119,14 @@ class ResearchQuestionSet:
     """Collection of research questions for the project."""
     project_id: str
     questions: List[ResearchQuestion] = field(default_factory=list)
-    created_at: datetime = field(default_factory=lambda: datetime.now(UTC))
-    updated_at: datetime = field(default_factory=lambda: datetime.now(UTC))
+    created_at: datetime = field(default_factory=_utcnow)
+    updated_at: datetime = field(default_factory=_utcnow)
     status: ApprovalStatus = ApprovalStatus.DRAFT
     model_metadata: Optional[ModelMetadata] = None
     user_notes: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class SearchConceptBlock:
     """A group of synonymous/related terms for one conceptual dimension."""
     id: str
@@ -135,14 +141,14 @@ class SearchConceptBlocks:
     """Collection of search concept blocks."""
     project_id: str
     blocks: List[SearchConceptBlock] = field(default_factory=list)
-    created_at: datetime = field(default_factory=lambda: datetime.now(UTC))
-    updated_at: datetime = field(default_factory=lambda: datetime.now(UTC))
+    created_at: datetime = field(default_factory=_utcnow)
+    updated_at: datetime = field(default_factory=_utcnow)
     status: ApprovalStatus = ApprovalStatus.DRAFT
     model_metadata: Optional[ModelMetadata] = None
     user_notes: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class DatabaseQuery:
     """A database-specific search query."""
     id: str
@@ -159,8 +165,8 @@ class DatabaseQueryPlan:
     """Collection of database queries for the search strategy."""
     project_id: str
     queries: List[DatabaseQuery] = field(default_factory=list)
-    created_at: datetime = field(default_factory=lambda: datetime.now(UTC))
-    updated_at: datetime = field(default_factory=lambda: datetime.now(UTC))
+    created_at: datetime = field(default_factory=_utcnow)
+    updated_at: datetime = field(default_factory=_utcnow)
     status: ApprovalStatus = ApprovalStatus.DRAFT
     model_metadata: Optional[ModelMetadata] = None
     user_notes: Optional[str] = None
@@ -183,8 +189,8 @@ class ScreeningCriteria:
     project_id: str
     inclusion_criteria: List[str] = field(default_factory=list)
     exclusion_criteria: List[str] = field(default_factory=list)
-    created_at: datetime = field(default_factory=lambda: datetime.now(UTC))
-    updated_at: datetime = field(default_factory=lambda: datetime.now(UTC))
+    created_at: datetime = field(default_factory=_utcnow)
+    updated_at: datetime = field(default_factory=_utcnow)
     status: ApprovalStatus = ApprovalStatus.DRAFT
     model_metadata: Optional[ModelMetadata] = None
     user_notes: Optional[str] = None
@@ -203,8 +209,8 @@ class ScreeningChecklist:
     """Collection of screening questions."""
     project_id: str
     questions: List[ScreeningQuestion] = field(default_factory=list)
-    created_at: datetime = field(default_factory=lambda: datetime.now(UTC))
-    updated_at: datetime = field(default_factory=lambda: datetime.now(UTC))
+    created_at: datetime = field(default_factory=_utcnow)
+    updated_at: datetime = field(default_factory=_utcnow)
     status: ApprovalStatus = ApprovalStatus.DRAFT
     model_metadata: Optional[ModelMetadata] = None
     user_notes: Optional[str] = None
@@ -241,8 +247,8 @@ class SearchResults:
     result_file_paths: List[str]  # Paths to JSON files containing papers
     deduplication_stats: Dict[str, Any]  # {"original_count": 347, "duplicates_removed": 52, ...}
     execution_time_seconds: float
-    created_at: datetime = field(default_factory=lambda: datetime.now(UTC))
-    updated_at: datetime = field(default_factory=lambda: datetime.now(UTC))
+    created_at: datetime = field(default_factory=_utcnow)
+    updated_at: datetime = field(default_factory=_utcnow)
     status: ApprovalStatus = ApprovalStatus.DRAFT
     model_metadata: Optional[ModelMetadata] = None
     user_notes: Optional[str] = None
@@ -253,8 +259,8 @@ class StrategyExportBundle:
     project_id: str
     exported_files: List[str] = field(default_factory=list)  # relative paths under data/<project_id>/export/
     notes: Optional[str] = None
-    created_at: datetime = field(default_factory=lambda: datetime.now(UTC))
-    updated_at: datetime = field(default_factory=lambda: datetime.now(UTC))
+    created_at: datetime = field(default_factory=_utcnow)
+    updated_at: datetime = field(default_factory=_utcnow)
     status: ApprovalStatus = ApprovalStatus.DRAFT
     model_metadata: Optional[ModelMetadata] = None
     user_notes: Optional[str] = None
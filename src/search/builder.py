@@ -1,5 +1,6 @@
 """Query builder that orchestrates dialect-specific syntax generation."""
 
+from functools import lru_cache
 from typing import Type
 
 from .models import QueryPlan, ConceptBlock
@@ -67,9 +68,29 @@ class SyntaxBuilder:
         return self.dialect.join_and(group_strings)
 
 
+# Lower-case database name -> dialect class
+_DIALECTS = {
+    "pubmed": PubMedDialect,
+    "scopus": ScopusDialect,
+    "arxiv": ArxivDialect,
+    "openalex": OpenAlexDialect,
+    "semanticscholar": SemanticScholarDialect,
+    "crossref": CrossRefDialect,
+}
+
+
+@lru_cache(maxsize=None)
+def _builder_for(db_name_lower: str) -> SyntaxBuilder:
+    """Return the shared builder for a known database (dialects are stateless)."""
+    return SyntaxBuilder(_DIALECTS[db_name_lower])
+
+
 def get_builder(db_name: str) -> SyntaxBuilder:
     """Factory function to get builder for a database.
 
+    Builders hold no per-query state, so one instance per database is
+    created on first use and reused afterwards.
+
     Args:
         db_name: Database name ("pubmed", "scopus", "arxiv", "openalex", "semanticscholar", "crossref")
 
@@ -86,20 +107,9 @@ def get_builder(db_name: str) -> SyntaxBuilder:
     """
     db_name_lower = db_name.lower()
 
-    if db_name_lower == "pubmed":
-        return SyntaxBuilder(PubMedDialect)
-    elif db_name_lower == "scopus":
-        return SyntaxBuilder(ScopusDialect)
-    elif db_name_lower == "arxiv":
-        return SyntaxBuilder(ArxivDialect)
-    elif db_name_lower == "openalex":
-        return SyntaxBuilder(OpenAlexDialect)
-    elif db_name_lower == "semanticscholar":
-        return SyntaxBuilder(SemanticScholarDialect)
-    elif db_name_lower == "crossref":
-        return SyntaxBuilder(CrossRefDialect)
-    else:
+    if db_name_lower not in _DIALECTS:
         raise ValueError(
             f"Unknown database: {db_name}. "
             f"Supported: pubmed, scopus, arxiv, openalex, semanticscholar, crossref"
         )
+    return _builder_for(db_name_lower)
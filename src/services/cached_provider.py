@@ -0,0 +1,238 @@
+"""Response cache in front of an LLMProvider.
+
+Pipeline re-runs, retries and HITL iteration frequently re-send prompts that
+are byte-identical (or nearly so) to earlier ones. ``CachedProvider`` wraps
+any provider and answers those from a two-tier cache:
+
+1. Exact: SHA-256 of (model settings, JSON mode, system prompt, user prompt)
+   -> response, capped at ``max_entries`` (oldest evicted first).
+2. Semantic (opt-in): nearest previous user prompt for the same system
+   prompt, via :class:`SemanticCache`, accepted only above a strict cosine
+   threshold.
+
+The semantic tier is off by default: stage prompts share long templates, so
+without a real embedding model two different ideas can look near-identical.
+Both tiers are persisted under the configured cache directory; the exact
+tier is an append-only JSON Lines log that is compacted once it holds twice
+as many records as live entries. JSON-mode responses that do not parse are
+never stored, and callers that reject a parsed response can drop it again
+with :meth:`CachedProvider.discard`.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import threading
+from pathlib import Path
+from typing import Dict, Optional
+
+from .llm_provider import LLMProvider, _strip_code_fence
+from .semantic_cache import SemanticCache
+
+logger = logging.getLogger(__name__)
+
+
+class CachedProvider(LLMProvider):
+    """LLMProvider wrapper that caches responses by prompt.
+
+    Example:
+        >>> provider = CachedProvider(get_llm_provider(), Path(".cache/llm"))
+        >>> provider.generate(SYSTEM_PROMPT_CRITIC, prompt)  # network
+        >>> provider.generate(SYSTEM_PROMPT_CRITIC, prompt)  # cache hit
+    """
+
+    def __init__(
+        self,
+        provider: LLMProvider,
+        cache_dir: Path,
+        semantic_threshold: Optional[float] = None,
+        max_entries: int = 2000,
+    ):
+        """Wrap a provider with exact and semantic response caches.
+
+        Args:
+            provider: Provider that serves cache misses
+            cache_dir: Directory for the persisted caches
+            semantic_threshold: Minimum cosine similarity for a semantic hit
+                (e.g. 0.97); None disables the semantic tier
+            max_entries: Maximum exact-tier responses kept
+        """
+        self.provider = provider
+        self.cache_dir = Path(cache_dir)
+        self.semantic_threshold = semantic_threshold
+        self.max_entries = max_entries
+        self.path = self.cache_dir / "llm_responses.jsonl"
+
+        # Responses depend on the generation settings, not just the prompts
+        self._settings_key = json.dumps(
+            {
+                "m": getattr(provider, "model", None),
+                "t": getattr(provider, "temperature", None),
+                "x": getattr(provider, "max_tokens", None),
+            },
+            sort_keys=True,
+            default=str,
+        ).encode("utf-8")
+
+        self._lock = threading.Lock()
+        self._log_records = 0  # lines in the on-disk log, live or not
+        self._exact: Dict[str, str] = self._load()
+        self._semantic: Dict[str, SemanticCache] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def generate(self, system_prompt: str, user_prompt: str, json_mode: bool = False) -> str:
+        """Return a cached response if available, else delegate and store.
+
+        Args:
+            system_prompt: System message defining the AI's role/persona
+            user_prompt: User message with the actual task
+            json_mode: Passed to the wrapped provider on a cache miss; part
+                of the cache key, so free text is never served as JSON
+
+        Returns:
+            Generated (or cached) text response. In JSON mode a response is
+            only cached if it parses, so a truncated reply is not replayed.
+        """
+        key = self._key(system_prompt, user_prompt, json_mode)
+
+        with self._lock:
+            response = self._exact.get(key)
+            if response is None and self.semantic_threshold is not None:
+                response = self._semantic_index(system_prompt, json_mode).lookup(user_prompt)
+
+        if response is not None:
+            self.hits += 1
+            logger.debug(f"LLM response cache hit ({key[:12]})")
+            return response
+
+        self.misses += 1
+        response = self.provider.generate(system_prompt, user_prompt, json_mode=json_mode)
+        if json_mode and not _parses_as_json(response):
+            return response
+
+        with self._lock:
+            self._exact.pop(key, None)  # re-inserted as the newest entry
+            self._exact[key] = response
+            while len(self._exact) > self.max_entries:
+                del self._exact[next(iter(self._exact))]
+            self._append(key, response)
+            if self.semantic_threshold is not None:
+                self._semantic_index(system_prompt, json_mode).add(user_prompt, response)
+
+        return response
+
+    def discard(self, system_prompt: str, user_prompt: str, json_mode: bool = True) -> None:
+        """Drop the cached response for a prompt the caller could not use.
+
+        Args:
+            system_prompt: System message of the rejected call
+            user_prompt: User message of the rejected call
+            json_mode: JSON mode of the rejected call
+        """
+        key = self._key(system_prompt, user_prompt, json_mode)
+        with self._lock:
+            if self._exact.pop(key, None) is not None:
+                self._append(key, None)
+            if self.semantic_threshold is not None:
+                self._semantic_index(system_prompt, json_mode).discard(user_prompt)
+
+    def clear(self) -> None:
+        """Drop all cached responses (in memory and on disk)."""
+        with self._lock:
+            self._exact = {}
+            self._log_records = 0
+            if self.path.exists():
+                self.path.unlink()
+            for index in self._semantic.values():
+                index.clear()
+
+    def _key(self, system_prompt: str, user_prompt: str, json_mode: bool) -> str:
+        digest = hashlib.sha256(self._settings_key)
+        digest.update(b"\x01" if json_mode else b"\x00")
+        digest.update(system_prompt.encode("utf-8"))
+        digest.update(b"\x00")
+        digest.update(user_prompt.encode("utf-8"))
+        return digest.hexdigest()
+
+    def _semantic_index(self, system_prompt: str, json_mode: bool) -> SemanticCache:
+        """Return the semantic index for one persona (created lazily).
+
+        Indexes are kept per system prompt and JSON mode so a response is
+        never reused across personas or output formats.
+        """
+        persona = hashlib.sha256(system_prompt.encode("utf-8")).hexdigest()[:12]
+        if json_mode:
+            persona += "_json"
+        index = self._semantic.get(persona)
+        if index is None:
+            index = SemanticCache(
+                self.cache_dir,
+                threshold=self.semantic_threshold,
+                name=f"llm_responses_{persona}",
+            )
+            self._semantic[persona] = index
+        return index
+
+    def _load(self) -> Dict[str, str]:
+        """Replay the on-disk log (later records win, null drops a key)."""
+        if not self.path.exists():
+            return {}
+        entries: Dict[str, str] = {}
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        record = json.loads(line)
+                        key, response = record["k"], record["v"]
+                    except (ValueError, TypeError, KeyError):
+                        continue  # e.g. a line cut short by a crash
+                    self._log_records += 1
+                    entries.pop(key, None)
+                    if response is not None:
+                        entries[key] = response
+        except OSError as e:
+            logger.warning(f"Ignoring unreadable LLM response cache {self.path}: {e}")
+            return {}
+
+        # Keep the newest entries if the cap was lowered since the last run
+        for key in list(entries)[:max(0, len(entries) - self.max_entries)]:
+            del entries[key]
+        return entries
+
+    def _append(self, key: str, response: Optional[str]) -> None:
+        """Append one record to the log (caller holds ``_lock``).
+
+        A miss writes one line instead of the whole cache. Once dead records
+        (overwritten, discarded or evicted) outnumber live ones, the log is
+        rewritten with just the live entries.
+        """
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            if self._log_records >= 2 * max(len(self._exact), 1):
+                self._compact()  # already reflects this record
+                return
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write(json.dumps({"k": key, "v": response}, ensure_ascii=False) + "\n")
+            self._log_records += 1
+        except OSError as e:
+            logger.warning(f"Could not persist LLM response cache {self.path}: {e}")
+
+    def _compact(self) -> None:
+        """Rewrite the log with only the live entries (write-then-rename)."""
+        tmp_path = self.path.with_suffix(".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            for key, response in self._exact.items():
+                f.write(json.dumps({"k": key, "v": response}, ensure_ascii=False) + "\n")
+        os.replace(tmp_path, self.path)
+        self._log_records = len(self._exact)
+
+
+def _parses_as_json(response: str) -> bool:
+    """Return True if ``response`` is JSON (optionally inside a code fence)."""
+    try:
+        json.loads(_strip_code_fence(response))
+    except ValueError:
+        return False
+    return True
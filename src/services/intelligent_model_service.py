@@ -4,19 +4,38 @@ This service implements the Draft → Critique → Refine → Validate pattern
 for generating high-quality research artifacts.
 """
 
-import uuid
+import copy
+import hashlib
+import json
 import logging
-from typing import Tuple, List
+import re
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import fields, is_dataclass
+from functools import lru_cache, wraps
+from itertools import islice
+from typing import Dict, Tuple, List, Optional, Type, TypeVar
+
+from pydantic import BaseModel, ValidationError as PydanticValidationError
 
 from .model_service import ModelService
-from .llm_provider import get_llm_provider
-from .validation_service import ValidationService, ValidationReport
+from .llm_provider import get_llm_provider, get_http_client
+from .cached_provider import CachedProvider
+from .validation_service import ValidationService, ValidationReport, ValidationResult, load_known_terms
+from .semantic_cache import SemanticCache, has_semantic_embedder
+from .llm_responses import Stage0Response, QuestionItem, BlockItem
 from .prompts import (
     SYSTEM_PROMPT_METHODOLOGIST,
     SYSTEM_PROMPT_CRITIC,
     PROMPT_STAGE0_CONTEXT,
+    PROMPT_STAGE0_AND_CRITIQUE,
     PROMPT_STAGE1_CRITIQUE,
+    PROMPT_STAGE1_FUSED,
     PROMPT_STAGE1_REFINE, SYSTEM_PROMPT_LIBRARIAN,
+    PROMPT_STAGE2_RESEARCH_QUESTIONS,
+    PROMPT_STAGE3_SEARCH_EXPANSION,
+    PROMPT_STAGE4_QUERY_GENERATION,
+    format_concepts_for_prompt,
+    format_goals_for_prompt,
 )
 from ..models import (
     ProjectContext,
@@ -26,17 +45,157 @@ from ..models import (
     ModelMetadata,
     ResearchQuestionSet,
     ResearchQuestion,
+    SearchConceptBlock,
     SearchConceptBlocks,
+    DatabaseQuery,
     DatabaseQueryPlan,
     ScreeningCriteria,
     ScreeningChecklist,
     StrategyPackage,
 )
 from ..config import get_config
+from ..search.builder import get_builder
+from ..search.models import ConceptBlock as SyntaxConceptBlock, FieldTag, QueryPlan as SyntaxQueryPlan
 from ..utils.exceptions import LLMProviderError, ValidationError
+from ..utils.ids import fast_id, new_project_id
 
 logger = logging.getLogger(__name__)
 
+_BANNER = "=" * 70
+
+# Validation severity → status icon for critique reports
+_SEVERITY_ICONS = {
+    "ok": "✅",
+    "warning": "⚠️",
+    "critical": "❌",
+}
+_UNKNOWN_ICON = "❓"
+
+# Proximity operators LLMs invent but our target databases don't support.
+# Word boundaries keep ordinary words ("ADJUSTED", "PROXIMAL") from matching.
+_HALLUCINATED_OPERATORS_RE = re.compile(r"\b(NEAR|ADJ|PROX|WITHIN)\b|\b(W/)", re.IGNORECASE)
+
+
+def _validate_pubmed_query(query: str) -> List[str]:
+    # Lower-case [mesh] is a common PubMed mistake
+    query_lower = query.lower()
+    if "[mesh]" in query_lower and not ("[mesh terms]" in query_lower or "[mesh]" in query):
+        return ["PubMed MeSH tag should be [MeSH Terms] not [mesh]"]
+    return []
+
+
+def _validate_scopus_query(query: str) -> List[str]:
+    # Scopus should use TITLE-ABS-KEY wrapper
+    if "TITLE-ABS-KEY" not in query:
+        return ["Scopus queries should use TITLE-ABS-KEY() wrapper"]
+    return []
+
+
+# Upper bound on threads building fallback queries for a multi-database plan
+_QUERY_BUILD_WORKERS = 8
+
+# Database-specific syntax checks, keyed by lower-case database name
+_DB_QUERY_VALIDATORS = {
+    "pubmed": _validate_pubmed_query,
+    "scopus": _validate_scopus_query,
+}
+
+
+_Item = TypeVar("_Item", bound=BaseModel)
+
+
+def _parse_items(model: Type[_Item], payload) -> List[_Item]:
+    """Parse a list of LLM-returned objects, dropping malformed entries."""
+    if not isinstance(payload, list):
+        return []
+    items = []
+    for entry in payload:
+        try:
+            items.append(model.model_validate(entry))
+        except PydanticValidationError:
+            logger.debug(f"Skipping malformed {model.__name__}: {entry!r:.200}")
+    return items
+
+
+# Artifact bookkeeping fields that do not affect what a stage generates
+_STAGE_KEY_IGNORED = frozenset({"created_at", "updated_at", "status", "model_metadata", "user_notes"})
+_STAGE_CACHE_SIZE = 64
+
+
+def _artifact_content(value):
+    """Reduce stage inputs to their generation-relevant content for hashing."""
+    if is_dataclass(value):
+        return {
+            f.name: _artifact_content(getattr(value, f.name))
+            for f in fields(value)
+            if f.name not in _STAGE_KEY_IGNORED
+        }
+    if isinstance(value, (list, tuple)):
+        return [_artifact_content(v) for v in value]
+    if isinstance(value, dict):
+        return {k: _artifact_content(v) for k, v in value.items()}
+    return value
+
+
+def _stage_cached(method):
+    """Memoize a stage method on the content of its input artifacts.
+
+    Repeat calls with unchanged inputs (UI re-renders, re-runs) return a copy
+    of the earlier result without re-running the LLM and validation steps.
+    Fallback results are not cached, so a later call can still reach the LLM.
+    Enabled with ``config.llm.cache_enabled``.
+    """
+    @wraps(method)
+    def wrapper(self, *args, **kwargs):
+        if not self.config.llm.cache_enabled:
+            return method(self, *args, **kwargs)
+
+        payload = json.dumps(
+            [method.__name__, _artifact_content(args), _artifact_content(kwargs)],
+            sort_keys=True,
+            default=str,
+        )
+        key = hashlib.blake2b(payload.encode("utf-8"), digest_size=16).hexdigest()
+
+        cached = self._stage_cache.get(key)
+        if cached is not None:
+            logger.info(f"{method.__name__}: inputs unchanged, reusing previous result")
+            return copy.deepcopy(cached)
+
+        result = method(self, *args, **kwargs)
+        meta = result[-1]
+        if meta.model_name != "fallback" and not meta.mode.startswith("fallback"):
+            if len(self._stage_cache) >= _STAGE_CACHE_SIZE:
+                del self._stage_cache[next(iter(self._stage_cache))]
+            self._stage_cache[key] = copy.deepcopy(result)
+        return result
+
+    return wrapper
+
+
+# Stage 2 heuristic questions, one per leading concept (first needs a problem statement)
+_FALLBACK_RQ_TEMPLATES = (
+    "How does {term} relate to outcomes described in the problem statement?",
+    "What factors influence {term} adoption or effectiveness?",
+    "What mechanisms link {term} to observed performance or quality measures?",
+    "How can {term} be optimized to improve reliability or consistency?",
+    "What are the barriers and facilitators to integrating {term} in practice?",
+)
+
+
+def _fallback_term_variants(label: str) -> List[str]:
+    """Return the heuristic Stage 3 search terms for a concept label.
+
+    Deduplicated in first-seen order, so the concept's own label leads the
+    OR group in generated queries.
+    """
+    terms = [label, label.lower()]
+    if not label.endswith('s'):
+        terms.append(label + 's')
+    if ' ' in label:
+        terms.append(label.replace(' ', '-'))
+    return list(dict.fromkeys(terms))
+
 
 class IntelligentModelService(ModelService):
     """Enhanced model service with LLM and validation capabilities.
@@ -50,9 +209,45 @@ class IntelligentModelService(ModelService):
 
     def __init__(self):
         """Initialize with LLM provider and validation service."""
-        self.provider = get_llm_provider()
-        self.validator = ValidationService()
         self.config = get_config()
+        self.provider = get_llm_provider()
+        validation = self.config.validation
+        known_terms_path = validation.known_terms_path
+        # OpenAlex lookups share the LLM provider's kept-alive connection pool
+        self.validator = ValidationService(
+            http_client=get_http_client(),
+            known_terms=load_known_terms(known_terms_path) if known_terms_path else None,
+            cache_path=validation.openalex_cache_path if validation.openalex_cache_enabled else None,
+            cache_ttl=validation.openalex_cache_ttl,
+        )
+        self._model_name = str(self.config.llm.provider.value)
+
+        # project_id -> lowercase concept label -> ValidationResult
+        self._validation_cache: Dict[str, Dict[str, ValidationResult]] = {}
+
+        # Stage input content hash -> stage result (see _stage_cached)
+        self._stage_cache: Dict[str, tuple] = {}
+
+        # Near-duplicate raw ideas reuse the previously generated context
+        self.context_cache = None
+        if self.config.llm.cache_enabled:
+            # Identical/near-identical prompts skip the LLM round-trip
+            # (already the case when the configured provider is CACHED)
+            if not isinstance(self.provider, CachedProvider):
+                self.provider = CachedProvider(
+                    self.provider,
+                    self.config.llm.cache_dir,
+                    semantic_threshold=self.config.llm.response_semantic_threshold,
+                    max_entries=self.config.llm.cache_max_entries,
+                )
+            # Bag-of-words vectors would match "effect of A on B" with
+            # "effect of B on A", so only cache ideas with real embeddings
+            if has_semantic_embedder():
+                self.context_cache = SemanticCache(
+                    self.config.llm.cache_dir,
+                    threshold=self.config.llm.semantic_cache_threshold,
+                    name="project_context",
+                )
 
         logger.info(
             f"IntelligentModelService initialized with provider: {self.config.llm.provider}"
@@ -74,20 +269,117 @@ class IntelligentModelService(ModelService):
         """
         logger.info("Generating project context from raw idea...")
 
+        # Slice once; reused by both the LLM path and the fallback
+        short_desc = raw_idea[:500]
+
         try:
-            # Generate with LLM
-            prompt = PROMPT_STAGE0_CONTEXT.format(raw_idea=raw_idea)
-            raw_response = self.provider.generate(SYSTEM_PROMPT_METHODOLOGIST, prompt)
-            data = self.provider.clean_json_response(raw_response)
+            data = self.context_cache.lookup(raw_idea) if self.context_cache else None
+            notes = "Reused context generated for a near-identical idea"
+
+            if data is None:
+                # Generate with LLM
+                prompt = PROMPT_STAGE0_CONTEXT.format(raw_idea=raw_idea)
+                data = self._generate_json(SYSTEM_PROMPT_METHODOLOGIST, prompt)
+                notes = "Generated from raw idea using LLM"
+                if self.context_cache is not None:
+                    self.context_cache.add(raw_idea, data)
+
+            draft, meta = self._build_project_context(data, short_desc, notes)
+
+            logger.info(f"Project context generated: {draft.title}")
+            return draft, meta
+
+        except LLMProviderError as e:
+            logger.error(f"Failed to generate project context: {e}")
+            # Fallback to simple extraction
+            logger.warning("Falling back to simple extraction")
+            title_guess = raw_idea[:80].strip() or "Untitled Research Project"
+            return self._fallback_project_context(short_desc, title_guess)
+
+    def suggest_and_critique(
+        self, raw_idea: str
+    ) -> Tuple[ProjectContext, dict, ModelMetadata]:
+        """Stage 0 + Stage 1 critique in a single LLM call.
+
+        Used by non-interactive runs, where nobody edits the context between
+        stages. Pass the returned critique to ``generate_problem_framing`` to
+        skip its separate critique call. Interactive mode should keep using
+        ``suggest_project_context`` so the critique sees the approved context.
+
+        Args:
+            raw_idea: Unstructured research idea text
+
+        Returns:
+            Tuple of (ProjectContext, critique dict, ModelMetadata). The
+            critique dict is empty if the fused call failed.
+        """
+        logger.info("Generating project context and critique from raw idea...")
+
+        try:
+            prompt = PROMPT_STAGE0_AND_CRITIQUE.format(raw_idea=raw_idea)
+            data = self._generate_json(SYSTEM_PROMPT_METHODOLOGIST, prompt)
+
+            context_data = data.get("context")
+            critique_data = data.get("critique")
+            if not isinstance(context_data, dict) or not isinstance(critique_data, dict):
+                raise LLMProviderError(
+                    "Fused response missing 'context' or 'critique' object",
+                    details={"keys": list(data)}
+                )
+
+            draft, meta = self._build_project_context(
+                context_data, raw_idea[:500], "Generated with critique in a single LLM call"
+            )
+
+            logger.info(
+                f"Project context generated: {draft.title} "
+                f"(feasibility {critique_data.get('feasibility_score', '?')}/10)"
+            )
+            return draft, critique_data, meta
+
+        except LLMProviderError as e:
+            logger.error(f"Fused context+critique generation failed: {e}")
+            logger.warning("Falling back to separate context generation")
+            draft, meta = self.suggest_project_context(raw_idea)
+            return draft, {}, meta
+
+    def _build_project_context(
+        self, data: dict, short_desc: str, notes: str
+    ) -> Tuple[ProjectContext, ModelMetadata]:
+        """Create a ProjectContext from parsed Stage 0 JSON.
 
-            # Create project ID
-            project_id = f"project_{uuid.uuid4().hex[:8]}"
+        Args:
+            data: Parsed context dictionary
+            short_desc: Truncated raw idea, used if the LLM omitted a description
+            notes: Notes for the model metadata
+
+        Returns:
+            Tuple of (ProjectContext, ModelMetadata)
+        """
+        # Create project ID
+        project_id = new_project_id()
 
-            # Extract data with fallbacks
+        # Typed parse fills every default at once; malformed fields fall
+        # back to the lenient per-key extraction
+        try:
+            parsed = Stage0Response.model_validate(data)
+            draft = ProjectContext(
+                id=project_id,
+                title=parsed.title,
+                short_description=(
+                    short_desc if parsed.short_description is None else parsed.short_description
+                ),
+                discipline=parsed.discipline,
+                subfield=None,
+                application_area=None,
+                initial_keywords=parsed.initial_keywords,
+                constraints=parsed.constraints,
+            )
+        except PydanticValidationError:
             draft = ProjectContext(
                 id=project_id,
                 title=data.get("title", "Untitled Research Project"),
-                short_description=data.get("short_description", raw_idea[:500]),
+                short_description=data.get("short_description", short_desc),
                 discipline=data.get("discipline", None),
                 subfield=None,
                 application_area=None,
@@ -95,34 +387,31 @@ class IntelligentModelService(ModelService):
                 constraints=data.get("constraints", {}),
             )
 
-            # Create metadata
-            meta = ModelMetadata(
-                model_name=str(self.config.llm.provider.value),
-                mode="generation",
-                prompt_version="1.0",
-                notes="Generated from raw idea using LLM"
-            )
-
-            draft.model_metadata = meta
-
-            logger.info(f"Project context generated: {draft.title}")
-            return draft, meta
+        # Create metadata
+        meta = ModelMetadata(
+            model_name=self._model_name,
+            mode="generation",
+            prompt_version="1.0",
+            notes=notes
+        )
 
-        except Exception as e:
-            logger.error(f"Failed to generate project context: {e}")
-            # Fallback to simple extraction
-            logger.warning("Falling back to simple extraction")
-            return self._fallback_project_context(raw_idea)
+        draft.model_metadata = meta
+        return draft, meta
 
+    @_stage_cached
     def generate_problem_framing(
-        self, context: ProjectContext
+        self, context: ProjectContext, critique_data: Optional[dict] = None
     ) -> Tuple[ProblemFraming, ConceptModel, ModelMetadata]:
         """Stage 1: Generate problem framing with critique loop and validation.
 
-        Implements: Draft → Critique → Refine → Validate
+        Implements: Draft → Critique → Refine → Validate. With
+        ``config.llm.fused_framing`` (the default), critique and refine are
+        requested in a single LLM call.
 
         Args:
             context: Approved ProjectContext
+            critique_data: Critique already produced by ``suggest_and_critique``;
+                when given, the separate critique call is skipped
 
         Returns:
             Tuple of (ProblemFraming, ConceptModel, ModelMetadata)
@@ -130,70 +419,256 @@ class IntelligentModelService(ModelService):
         logger.info(f"Generating problem framing for: {context.title}")
 
         try:
-            # Step 1: Generate critique of initial context
-            critique_data = self._critique_context(context)
-            critique_text = critique_data.get("critique_summary", "")
-            feasibility_score = critique_data.get("feasibility_score", 5)
+            if not critique_data and self.config.llm.fused_framing:
+                # Steps 1+2 in one round-trip: the response carries both halves
+                critique_data = refine_data = self._generate_json(
+                    SYSTEM_PROMPT_METHODOLOGIST, self._fused_framing_prompt(context)
+                )
+            else:
+                # Step 1: Generate critique of initial context (unless pre-computed)
+                if not critique_data:
+                    critique_data = self._critique_context(context)
+
+                # Step 2: Refine based on critique (not needed for framings
+                # the critic already rates as ready)
+                if self._can_skip_refine(critique_data):
+                    refine_data = self._framing_from_context(context, critique_data)
+                else:
+                    refine_data = self._refine_framing(
+                        context, critique_data.get("critique_summary", "")
+                    )
 
-            logger.info(f"Critique complete. Feasibility score: {feasibility_score}/10")
+            return self._assemble_problem_framing(context, critique_data, refine_data)
 
-            # Step 2: Refine based on critique
-            refine_data = self._refine_framing(context, critique_text)
+        except LLMProviderError as e:
+            logger.error(f"Failed to generate problem framing: {e}")
+            logger.warning("Falling back to simple generation")
+            return self._fallback_problem_framing(context)
 
-            # Step 3: Extract concepts
-            concepts_list, concept_labels = self._extract_concepts(
-                refine_data, context.id
-            )
+    def generate_problem_framing_batch(
+        self, contexts: List[ProjectContext]
+    ) -> List[Tuple[ProblemFraming, ConceptModel, ModelMetadata]]:
+        """Stage 1 for several projects, batching LLM calls across them.
 
-            # Step 4: Validate concepts against OpenAlex
-            validation_report = self._validate_concepts(concept_labels)
+        All critiques are requested concurrently, then all refinements, so
+        the LLM latency is two round-trips instead of two per project (one
+        round-trip with ``config.llm.fused_framing``).
 
-            # Step 5: Assemble final critique report
-            final_critique = self._assemble_critique_report(
-                critique_text, feasibility_score, validation_report
-            )
+        Args:
+            contexts: Approved ProjectContexts
 
-            # Step 6: Create artifacts
-            framing = ProblemFraming(
-                project_id=context.id,
-                problem_statement=refine_data.get("problem_statement", ""),
-                research_gap=refine_data.get("research_gap", ""),
-                goals=refine_data.get("goals", []),
-                scope_in=refine_data.get("scope_in", []),
-                scope_out=refine_data.get("scope_out", []),
-                stakeholders=[],  # Not in current prompt
-                critique_report=final_critique,
-            )
+        Returns:
+            List of (ProblemFraming, ConceptModel, ModelMetadata), in input order
+        """
+        if len(contexts) <= 1:
+            return [self.generate_problem_framing(c) for c in contexts]
 
-            concept_model = ConceptModel(
-                project_id=context.id,
-                concepts=concepts_list,
-                relations=[],  # Relations generation can be added later
-            )
+        logger.info(f"Generating problem framing for {len(contexts)} projects (batched)")
 
-            # Create metadata
-            meta = ModelMetadata(
-                model_name=str(self.config.llm.provider.value),
-                mode="critique-refine-validate",
-                prompt_version="1.0",
-                notes=f"Critique loop with OpenAlex validation. "
-                      f"Validated {len(concept_labels)} concepts."
+        try:
+            if self.config.llm.fused_framing:
+                fused = [
+                    self._parse_json_object(raw)
+                    for raw in self.provider.generate_batch(
+                        SYSTEM_PROMPT_METHODOLOGIST,
+                        [self._fused_framing_prompt(c) for c in contexts],
+                        json_mode=True,
+                    )
+                ]
+                return [
+                    self._assemble_problem_framing(context, data, data)
+                    for context, data in zip(contexts, fused)
+                ]
+
+            critiques = [
+                self._parse_json_object(raw)
+                for raw in self.provider.generate_batch(
+                    SYSTEM_PROMPT_CRITIC,
+                    [self._critique_prompt(c) for c in contexts],
+                    json_mode=True,
+                )
+            ]
+            refines = [
+                self._framing_from_context(c, critique) if self._can_skip_refine(critique) else None
+                for c, critique in zip(contexts, critiques)
+            ]
+            pending = [i for i, refine in enumerate(refines) if refine is None]
+            if pending:
+                responses = self.provider.generate_batch(
+                    SYSTEM_PROMPT_METHODOLOGIST,
+                    [
+                        self._refine_prompt(
+                            contexts[i], critiques[i].get("critique_summary", "")
+                        )
+                        for i in pending
+                    ],
+                    json_mode=True,
+                )
+                for i, raw in zip(pending, responses):
+                    refines[i] = self._parse_json_object(raw)
+
+            return [
+                self._assemble_problem_framing(context, critique, refine)
+                for context, critique, refine in zip(contexts, critiques, refines)
+            ]
+        except LLMProviderError as e:
+            logger.error(f"Batched problem framing failed: {e}")
+            logger.warning("Falling back to per-project generation")
+            return [self.generate_problem_framing(c) for c in contexts]
+
+    def _assemble_problem_framing(
+        self, context: ProjectContext, critique_data: dict, refine_data: dict
+    ) -> Tuple[ProblemFraming, ConceptModel, ModelMetadata]:
+        """Extract, validate and package Stage 1 artifacts from LLM output.
+
+        Args:
+            context: ProjectContext being framed
+            critique_data: Parsed critique JSON
+            refine_data: Parsed refinement JSON
+
+        Returns:
+            Tuple of (ProblemFraming, ConceptModel, ModelMetadata)
+
+        Raises:
+            LLMProviderError: If the parsed JSON has the wrong shape
+        """
+        self._check_framing_shape(critique_data, refine_data)
+        critique_text = critique_data.get("critique_summary", "")
+        feasibility_score = critique_data.get("feasibility_score", 5)
+
+        logger.info(f"Critique complete. Feasibility score: {feasibility_score}/10")
+
+        # Step 3: Extract concepts
+        concepts_list, concept_labels = self._extract_concepts(
+            refine_data, context.id
+        )
+
+        # Step 4: Validate concepts against OpenAlex
+        validation_report = self._validate_concepts(concept_labels, context.id)
+
+        # Step 5: Assemble final critique report
+        final_critique = self._assemble_critique_report(
+            critique_text, feasibility_score, validation_report
+        )
+
+        # Step 6: Create artifacts
+        framing = ProblemFraming(
+            project_id=context.id,
+            problem_statement=refine_data.get("problem_statement", ""),
+            research_gap=refine_data.get("research_gap", ""),
+            goals=refine_data.get("goals", []),
+            scope_in=refine_data.get("scope_in", []),
+            scope_out=refine_data.get("scope_out", []),
+            stakeholders=[],  # Not in current prompt
+            critique_report=final_critique,
+        )
+
+        concept_model = ConceptModel(
+            project_id=context.id,
+            concepts=concepts_list,
+            relations=[],  # Relations generation can be added later
+        )
+
+        # Create metadata
+        meta = ModelMetadata(
+            model_name=self._model_name,
+            mode="critique-refine-validate",
+            prompt_version="1.0",
+            notes=f"Critique loop with OpenAlex validation. "
+                  f"Validated {len(concept_labels)} concepts."
+        )
+
+        framing.model_metadata = meta
+        concept_model.model_metadata = meta
+
+        logger.info(
+            f"Problem framing complete. {len(concepts_list)} concepts extracted. "
+            f"Validation: {validation_report.summary}"
+        )
+
+        return framing, concept_model, meta
+
+    def _check_framing_shape(self, critique_data: dict, refine_data: dict) -> None:
+        """Reject Stage 1 JSON that parsed but has the wrong shape.
+
+        Raising LLMProviderError keeps e.g. ``"key_concepts": null`` on the
+        fallback path instead of crashing while the artifacts are assembled.
+
+        Raises:
+            LLMProviderError: Listing every field with the wrong type
+        """
+        problems = []
+        if not isinstance(critique_data.get("critique_summary", ""), str):
+            problems.append("critique_summary must be a string")
+        issues = critique_data.get("specific_issues", [])
+        if not isinstance(issues, list) or not all(isinstance(i, str) for i in issues):
+            problems.append("specific_issues must be a list of strings")
+        if not isinstance(refine_data.get("key_concepts", []), list):
+            problems.append("key_concepts must be a list")
+
+        if problems:
+            raise LLMProviderError(
+                f"Malformed problem framing response: {'; '.join(problems)}",
+                details={"problems": problems}
             )
 
-            framing.model_metadata = meta
-            concept_model.model_metadata = meta
+    def _generate_json(self, system_prompt: str, prompt: str) -> dict:
+        """Run one LLM call and parse its response as a JSON object.
 
-            logger.info(
-                f"Problem framing complete. {len(concepts_list)} concepts extracted. "
-                f"Validation: {validation_report.summary}"
+        Args:
+            system_prompt: Persona prompt
+            prompt: Task prompt
+
+        Returns:
+            Parsed JSON object
+
+        Raises:
+            LLMProviderError: On generation failure, invalid JSON, or a
+                top-level value that is not an object
+        """
+        raw_response = self.provider.generate(system_prompt, prompt, json_mode=True)
+        try:
+            return self._parse_json_object(raw_response)
+        except LLMProviderError:
+            self._discard_response(system_prompt, prompt)
+            raise
+
+    def _discard_response(self, system_prompt: str, prompt: Optional[str]) -> None:
+        """Keep the response cache from replaying a reply we had to reject."""
+        if prompt is not None and isinstance(self.provider, CachedProvider):
+            self.provider.discard(system_prompt, prompt)
+
+    def _parse_json_object(self, raw_response: str) -> dict:
+        """Parse an LLM response that must be a JSON object.
+
+        Raises:
+            LLMProviderError: On invalid JSON or a non-object top-level value
+        """
+        data = self.provider.clean_json_response(raw_response)
+        if not isinstance(data, dict):
+            raise LLMProviderError(
+                f"Expected a JSON object from LLM, got {type(data).__name__}",
+                details={"response": raw_response[:500]}
             )
+        return data
 
-            return framing, concept_model, meta
+    def _critique_prompt(self, context: ProjectContext) -> str:
+        return PROMPT_STAGE1_CRITIQUE.format(
+            title=context.title,
+            description=context.short_description
+        )
 
-        except Exception as e:
-            logger.error(f"Failed to generate problem framing: {e}")
-            logger.warning("Falling back to simple generation")
-            return self._fallback_problem_framing(context)
+    def _fused_framing_prompt(self, context: ProjectContext) -> str:
+        return PROMPT_STAGE1_FUSED.format(
+            title=context.title,
+            description=context.short_description
+        )
+
+    def _refine_prompt(self, context: ProjectContext, critique: str) -> str:
+        return PROMPT_STAGE1_REFINE.format(
+            context_str=context.short_description,
+            critique_str=critique
+        )
 
     def _critique_context(self, context: ProjectContext) -> dict:
         """Generate critique of project context.
@@ -204,13 +679,7 @@ class IntelligentModelService(ModelService):
         Returns:
             Dictionary with critique data
         """
-        prompt = PROMPT_STAGE1_CRITIQUE.format(
-            title=context.title,
-            description=context.short_description
-        )
-
-        raw_response = self.provider.generate(SYSTEM_PROMPT_CRITIC, prompt)
-        return self.provider.clean_json_response(raw_response)
+        return self._generate_json(SYSTEM_PROMPT_CRITIC, self._critique_prompt(context))
 
     def _refine_framing(self, context: ProjectContext, critique: str) -> dict:
         """Refine problem framing based on critique.
@@ -222,13 +691,49 @@ class IntelligentModelService(ModelService):
         Returns:
             Dictionary with refined framing data
         """
-        prompt = PROMPT_STAGE1_REFINE.format(
-            context_str=context.short_description,
-            critique_str=critique
+        return self._generate_json(
+            SYSTEM_PROMPT_METHODOLOGIST, self._refine_prompt(context, critique)
         )
 
-        raw_response = self.provider.generate(SYSTEM_PROMPT_METHODOLOGIST, prompt)
-        return self.provider.clean_json_response(raw_response)
+    def _can_skip_refine(self, critique_data: dict) -> bool:
+        """Whether a critique is good enough to skip the refine call.
+
+        True when the feasibility score reaches
+        ``config.llm.skip_refine_threshold`` and the critic listed no
+        specific issues, i.e. refining would only restate the context.
+        """
+        threshold = self.config.llm.skip_refine_threshold
+        if threshold is None or critique_data.get("specific_issues"):
+            return False
+        try:
+            return int(critique_data.get("feasibility_score", 0)) >= threshold
+        except (TypeError, ValueError):
+            return False
+
+    def _framing_from_context(self, context: ProjectContext, critique_data: dict) -> dict:
+        """Build refine-shaped framing data directly from an approved context.
+
+        Used instead of ``_refine_framing`` when ``_can_skip_refine`` holds.
+
+        Args:
+            context: ProjectContext being framed
+            critique_data: Parsed critique JSON
+
+        Returns:
+            Dictionary with the same keys as a refine response
+        """
+        logger.info("Critique raised no issues; building framing from context without refine")
+        keywords = context.initial_keywords
+        return {
+            "problem_statement": context.short_description or f"Investigate {context.title}",
+            "research_gap": critique_data.get("identified_gap", ""),
+            "goals": keywords[:5] or ["Characterize the problem domain"],
+            "scope_in": [],
+            "scope_out": [],
+            "key_concepts": [
+                {"label": k, "type": "keyword", "description": k} for k in keywords
+            ],
+        }
 
     def _extract_concepts(
         self, refine_data: dict, project_id: str
@@ -246,14 +751,21 @@ class IntelligentModelService(ModelService):
         concept_labels = []
 
         for c in refine_data.get("key_concepts", []):
-            label = c.get("label", "Unknown")
+            if not isinstance(c, dict):
+                logger.warning(f"Skipping malformed concept entry: {c!r}")
+                continue
+            label = c.get("label")
+            if not isinstance(label, str) or not label.strip():
+                # Validation lowercases labels, so a null label would crash it
+                logger.warning(f"Skipping concept without a label: {c!r}")
+                continue
             concept_type = c.get("type", "Undefined")
             description = c.get("description", label)
 
             concept_labels.append(label)
 
             concepts_list.append(Concept(
-                id=str(uuid.uuid4()),
+                id=fast_id("concept"),
                 label=label,
                 description=description,
                 type=concept_type
@@ -261,11 +773,18 @@ class IntelligentModelService(ModelService):
 
         return concepts_list, concept_labels
 
-    def _validate_concepts(self, concept_labels: List[str]) -> ValidationReport:
+    def _validate_concepts(
+        self, concept_labels: List[str], project_id: Optional[str] = None
+    ) -> ValidationReport:
         """Validate concept labels against OpenAlex.
 
+        Labels already validated for the same project (case-insensitive) are
+        reused, so regenerating a framing only looks up new concepts.
+        Critical results are not cached, so failed lookups are retried.
+
         Args:
             concept_labels: List of concept label strings
+            project_id: Project the labels belong to (enables reuse)
 
         Returns:
             ValidationReport
@@ -281,8 +800,32 @@ class IntelligentModelService(ModelService):
                 summary="No concepts to validate"
             )
 
+        cached = self._validation_cache.setdefault(project_id, {}) if project_id else {}
+        fresh = [label for label in concept_labels if label.lower() not in cached]
+
         try:
-            return self.validator.validate_concept_list(concept_labels)
+            if len(fresh) == len(concept_labels):
+                report = self.validator.validate_concept_list(concept_labels)
+                fresh_results = report.results
+            else:
+                logger.info(
+                    f"Reusing {len(concept_labels) - len(fresh)} validated concepts "
+                    f"for project {project_id}"
+                )
+                fresh_results = (
+                    self.validator.validate_concept_list(fresh).results if fresh else {}
+                )
+                report = self.validator.build_report({
+                    label: fresh_results.get(label) or cached[label.lower()]
+                    for label in concept_labels
+                })
+
+            if project_id:
+                for label, result in fresh_results.items():
+                    if result.severity != "critical":
+                        cached[label.lower()] = result
+
+            return report
         except Exception as e:
             logger.error(f"Validation failed: {e}")
             # Return empty report on failure
@@ -309,61 +852,59 @@ class IntelligentModelService(ModelService):
             Complete critique report string
         """
         report_parts = [
-            "="*70,
+            _BANNER,
             "AI CRITIQUE REPORT",
-            "="*70,
+            _BANNER,
             "",
             f"Feasibility Score: {score}/10",
             "",
             "CRITIQUE:",
             critique,
             "",
-            "="*70,
+            _BANNER,
             "OPENALEX VALIDATION REPORT",
-            "="*70,
+            _BANNER,
             "",
             f"Summary: {validation_report.summary}",
             "",
             "Detailed Results:",
         ]
+        append = report_parts.append
 
         # Add individual term results
         for term, result in validation_report.results.items():
-            status_icon = {
-                "ok": "✅",
-                "warning": "⚠️",
-                "critical": "❌"
-            }.get(result.severity, "❓")
-
-            report_parts.append(
-                f"{status_icon} {term}: {result.hit_count} works found"
-            )
+            status_icon = _SEVERITY_ICONS.get(result.severity, _UNKNOWN_ICON)
+            if result.hit_count == ValidationService.KNOWN_TERM_HITS:
+                append(f"{status_icon} {term}: established term (not looked up)")
+            else:
+                append(f"{status_icon} {term}: {result.hit_count} works found")
 
             if result.suggestion:
-                report_parts.append(f"   → {result.suggestion}")
+                append(f"   → {result.suggestion}")
 
             if result.sample_works:
-                report_parts.append("   Sample works:")
-                for work in result.sample_works[:2]:
-                    report_parts.append(f"     • {work}")
+                append("   Sample works:")
+                report_parts.extend(
+                    f"     • {work}" for work in islice(result.sample_works, 2)
+                )
 
         return "\n".join(report_parts)
 
     def _fallback_project_context(
-        self, raw_idea: str
+        self, short_desc: str, title: str
     ) -> Tuple[ProjectContext, ModelMetadata]:
-        """Fallback for project context generation when LLM fails."""
-        project_id = f"project_{uuid.uuid4().hex[:8]}"
+        """Fallback for project context generation when LLM fails.
 
-        # Simple extraction
-        title = raw_idea[:80].strip()
-        if not title:
-            title = "Untitled Research Project"
+        Args:
+            short_desc: Raw idea truncated to 500 characters
+            title: Title guess (first 80 characters of the idea)
+        """
+        project_id = new_project_id()
 
         context = ProjectContext(
             id=project_id,
             title=title,
-            short_description=raw_idea[:500],
+            short_description=short_desc,
             discipline=None,
             initial_keywords=[],
             constraints={},
@@ -410,6 +951,7 @@ class IntelligentModelService(ModelService):
         return framing, concept_model, meta
 
     # Placeholder methods for later stages
+    @_stage_cached
     def generate_research_questions(
         self, framing: ProblemFraming, concepts: ConceptModel
     ) -> Tuple[ResearchQuestionSet, ModelMetadata]:
@@ -417,8 +959,8 @@ class IntelligentModelService(ModelService):
 
         Uses LLM prompt; falls back to heuristic if LLM fails.
         """
+        prompt = None
         try:
-            from .prompts import PROMPT_STAGE2_RESEARCH_QUESTIONS, format_concepts_for_prompt, format_goals_for_prompt
             concept_str = format_concepts_for_prompt(concepts.concepts)
             goals_str = format_goals_for_prompt(framing.goals)
             prompt = PROMPT_STAGE2_RESEARCH_QUESTIONS.format(
@@ -426,25 +968,23 @@ class IntelligentModelService(ModelService):
                 goals=goals_str,
                 concepts=concept_str
             )
-            raw = self.provider.generate(SYSTEM_PROMPT_METHODOLOGIST, prompt)
-            data = self.provider.clean_json_response(raw)
-            questions_payload = data.get("questions", [])
-            rq_objects: List[ResearchQuestion] = []
-            for i, q in enumerate(questions_payload):
-                rq_objects.append(
-                    ResearchQuestion(
-                        id=f"rq_{i}",
-                        text=q.get("text", "Unnamed research question"),
-                        type=q.get("type", "descriptive"),
-                        linked_concept_ids=q.get("linked_concepts", [])[:4],
-                        priority=q.get("priority", "must_have")
-                    )
+            data = self._generate_json(SYSTEM_PROMPT_METHODOLOGIST, prompt)
+            questions = _parse_items(QuestionItem, data.get("questions", []))
+            rq_objects: List[ResearchQuestion] = [
+                ResearchQuestion(
+                    id=f"rq_{i}",
+                    text=q.text,
+                    type=q.type,
+                    linked_concept_ids=q.linked_concepts[:4],
+                    priority=q.priority
                 )
+                for i, q in enumerate(questions)
+            ]
             if not rq_objects:
                 raise ValueError("LLM returned no questions")
             rq_set = ResearchQuestionSet(project_id=framing.project_id, questions=rq_objects)
             meta = ModelMetadata(
-                model_name=str(self.config.llm.provider.value),
+                model_name=self._model_name,
                 mode="generation",
                 prompt_version="2.0",
                 notes="Generated research questions via LLM"
@@ -453,34 +993,29 @@ class IntelligentModelService(ModelService):
             return rq_set, meta
         except Exception as e:
             logger.error(f"LLM research question generation failed: {e}")
+            self._discard_response(SYSTEM_PROMPT_METHODOLOGIST, prompt)
             logger.warning("Falling back to heuristic generation")
             # Fallback similar to SimpleModelService
             base_terms = [c.label for c in concepts.concepts[:5]] or ["Core Phenomenon"]
-            texts: List[str] = []
-            if framing.problem_statement:
-                texts.append(f"How does {base_terms[0]} relate to outcomes described in the problem statement?")
-            if len(base_terms) >= 2:
-                texts.append(f"What factors influence {base_terms[1]} adoption or effectiveness?")
-            if len(base_terms) >= 3:
-                texts.append(f"What mechanisms link {base_terms[2]} to observed performance or quality measures?")
-            if len(base_terms) >= 4:
-                texts.append(f"How can {base_terms[3]} be optimized to improve reliability or consistency?")
-            if len(base_terms) >= 5:
-                texts.append(f"What are the barriers and facilitators to integrating {base_terms[4]} in practice?")
-            rq_objects = []
-            for i, text in enumerate(texts):
-                rq_objects.append(
-                    ResearchQuestion(
-                        id=f"rq_{i}",
-                        text=text,
-                        type="descriptive" if i == 0 else "explanatory",
-                        linked_concept_ids=[c.id for c in concepts.concepts[: min(2, len(concepts.concepts))]],
-                        priority="must_have" if i < 3 else "nice_to_have",
-                    )
+            texts = [
+                template.format(term=term)
+                for i, (template, term) in enumerate(zip(_FALLBACK_RQ_TEMPLATES, base_terms))
+                if i or framing.problem_statement
+            ]
+            linked_ids = [c.id for c in concepts.concepts[:2]]
+            rq_objects = [
+                ResearchQuestion(
+                    id=f"rq_{i}",
+                    text=text,
+                    type="descriptive" if i == 0 else "explanatory",
+                    linked_concept_ids=list(linked_ids),
+                    priority="must_have" if i < 3 else "nice_to_have",
                 )
+                for i, text in enumerate(texts)
+            ]
             rq_set = ResearchQuestionSet(project_id=framing.project_id, questions=rq_objects)
             meta = ModelMetadata(
-                model_name=str(self.config.llm.provider.value),
+                model_name=self._model_name,
                 mode="fallback-heuristic",
                 prompt_version="fallback",
                 notes="Heuristic fallback for research questions"
@@ -488,6 +1023,7 @@ class IntelligentModelService(ModelService):
             rq_set.model_metadata = meta
             return rq_set, meta
 
+    @_stage_cached
     def expand_search_terms(
         self, concepts: ConceptModel, rqs: ResearchQuestionSet
     ) -> Tuple[SearchConceptBlocks, ModelMetadata]:
@@ -495,10 +1031,9 @@ class IntelligentModelService(ModelService):
 
         Added robust handling for deserialized dict items and detailed debug logging.
         """
+        prompt = None
         try:
             # Reconstruct ResearchQuestion objects if persistence produced dicts
-            from ..models import SearchConceptBlock, ResearchQuestion
-            import uuid
             if rqs.questions and isinstance(rqs.questions[0], dict):
                 reconstructed = []
                 for idx, q in enumerate(rqs.questions):
@@ -517,7 +1052,6 @@ class IntelligentModelService(ModelService):
                         reconstructed.append(q)
                 rqs.questions = reconstructed
 
-            from .prompts import PROMPT_STAGE3_SEARCH_EXPANSION, format_concepts_for_prompt
             concept_str = format_concepts_for_prompt(concepts.concepts)
             rq_str = "\n".join([f"- {q.text}" for q in rqs.questions[:5]])
 
@@ -527,25 +1061,19 @@ class IntelligentModelService(ModelService):
             )
             logger.debug("Stage3 search expansion prompt:\n%s", prompt)
 
-            raw = self.provider.generate(SYSTEM_PROMPT_LIBRARIAN, prompt)
-            logger.debug("Stage3 raw LLM response: %s", raw)
+            data = self._generate_json(SYSTEM_PROMPT_LIBRARIAN, prompt)
+            logger.debug("Stage3 parsed LLM response: %s", data)
 
-            data = self.provider.clean_json_response(raw)
-
-            blocks_data = data.get("blocks", [])
-            blocks_list: List[SearchConceptBlock] = []
-
-            for b in blocks_data:
-                if not isinstance(b, dict):
-                    continue
-                block = SearchConceptBlock(
-                    id=str(uuid.uuid4()),
-                    label=b.get("label", "Unnamed Block"),
-                    description=b.get("description"),
-                    terms_included=b.get("terms_included", []),
-                    terms_excluded=b.get("terms_excluded", [])
+            blocks_list: List[SearchConceptBlock] = [
+                SearchConceptBlock(
+                    id=fast_id("block"),
+                    label=b.label,
+                    description=b.description,
+                    terms_included=b.terms_included,
+                    terms_excluded=b.terms_excluded
                 )
-                blocks_list.append(block)
+                for b in _parse_items(BlockItem, data.get("blocks", []))
+            ]
 
             if not blocks_list:
                 raise ValueError("LLM returned no blocks or malformed JSON")
@@ -556,7 +1084,7 @@ class IntelligentModelService(ModelService):
             )
 
             meta = ModelMetadata(
-                model_name=str(self.config.llm.provider.value),
+                model_name=self._model_name,
                 mode="generation",
                 prompt_version="3.0",
                 notes="Generated search concept blocks via LLM"
@@ -566,28 +1094,19 @@ class IntelligentModelService(ModelService):
 
         except Exception as e:
             logger.error(f"LLM search expansion failed: {e}")
+            self._discard_response(SYSTEM_PROMPT_LIBRARIAN, prompt)
             logger.debug("Stage3 fallback triggered. Concepts=%d RQs=%d", len(concepts.concepts), len(rqs.questions))
             # Fallback: simple expansion
-            from ..models import SearchConceptBlock
-            import uuid
-
-            blocks_list = []
-            for concept in concepts.concepts[:6]:
-                label = concept.label
-                terms = [label, label.lower()]
-                if not label.endswith('s'):
-                    terms.append(label + 's')
-                if ' ' in label:
-                    terms.append(label.replace(' ', '-'))
-
-                block = SearchConceptBlock(
-                    id=str(uuid.uuid4()),
-                    label=label,
+            blocks_list = [
+                SearchConceptBlock(
+                    id=fast_id("block"),
+                    label=concept.label,
                     description=concept.description,
-                    terms_included=sorted(set(terms)),
+                    terms_included=_fallback_term_variants(concept.label),
                     terms_excluded=[]
                 )
-                blocks_list.append(block)
+                for concept in concepts.concepts[:6]
+            ]
 
             search_blocks = SearchConceptBlocks(
                 project_id=concepts.project_id,
@@ -595,7 +1114,7 @@ class IntelligentModelService(ModelService):
             )
 
             meta = ModelMetadata(
-                model_name=str(self.config.llm.provider.value),
+                model_name=self._model_name,
                 mode="fallback-heuristic",
                 prompt_version="fallback",
                 notes=f"Heuristic fallback for search expansion (reason: {str(e)})"
@@ -603,6 +1122,7 @@ class IntelligentModelService(ModelService):
             search_blocks.model_metadata = meta
             return search_blocks, meta
 
+    @_stage_cached
     def build_database_queries(
         self, blocks: SearchConceptBlocks, db_names: List[str]
     ) -> Tuple[DatabaseQueryPlan, ModelMetadata]:
@@ -613,11 +1133,8 @@ class IntelligentModelService(ModelService):
         2. Validate using Anti-Hallucination syntax engine
         3. Fallback to syntax engine if LLM fails or produces invalid syntax
         """
+        prompt = None
         try:
-            from .prompts import PROMPT_STAGE4_QUERY_GENERATION
-            from ..models import DatabaseQuery, DatabaseQueryPlan
-            import uuid
-
             # Format blocks for prompt
             blocks_str = self._format_blocks_for_query_gen(blocks.blocks)
 
@@ -628,13 +1145,11 @@ class IntelligentModelService(ModelService):
 
             logger.debug("Stage4 query generation prompt:\n%s", prompt)
 
-            raw = self.provider.generate(SYSTEM_PROMPT_LIBRARIAN, prompt)
-            logger.debug("Stage4 raw LLM response: %s", raw[:500])
-
-            data = self.provider.clean_json_response(raw)
+            data = self._generate_json(SYSTEM_PROMPT_LIBRARIAN, prompt)
 
             # Parse queries
             queries = []
+            syntax_plan = None  # built on first invalid query, shared by the rest
             for q_data in data.get("queries", []):
                 # Validate query syntax using Anti-Hallucination layer
                 query_str = q_data.get("query", "")
@@ -646,13 +1161,15 @@ class IntelligentModelService(ModelService):
                 if validation_errors:
                     logger.warning(f"LLM generated invalid syntax for {db_name}: {validation_errors}")
                     # Fallback to syntax engine for this database
-                    query_str = self._generate_with_syntax_engine(blocks, db_name)
+                    if syntax_plan is None:
+                        syntax_plan = self._build_syntax_plan(blocks)
+                    query_str = self._generate_with_syntax_engine(blocks, db_name, syntax_plan)
                     notes = f"LLM syntax invalid, used engine. Original errors: {', '.join(validation_errors)}"
                 else:
                     notes = q_data.get("notes", "Generated by LLM")
 
                 queries.append(DatabaseQuery(
-                    id=f"query_{db_name}_{uuid.uuid4().hex[:6]}",
+                    id=fast_id(f"query_{db_name}"),
                     database_name=db_name,
                     query_blocks=q_data.get("blocks_used", [b.id for b in blocks.blocks]),
                     boolean_query_string=query_str,
@@ -664,7 +1181,7 @@ class IntelligentModelService(ModelService):
 
             plan = DatabaseQueryPlan(project_id=blocks.project_id, queries=queries)
             meta = ModelMetadata(
-                model_name=str(self.config.llm.provider.value),
+                model_name=self._model_name,
                 mode="generation-with-validation",
                 prompt_version="4.0",
                 notes="LLM generation with Anti-Hallucination validation"
@@ -674,6 +1191,7 @@ class IntelligentModelService(ModelService):
 
         except Exception as e:
             logger.error(f"LLM query generation failed: {e}")
+            self._discard_response(SYSTEM_PROMPT_LIBRARIAN, prompt)
             logger.warning("Falling back to Anti-Hallucination syntax engine")
             return self._fallback_query_generation(blocks, db_names)
 
@@ -716,32 +1234,27 @@ class IntelligentModelService(ModelService):
 
         Returns list of validation errors (empty if valid).
         """
-        errors = []
-
         # Check for hallucinated operators that ChatGPT often generates
-        hallucinated_operators = ["NEAR", "ADJ", "PROX", "W/", "WITHIN"]
-        for op in hallucinated_operators:
-            if op in query.upper():
-                errors.append(f"Invalid operator '{op}' (not supported in {database})")
+        found = dict.fromkeys(
+            m.group(0).upper() for m in _HALLUCINATED_OPERATORS_RE.finditer(query)
+        )
+        errors = [
+            f"Invalid operator '{op}' (not supported in {database})" for op in found
+        ]
 
         # Database-specific validation
-        if database == "pubmed":
-            # Check for common PubMed mistakes
-            if "[mesh]" in query.lower() and not ("[mesh terms]" in query.lower() or "[mesh]" in query):
-                errors.append("PubMed MeSH tag should be [MeSH Terms] not [mesh]")
-
-        elif database == "scopus":
-            # Scopus should use TITLE-ABS-KEY wrapper
-            if "TITLE-ABS-KEY" not in query:
-                errors.append("Scopus queries should use TITLE-ABS-KEY() wrapper")
+        validator = _DB_QUERY_VALIDATORS.get(database)
+        if validator is not None:
+            errors.extend(validator(query))
 
         return errors
 
-    def _generate_with_syntax_engine(self, blocks: SearchConceptBlocks, db_name: str) -> str:
-        """Generate query using Anti-Hallucination syntax engine."""
-        from ..search.models import QueryPlan as SyntaxQueryPlan, ConceptBlock as SyntaxConceptBlock, FieldTag
-        from ..search.builder import get_builder
+    def _build_syntax_plan(self, blocks: SearchConceptBlocks):
+        """Convert SearchConceptBlocks to the syntax engine's QueryPlan.
 
+        The plan is database-independent, so callers build it once and
+        reuse it for every database.
+        """
         syntax_plan = SyntaxQueryPlan()
         for block in blocks.blocks:
             syntax_block = SyntaxConceptBlock(label=block.label)
@@ -751,6 +1264,21 @@ class IntelligentModelService(ModelService):
                 syntax_block.add_excluded_term(ex_term, FieldTag.KEYWORD)
             syntax_plan.blocks.append(syntax_block)
 
+        return syntax_plan
+
+    def _generate_with_syntax_engine(
+        self, blocks: SearchConceptBlocks, db_name: str, syntax_plan=None
+    ) -> str:
+        """Generate query using Anti-Hallucination syntax engine.
+
+        Args:
+            blocks: Search concept blocks
+            db_name: Target database
+            syntax_plan: Pre-built plan from ``_build_syntax_plan`` (optional)
+        """
+        if syntax_plan is None:
+            syntax_plan = self._build_syntax_plan(blocks)
+
         builder = get_builder(db_name)
         return builder.build(syntax_plan)
 
@@ -758,49 +1286,36 @@ class IntelligentModelService(ModelService):
         self, blocks: SearchConceptBlocks, db_names: List[str]
     ) -> Tuple[DatabaseQueryPlan, ModelMetadata]:
         """Fallback using Anti-Hallucination syntax engine."""
-        from ..models import DatabaseQuery, DatabaseQueryPlan
-        from ..search.models import QueryPlan as SyntaxQueryPlan, ConceptBlock as SyntaxConceptBlock, FieldTag
-        from ..search.builder import get_builder
-        import uuid
+        # Convert to syntax engine format once; builders only read the plan
+        syntax_plan = self._build_syntax_plan(blocks)
+        block_ids = [b.id for b in blocks.blocks]
 
-        queries = []
-
-        # Convert to syntax engine format
-        syntax_plan = SyntaxQueryPlan()
-        for block in blocks.blocks:
-            syntax_block = SyntaxConceptBlock(label=block.label)
-            for term in block.terms_included:
-                syntax_block.add_term(term, FieldTag.KEYWORD)
-            for ex_term in block.terms_excluded:
-                syntax_block.add_excluded_term(ex_term, FieldTag.KEYWORD)
-            syntax_plan.blocks.append(syntax_block)
-
-        # Generate for each database
-        for db_name in db_names:
+        def build_one(db_name: str) -> DatabaseQuery:
             try:
-                builder = get_builder(db_name.lower())
-                query_string = builder.build(syntax_plan)
-
-                queries.append(DatabaseQuery(
-                    id=f"query_{db_name}_{uuid.uuid4().hex[:6]}",
-                    database_name=db_name.lower(),
-                    query_blocks=[b.id for b in blocks.blocks],
-                    boolean_query_string=query_string,
-                    notes="Generated by Anti-Hallucination syntax engine (fallback)"
-                ))
+                query_string = get_builder(db_name.lower()).build(syntax_plan)
+                notes = "Generated by Anti-Hallucination syntax engine (fallback)"
             except ValueError:
                 # Database not supported
-                queries.append(DatabaseQuery(
-                    id=f"query_{db_name}_{uuid.uuid4().hex[:6]}",
-                    database_name=db_name.lower(),
-                    query_blocks=[b.id for b in blocks.blocks],
-                    boolean_query_string=f"# Unsupported database: {db_name}",
-                    notes=f"Database {db_name} not supported by syntax engine"
-                ))
+                query_string = f"# Unsupported database: {db_name}"
+                notes = f"Database {db_name} not supported by syntax engine"
+            return DatabaseQuery(
+                id=fast_id(f"query_{db_name}"),
+                database_name=db_name.lower(),
+                query_blocks=list(block_ids),
+                boolean_query_string=query_string,
+                notes=notes
+            )
+
+        # Builders are independent; map() keeps results in db_names order
+        if len(db_names) > 1:
+            with ThreadPoolExecutor(max_workers=min(len(db_names), _QUERY_BUILD_WORKERS)) as executor:
+                queries = list(executor.map(build_one, db_names))
+        else:
+            queries = [build_one(db_name) for db_name in db_names]
 
         plan = DatabaseQueryPlan(project_id=blocks.project_id, queries=queries)
         meta = ModelMetadata(
-            model_name=str(self.config.llm.provider.value),
+            model_name=self._model_name,
             mode="fallback-syntax-engine",
             prompt_version="fallback",
             notes="Anti-Hallucination syntax engine (LLM unavailable)"
@@ -4,11 +4,16 @@ This module provides a unified interface for interacting with different LLM prov
 (OpenAI, Mock, Cached) with error handling, retries, and JSON parsing.
 """
 
+import atexit
+import hashlib
 import json
-import re
 import logging
+import re
+import threading
 from abc import ABC, abstractmethod
-from typing import Dict, Any, Optional
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Dict, Any, List, Optional
 
 # Expose a module-level OpenAI symbol for tests to patch
 try:
@@ -17,22 +22,87 @@ except Exception:
     _ModuleOpenAI = None  # tests can patch this symbol
 OpenAI = _ModuleOpenAI
 
+try:
+    import orjson
+except ImportError:  # optional speed-up; stdlib json is used otherwise
+    orjson = None
+
+try:
+    import httpx
+except ImportError:  # httpx ships with openai; keep it optional for Mock-only installs
+    httpx = None
+
 from src.config import get_config, LLMProvider as ProviderEnum
 from src.utils.exceptions import LLMProviderError, RateLimitError, AuthenticationError
 
 logger = logging.getLogger(__name__)
 
+# Process-wide HTTP client shared by LLM providers and OpenAlex validation (lazily created)
+_http_client = None
+_http_client_lock = threading.Lock()
+
+# (config, provider) built by get_llm_provider for the current config object
+_provider_cache = None
+
+
+def get_http_client():
+    """Return the shared, connection-pooled HTTP client for outbound requests.
+
+    Used by the LLM providers and by ``ValidationService`` for OpenAlex
+    lookups. The client keeps connections alive between calls so only the
+    first request to each host pays the TCP/TLS handshake. HTTP/2 is enabled when the
+    optional ``h2`` package is installed (``pip install httpx[http2]``).
+    The pool is closed automatically at interpreter exit.
+
+    Returns:
+        ``httpx.Client`` instance, or None if httpx is not installed
+    """
+    global _http_client
+
+    if httpx is None:
+        return None
+
+    with _http_client_lock:
+        if _http_client is None:
+            try:
+                import h2  # noqa: F401
+                http2 = True
+            except ImportError:
+                http2 = False
+
+            _http_client = httpx.Client(
+                http2=http2,
+                limits=httpx.Limits(max_keepalive_connections=32, max_connections=64),
+                timeout=httpx.Timeout(60.0, connect=10.0),
+            )
+            atexit.register(_http_client.close)
+            logger.debug(f"Created shared LLM HTTP client (http2={http2})")
+
+    return _http_client
+
+
+@lru_cache(maxsize=32)
+def _prompt_cache_key(system_prompt: str) -> str:
+    """Stable routing key for OpenAI's automatic prompt-prefix cache.
+
+    Requests sharing a key are routed to the same cache shard, so calls that
+    reuse a persona (system) prompt hit the cached prefix more often.
+    """
+    return "sp-" + hashlib.sha256(system_prompt.encode("utf-8")).hexdigest()[:16]
+
 
 class LLMProvider(ABC):
     """Abstract base class for LLM providers."""
 
     @abstractmethod
-    def generate(self, system_prompt: str, user_prompt: str) -> str:
+    def generate(self, system_prompt: str, user_prompt: str, json_mode: bool = False) -> str:
         """Generate text from prompts.
 
         Args:
             system_prompt: System message defining the AI's role/persona
             user_prompt: User message with the actual task
+            json_mode: Ask the backend to emit a bare JSON object (no fences
+                or preamble) where supported. The prompts must mention JSON.
 
         Returns:
             Generated text response
@@ -44,6 +114,37 @@ class LLMProvider(ABC):
         """
         pass
 
+    BATCH_MAX_WORKERS = 8  # Concurrent requests issued by generate_batch
+
+    def generate_batch(
+        self, system_prompt: str, user_prompts: List[str], json_mode: bool = False
+    ) -> List[str]:
+        """Generate responses for several independent prompts concurrently.
+
+        Requests run on a bounded thread pool (they are network-bound and
+        share the pooled HTTP client), so N prompts cost roughly one
+        round-trip of wall-clock time instead of N.
+
+        Args:
+            system_prompt: System message shared by every request
+            user_prompts: Independent user messages
+            json_mode: Passed through to ``generate``
+
+        Returns:
+            Responses in the same order as ``user_prompts``
+
+        Raises:
+            LLMProviderError: If any request fails
+        """
+        if len(user_prompts) <= 1:
+            return [self.generate(system_prompt, p, json_mode) for p in user_prompts]
+
+        workers = min(self.BATCH_MAX_WORKERS, len(user_prompts))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(
+                lambda prompt: self.generate(system_prompt, prompt, json_mode), user_prompts
+            ))
+
     def clean_json_response(self, response: str) -> Dict[str, Any]:
         """Extract and parse JSON from LLM response.
 
@@ -59,21 +160,57 @@ class LLMProvider(ABC):
         Raises:
             LLMProviderError: If JSON parsing fails
         """
-        # Strip markdown fencing
-        clean_str = re.sub(r"```json\s*", "", response, flags=re.IGNORECASE)
-        clean_str = re.sub(r"```\s*$", "", clean_str)
-        clean_str = clean_str.strip()
+        clean_str = _strip_code_fence(response)
 
         try:
+            if orjson is not None:
+                return orjson.loads(clean_str)
             return json.loads(clean_str)
-        except json.JSONDecodeError as e:
-            logger.error(f"Failed to parse JSON: {clean_str}")
+        except ValueError as e:  # json.JSONDecodeError / orjson.JSONDecodeError
+            snippet = response[:500]  # Truncate for logging and error details
+            # %-style args: nothing is formatted unless a handler emits the record
+            logger.error("Failed to parse JSON (len=%d): %s", len(clean_str), snippet)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Full unparseable LLM response: %s", clean_str)
             raise LLMProviderError(
                 f"Invalid JSON from LLM: {str(e)}",
-                details={"response": response[:500]}  # Truncate for logging
+                details={"response": snippet}
             )
 
 
+def _strip_code_fence(text: str) -> str:
+    """Return the body of the first markdown code block, or the stripped text.
+
+    Handles ```` ```json ```` / ```` ``` ```` fences (with or without leading
+    prose) using plain string partitioning rather than regex passes. Text
+    that already starts like JSON is returned without searching for a fence,
+    which also keeps backticks inside JSON string values intact.
+    """
+    text = text.strip()
+    if text.startswith(("{", "[")):
+        return text
+
+    _, fence, rest = text.partition("```")
+    if not fence:
+        return text
+
+    # Drop the "json" language tag on the opening fence, in any case
+    if rest[:4].lower() == "json":
+        rest = rest[4:]
+
+    return rest.partition("```")[0].strip()
+
+
+def _retry_after(error: Exception, default: float = 20.0) -> float:
+    """Read the server's Retry-After delay (seconds) from an API error."""
+    response = getattr(error, "response", None)
+    headers = getattr(response, "headers", None) or {}
+    try:
+        return float(headers.get("retry-after", default))
+    except (TypeError, ValueError):  # HTTP-date form or garbage
+        return default
+
+
 class OpenAIProvider(LLMProvider):
     """OpenAI API implementation."""
 
@@ -103,25 +240,41 @@ class OpenAIProvider(LLMProvider):
                 "OpenAI package not installed. Run: pip install openai"
             )
 
+        # Reuse the pooled HTTP client so connections survive across calls.
+        # The SDK retries 429/5xx, connection errors and timeouts itself, with
+        # jittered exponential backoff that honours Retry-After headers.
+        client_kwargs: Dict[str, Any] = {
+            "api_key": api_key,
+            "max_retries": config.llm.max_retries,
+            "timeout": config.llm.timeout,
+        }
+        http_client = get_http_client()
+        if http_client is not None:
+            client_kwargs["http_client"] = http_client
+
         # Support OpenRouter and other OpenAI-compatible APIs
         base_url = getattr(config.llm, 'openai_base_url', None)
         if base_url:
             logger.info(f"Using custom base URL: {base_url}")
-            self.client = OpenAIClient(api_key=api_key, base_url=base_url)
-        else:
-            self.client = OpenAIClient(api_key=api_key)
+            client_kwargs["base_url"] = base_url
+
+        # prompt_cache_key is an OpenAI extension; compatible APIs may reject it
+        self.use_prompt_cache_key = not base_url
+
+        self.client = OpenAIClient(**client_kwargs)
 
         self.model = config.llm.openai_model
         self.temperature = config.llm.openai_temperature
         self.max_tokens = config.llm.openai_max_tokens
         self.timeout = config.llm.timeout
 
-    def generate(self, system_prompt: str, user_prompt: str) -> str:
+    def generate(self, system_prompt: str, user_prompt: str, json_mode: bool = False) -> str:
         """Generate text using OpenAI API.
 
         Args:
             system_prompt: System message
             user_prompt: User message
+            json_mode: Request ``response_format={"type": "json_object"}``
 
         Returns:
             Generated text
@@ -131,6 +284,14 @@ class OpenAIProvider(LLMProvider):
             AuthenticationError: On auth failure
             LLMProviderError: On other errors
         """
+        # Static persona text goes first so its tokens form a reusable cached prefix
+        request_kwargs: Dict[str, Any] = {}
+        if self.use_prompt_cache_key:
+            request_kwargs["prompt_cache_key"] = _prompt_cache_key(system_prompt)
+        if json_mode:
+            # Guarantees parseable JSON, so clean_json_response takes its fast path
+            request_kwargs["response_format"] = {"type": "json_object"}
+
         try:
             response = self.client.chat.completions.create(
                 model=self.model,
@@ -140,15 +301,17 @@ class OpenAIProvider(LLMProvider):
                 ],
                 temperature=self.temperature,
                 max_tokens=self.max_tokens,
-                timeout=self.timeout
+                timeout=self.timeout,
+                **request_kwargs
             )
             return response.choices[0].message.content or ""
 
         except self.openai_module.RateLimitError as e:
+            # Only reached once the SDK's own retries are exhausted
             logger.warning(f"OpenAI rate limit exceeded: {e}")
             raise RateLimitError(
                 "OpenAI rate limit exceeded",
-                retry_after=20,
+                retry_after=_retry_after(e),
                 details={"error": str(e)}
             )
         except self.openai_module.AuthenticationError as e:
@@ -165,6 +328,152 @@ class OpenAIProvider(LLMProvider):
             )
 
 
+# Canned payloads shared by the split and fused Stage 0/1 mock responses
+_MOCK_PROJECT_CONTEXT = {
+    "title": "Mock Project: AI in Healthcare Decision Support",
+    "discipline": "Health Informatics",
+    "short_description": "A systematic investigation of large language model hallucinations in clinical decision support systems and their impact on patient safety.",
+    "initial_keywords": ["LLM", "Hallucination", "Clinical Decision Support", "Patient Safety", "Medical AI"],
+    "constraints": {"time": "6 months", "budget": "limited", "access": "public datasets only"}
+}
+
+_MOCK_CRITIQUE = {
+    "critique_summary": "The scope is too broad. 'AI in healthcare' encompasses thousands of applications. Narrow to specific AI type (e.g., LLMs, not all AI) and specific healthcare domain (e.g., clinical notes, not all medical data). Define 'hallucination' operationally - are we measuring factual errors, citation accuracy, or diagnostic mistakes?",
+    "feasibility_score": 6,
+    "specific_issues": [
+        "Vague term: 'AI' should specify 'Large Language Models'",
+        "Unclear outcome: Define measurable hallucination metrics",
+        "Missing comparator: Against what baseline?",
+        "Scope creep: 'Healthcare' is too broad - pick one subdomain"
+    ]
+}
+
+_MOCK_REFINED_FRAMING = {
+    "problem_statement": "Healthcare systems lack validated methods to detect and quantify hallucinations in Large Language Model outputs used for clinical decision support, creating potential patient safety risks.",
+    "research_gap": "No standardized metrics exist for measuring LLM factuality in clinical contexts, and current evaluation methods from NLP don't account for medical domain knowledge requirements.",
+    "goals": [
+        "Define operational metrics for detecting LLM hallucinations in clinical notes",
+        "Benchmark hallucination rates across GPT-4, Claude, and Llama-2 on clinical tasks",
+        "Propose a validation framework for medical AI systems"
+    ],
+    "scope_in": [
+        "Clinical notes and summaries",
+        "Commercial LLMs (GPT-4, Claude, Llama-2)",
+        "English language medical text",
+        "Factual accuracy as primary outcome"
+    ],
+    "scope_out": [
+        "Medical imaging or diagnostic AI",
+        "Patient-facing chatbots",
+        "Non-English languages",
+        "Predictive models or risk scores"
+    ],
+    "key_concepts": [
+        {"label": "Large Language Models", "type": "Intervention", "description": "GPT-4, Claude, Llama-2"},
+        {"label": "Clinical Notes", "type": "Population", "description": "Patient medical records and clinical documentation"},
+        {"label": "Hallucination Detection", "type": "Outcome", "description": "Factual errors in AI-generated text"},
+        {"label": "Patient Safety", "type": "Outcome", "description": "Risk of harm from incorrect information"},
+        {"label": "Validation Framework", "type": "Methodology", "description": "Systematic evaluation approach"}
+    ]
+}
+
+
+# Static mock responses, serialized once at import
+_MOCK_PROJECT_CONTEXT_JSON = json.dumps(_MOCK_PROJECT_CONTEXT)
+_MOCK_CRITIQUE_JSON = json.dumps(_MOCK_CRITIQUE)
+_MOCK_REFINED_FRAMING_JSON = json.dumps(_MOCK_REFINED_FRAMING)
+_MOCK_FUSED_FRAMING_JSON = json.dumps({**_MOCK_CRITIQUE, **_MOCK_REFINED_FRAMING})
+_MOCK_CONTEXT_AND_CRITIQUE_JSON = json.dumps(
+    {"context": _MOCK_PROJECT_CONTEXT, "critique": _MOCK_CRITIQUE}
+)
+_MOCK_DEFAULT_JSON = json.dumps({
+    "message": "Mock response - provider is in test mode",
+    "note": "Configure LLM__PROVIDER=openai for real AI"
+})
+
+# Task markers for MockProvider, scanned in a single pass over
+# "<system> <user>". The whole alternation sits in a lookahead, so matches
+# may overlap and every marker is seen wherever it occurs, exactly like the
+# substring checks it replaces. Markers that only count in one of the two
+# prompts get their own group and are filtered by position.
+_MOCK_DISPATCH_RE = re.compile(
+    r"(?=(?P<fused_framing>critique and refine)"
+    r"|(?P<context_and_critique>context and critique)"
+    r"|(?P<context>project context)"
+    r"|(?P<raw_idea>raw idea)"
+    r"|(?P<refine>refine|problem framing)"
+    r"|(?P<based_on_critique>based on critique)"
+    r"|(?P<critique>critique)"
+    r"|(?P<supervisor>supervisor)"
+    r"|(?P<strategy>search strategy|academic database)"
+    r"|(?P<synthesis_json>respond only in json)"
+    r"|(?P<synthesis>synthesis)"
+    r"|(?P<synthesis_bullets>bullets))",
+    re.IGNORECASE,
+)
+_MOCK_USER_ONLY_MARKERS = frozenset({"raw_idea", "based_on_critique"})
+_MOCK_SYSTEM_ONLY_MARKERS = frozenset({"supervisor"})
+_MOCK_SYNTHESIS_MARKERS = frozenset({"synthesis_json", "synthesis", "synthesis_bullets"})
+
+# Search strategies returned for orchestrator prompts, by topic
+_MOCK_STRATEGY_HALLUCINATION_JSON = json.dumps({
+    "databases": ["openalex", "arxiv"],
+    "queries": [
+        "LLM hallucination detection",
+        "large language model factuality",
+        "reducing hallucinations in language models"
+    ],
+    "reasoning": "Using arXiv for recent AI/ML papers on hallucinations and OpenAlex for broader academic coverage including evaluation methods and benchmarks."
+})
+
+_MOCK_STRATEGY_PROMPTING_JSON = json.dumps({
+    "databases": ["openalex", "arxiv", "semanticscholar"],
+    "queries": [
+        "prompt engineering techniques",
+        "few-shot prompting",
+        "chain-of-thought reasoning"
+    ],
+    "reasoning": "Using arXiv for cutting-edge techniques, OpenAlex for comprehensive coverage, and Semantic Scholar for citation-weighted results."
+})
+
+_MOCK_STRATEGY_RAG_JSON = json.dumps({
+    "databases": ["openalex", "arxiv"],
+    "queries": [
+        "retrieval augmented generation",
+        "RAG systems",
+        "knowledge retrieval for LLMs"
+    ],
+    "reasoning": "Focusing on arXiv for recent RAG papers and OpenAlex for broader retrieval literature."
+})
+
+_MOCK_SYNTHESIS_JSON = json.dumps({
+    "synthesis": "Recent work on LLM hallucination detection spans heuristic validation, retrieval-augmented grounding, and self-consistency approaches. Clusters indicate convergence toward multi-stage pipelines combining uncertainty estimation and external knowledge bases. While detection precision improves, recall of subtle factual errors remains challenging. Emerging trends emphasize lightweight runtime guards and hybrid semantic-symbolic validation. Overall, the literature crystallizes around scalable guardrails but lacks standardized benchmarks across clinical and high-stakes domains.",
+    "bullets": [
+        "Multi-stage pipelines combining retrieval and self-checking dominate approaches.",
+        "Uncertainty estimation often correlates with hallucination likelihood but is noisy.",
+        "Knowledge-grounding reduces blatant fabrication but not subtle misattribution.",
+        "Self-consistency voting improves reliability for reasoning tasks.",
+        "Hybrid symbolic-semantic validation frameworks are emerging.",
+        "Benchmark fragmentation limits reproducibility of reported gains."
+    ],
+    "methods": [
+        "Retrieval augmented validation",
+        "Self-consistency ensemble checks",
+        "Uncertainty scoring + threshold gating"
+    ],
+    "trends": [
+        "Shift toward lighter, real-time validation layers",
+        "Integration of external structured knowledge bases",
+        "Growing interest in adaptive guardrails and policy tuning"
+    ],
+    "gaps": [
+        "Lack of domain-specific hallucination benchmarks",
+        "Limited validation for non-English and multimodal inputs",
+        "Weak handling of subtle factual drift over long generations"
+    ]
+})
+
+
 class MockProvider(LLMProvider):
     """Mock implementation for testing and offline development.
 
@@ -175,106 +484,58 @@ class MockProvider(LLMProvider):
     - CI/CD pipelines
     """
 
-    def generate(self, system_prompt: str, user_prompt: str) -> str:
+    def generate(self, system_prompt: str, user_prompt: str, json_mode: bool = False) -> str:
         """Generate mock response based on prompt content.
 
         Args:
             system_prompt: System message (used for context)
             user_prompt: User message (analyzed for keywords)
+            json_mode: Ignored; mock responses are already bare JSON
 
         Returns:
             Mock JSON response appropriate to the task
         """
-        # Detect task type from prompts
-        combined = (system_prompt + " " + user_prompt).lower()
+        # Detect task type with one case-insensitive scan of both prompts
+        boundary = len(system_prompt)  # the joining space
+        found = set()
+        for m in _MOCK_DISPATCH_RE.finditer(f"{system_prompt} {user_prompt}"):
+            marker = m.lastgroup
+            if marker in _MOCK_USER_ONLY_MARKERS and m.start(marker) <= boundary:
+                continue
+            if marker in _MOCK_SYSTEM_ONLY_MARKERS and m.end(marker) > boundary:
+                continue
+            found.add(marker)
+
+        # Fused Stage 1 critique + refine (check before either half)
+        if "fused_framing" in found:
+            return _MOCK_FUSED_FRAMING_JSON
+
+        # Fused Stage 0 + Stage 1 critique (check before either half)
+        elif "context_and_critique" in found:
+            return _MOCK_CONTEXT_AND_CRITIQUE_JSON
 
         # Stage 0: Project Context generation
-        if "project context" in combined or "raw idea" in user_prompt.lower():
-            return json.dumps({
-                "title": "Mock Project: AI in Healthcare Decision Support",
-                "discipline": "Health Informatics",
-                "short_description": "A systematic investigation of large language model hallucinations in clinical decision support systems and their impact on patient safety.",
-                "initial_keywords": ["LLM", "Hallucination", "Clinical Decision Support", "Patient Safety", "Medical AI"],
-                "constraints": {"time": "6 months", "budget": "limited", "access": "public datasets only"}
-            })
+        elif "context" in found or "raw_idea" in found:
+            return _MOCK_PROJECT_CONTEXT_JSON
 
         # Stage 1: Refine/Problem Framing (check before critique since refine prompts may mention critique)
-        elif "refine" in combined or "problem framing" in combined or "based on critique" in user_prompt.lower():
-            return json.dumps({
-                "problem_statement": "Healthcare systems lack validated methods to detect and quantify hallucinations in Large Language Model outputs used for clinical decision support, creating potential patient safety risks.",
-                "research_gap": "No standardized metrics exist for measuring LLM factuality in clinical contexts, and current evaluation methods from NLP don't account for medical domain knowledge requirements.",
-                "goals": [
-                    "Define operational metrics for detecting LLM hallucinations in clinical notes",
-                    "Benchmark hallucination rates across GPT-4, Claude, and Llama-2 on clinical tasks",
-                    "Propose a validation framework for medical AI systems"
-                ],
-                "scope_in": [
-                    "Clinical notes and summaries",
-                    "Commercial LLMs (GPT-4, Claude, Llama-2)",
-                    "English language medical text",
-                    "Factual accuracy as primary outcome"
-                ],
-                "scope_out": [
-                    "Medical imaging or diagnostic AI",
-                    "Patient-facing chatbots",
-                    "Non-English languages",
-                    "Predictive models or risk scores"
-                ],
-                "key_concepts": [
-                    {"label": "Large Language Models", "type": "Intervention", "description": "GPT-4, Claude, Llama-2"},
-                    {"label": "Clinical Notes", "type": "Population", "description": "Patient medical records and clinical documentation"},
-                    {"label": "Hallucination Detection", "type": "Outcome", "description": "Factual errors in AI-generated text"},
-                    {"label": "Patient Safety", "type": "Outcome", "description": "Risk of harm from incorrect information"},
-                    {"label": "Validation Framework", "type": "Methodology", "description": "Systematic evaluation approach"}
-                ]
-            })
+        elif "refine" in found or "based_on_critique" in found:
+            return _MOCK_REFINED_FRAMING_JSON
 
         # Stage 1: Critique (after refine check)
-        elif "critique" in combined or "supervisor" in system_prompt.lower():
-            return json.dumps({
-                "critique_summary": "The scope is too broad. 'AI in healthcare' encompasses thousands of applications. Narrow to specific AI type (e.g., LLMs, not all AI) and specific healthcare domain (e.g., clinical notes, not all medical data). Define 'hallucination' operationally - are we measuring factual errors, citation accuracy, or diagnostic mistakes?",
-                "feasibility_score": 6,
-                "specific_issues": [
-                    "Vague term: 'AI' should specify 'Large Language Models'",
-                    "Unclear outcome: Define measurable hallucination metrics",
-                    "Missing comparator: Against what baseline?",
-                    "Scope creep: 'Healthcare' is too broad - pick one subdomain"
-                ]
-            })
+        elif "critique" in found or "supervisor" in found:
+            return _MOCK_CRITIQUE_JSON
 
         # Search Strategy Generation (for Orchestrator Agent)
-        elif "search strategy" in combined or "academic database" in combined:
+        elif "strategy" in found:
             # Generate strategy based on question keywords
-            if "hallucination" in user_prompt.lower() or "llm" in user_prompt.lower():
-                return json.dumps({
-                    "databases": ["openalex", "arxiv"],
-                    "queries": [
-                        "LLM hallucination detection",
-                        "large language model factuality",
-                        "reducing hallucinations in language models"
-                    ],
-                    "reasoning": "Using arXiv for recent AI/ML papers on hallucinations and OpenAlex for broader academic coverage including evaluation methods and benchmarks."
-                })
-            elif "prompt engineering" in user_prompt.lower() or "prompting" in user_prompt.lower():
-                return json.dumps({
-                    "databases": ["openalex", "arxiv", "semanticscholar"],
-                    "queries": [
-                        "prompt engineering techniques",
-                        "few-shot prompting",
-                        "chain-of-thought reasoning"
-                    ],
-                    "reasoning": "Using arXiv for cutting-edge techniques, OpenAlex for comprehensive coverage, and Semantic Scholar for citation-weighted results."
-                })
-            elif "retrieval" in user_prompt.lower() or "rag" in user_prompt.lower():
-                return json.dumps({
-                    "databases": ["openalex", "arxiv"],
-                    "queries": [
-                        "retrieval augmented generation",
-                        "RAG systems",
-                        "knowledge retrieval for LLMs"
-                    ],
-                    "reasoning": "Focusing on arXiv for recent RAG papers and OpenAlex for broader retrieval literature."
-                })
+            user_lower = user_prompt.lower()
+            if "hallucination" in user_lower or "llm" in user_lower:
+                return _MOCK_STRATEGY_HALLUCINATION_JSON
+            elif "prompt engineering" in user_lower or "prompting" in user_lower:
+                return _MOCK_STRATEGY_PROMPTING_JSON
+            elif "retrieval" in user_lower or "rag" in user_lower:
+                return _MOCK_STRATEGY_RAG_JSON
             else:
                 # Generic fallback strategy
                 return json.dumps({
@@ -284,62 +545,57 @@ class MockProvider(LLMProvider):
                 })
 
         # Synthesis detection
-        if "respond only in json" in combined and "synthesis" in combined and "bullets" in combined:
+        if _MOCK_SYNTHESIS_MARKERS <= found:
             # Return mock structured synthesis
-            return json.dumps({
-                "synthesis": "Recent work on LLM hallucination detection spans heuristic validation, retrieval-augmented grounding, and self-consistency approaches. Clusters indicate convergence toward multi-stage pipelines combining uncertainty estimation and external knowledge bases. While detection precision improves, recall of subtle factual errors remains challenging. Emerging trends emphasize lightweight runtime guards and hybrid semantic-symbolic validation. Overall, the literature crystallizes around scalable guardrails but lacks standardized benchmarks across clinical and high-stakes domains.",
-                "bullets": [
-                    "Multi-stage pipelines combining retrieval and self-checking dominate approaches.",
-                    "Uncertainty estimation often correlates with hallucination likelihood but is noisy.",
-                    "Knowledge-grounding reduces blatant fabrication but not subtle misattribution.",
-                    "Self-consistency voting improves reliability for reasoning tasks.",
-                    "Hybrid symbolic-semantic validation frameworks are emerging.",
-                    "Benchmark fragmentation limits reproducibility of reported gains."
-                ],
-                "methods": [
-                    "Retrieval augmented validation",
-                    "Self-consistency ensemble checks",
-                    "Uncertainty scoring + threshold gating"
-                ],
-                    "trends": [
-                    "Shift toward lighter, real-time validation layers",
-                    "Integration of external structured knowledge bases",
-                    "Growing interest in adaptive guardrails and policy tuning"
-                ],
-                "gaps": [
-                    "Lack of domain-specific hallucination benchmarks",
-                    "Limited validation for non-English and multimodal inputs",
-                    "Weak handling of subtle factual drift over long generations"
-                ]
-            })
+            return _MOCK_SYNTHESIS_JSON
 
         # Default fallback
         else:
-            return json.dumps({
-                "message": "Mock response - provider is in test mode",
-                "note": "Configure LLM__PROVIDER=openai for real AI"
-            })
+            return _MOCK_DEFAULT_JSON
 
 
 def get_llm_provider() -> LLMProvider:
     """Factory function to get configured LLM provider.
 
+    The provider is built once per configuration object and reused, so
+    services and agents share one client instead of re-validating keys and
+    constructing a new OpenAI client each time. Reloading the config
+    (``get_config(force_reload=True)``) yields a fresh provider.
+
     Returns:
         Configured LLMProvider instance based on config
 
     Raises:
         ConfigurationError: If provider configuration is invalid
     """
+    global _provider_cache
+
     config = get_config()
 
+    cached = _provider_cache
+    if cached is not None and cached[0] is config:
+        return cached[1]
+
+    provider = _create_llm_provider(config)
+    _provider_cache = (config, provider)
+    return provider
+
+
+def _create_llm_provider(config) -> LLMProvider:
+    """Construct the provider selected by ``config.llm.provider``."""
     if config.llm.provider == ProviderEnum.OPENAI:
         return OpenAIProvider()
     elif config.llm.provider == ProviderEnum.MOCK:
         return MockProvider()
     elif config.llm.provider == ProviderEnum.CACHED:
-        # TODO: Implement CachedProvider wrapper
-        logger.warning("CachedProvider not yet implemented, falling back to Mock")
-        return MockProvider()
+        from .cached_provider import CachedProvider
+
+        return CachedProvider(
+            OpenAIProvider(),
+            config.llm.cache_dir,
+            semantic_threshold=config.llm.response_semantic_threshold,
+            max_entries=config.llm.cache_max_entries,
+        )
     else:
         logger.warning(f"Unknown provider {config.llm.provider}, using Mock")
         return MockProvider()
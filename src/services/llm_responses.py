@@ -0,0 +1,50 @@
+"""Typed shapes of the JSON objects returned by the LLM stage prompts.
+
+Parsing a response into one of these models fills in every default in one
+(pydantic-core) pass instead of a chain of ``data.get(...)`` calls, and
+rejects wrongly-typed fields up front. Unknown keys are ignored so prompt
+additions do not break parsing. Callers catch ``pydantic.ValidationError``
+and fall back to their lenient dict handling.
+"""
+
+from typing import Any, Dict, List, Optional
+
+from pydantic import BaseModel, ConfigDict
+
+
+class _LLMResponse(BaseModel):
+    """Base for LLM response models: ignore extra keys, no revalidation."""
+
+    model_config = ConfigDict(extra="ignore", revalidate_instances="never")
+
+
+class Stage0Response(_LLMResponse):
+    """Project context returned by the Stage 0 prompt.
+
+    ``short_description`` is None when the LLM omitted it, so the caller can
+    substitute the truncated raw idea.
+    """
+
+    title: str = "Untitled Research Project"
+    short_description: Optional[str] = None
+    discipline: Optional[str] = None
+    initial_keywords: List[str] = []
+    constraints: Dict[str, Any] = {}
+
+
+class QuestionItem(_LLMResponse):
+    """One research question from the Stage 2 prompt."""
+
+    text: str = "Unnamed research question"
+    type: str = "descriptive"
+    linked_concepts: List[str] = []
+    priority: str = "must_have"
+
+
+class BlockItem(_LLMResponse):
+    """One concept block from the Stage 3 prompt."""
+
+    label: str = "Unnamed Block"
+    description: Optional[str] = None
+    terms_included: List[str] = []
+    terms_excluded: List[str] = []
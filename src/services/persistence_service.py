@@ -5,16 +5,90 @@ different backends (files, databases, cloud storage) to be used interchangeably.
 """
 
 import json
+import os
+import re
 from abc import ABC, abstractmethod
-from dataclasses import asdict, is_dataclass
+from dataclasses import fields, is_dataclass
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Type, TypeVar
+from typing import Any, Dict, List, Optional, Type, TypeVar, Union, get_args, get_origin, get_type_hints
 
 from ..models import ApprovalStatus  # Only need ApprovalStatus for enum serialization
 
+try:
+    import orjson
+    # orjson handles dataclasses, datetimes and enums natively, in C
+    _ORJSON_OPTIONS = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+except ImportError:  # optional speed-up; stdlib json is used otherwise
+    orjson = None
+
 T = TypeVar("T")
 
+# Cheap prefilters so plain strings never pay for a failed parse + exception
+_ISO_DATETIME_RE = re.compile(r"\d{4}-\d{2}-\d{2}[T ]\d{2}:\d{2}")
+_APPROVAL_VALUES = frozenset(status.value for status in ApprovalStatus)
+
+
+@lru_cache(maxsize=None)
+def _field_types(cls: type) -> Dict[str, Any]:
+    """Resolved field annotations of a dataclass, computed once per class."""
+    hints = get_type_hints(cls)
+    return {f.name: hints.get(f.name, Any) for f in fields(cls)}
+
+
+def _unwrap_optional(tp: Any) -> Any:
+    """Return ``X`` for ``Optional[X]``; other annotations are returned as-is."""
+    if get_origin(tp) is Union:
+        args = [arg for arg in get_args(tp) if arg is not type(None)]
+        if len(args) == 1:
+            return args[0]
+    return tp
+
+
+def _from_typed(value: Any, tp: Any) -> Any:
+    """Rebuild one JSON value according to its field annotation.
+
+    Only fields annotated as datetimes, ApprovalStatus, dataclasses or lists
+    of dataclasses are converted; every other value (free-form strings,
+    ``Dict[str, Any]`` payloads) passes through without being probed.
+    """
+    if value is None:
+        return None
+    tp = _unwrap_optional(tp)
+    if tp is datetime:
+        return datetime.fromisoformat(value) if isinstance(value, str) else value
+    if tp is ApprovalStatus:
+        return ApprovalStatus(value)
+    if is_dataclass(tp) and isinstance(value, dict):
+        return _build_dataclass(tp, value)
+    if get_origin(tp) is list and isinstance(value, list):
+        item_args = get_args(tp)
+        item_type = _unwrap_optional(item_args[0]) if item_args else Any
+        if is_dataclass(item_type):
+            return [
+                _build_dataclass(item_type, item) if isinstance(item, dict) else item
+                for item in value
+            ]
+    return value
+
+
+def _build_dataclass(cls: type, data: Dict[str, Any]) -> Any:
+    """Instantiate a nested dataclass, keeping the raw dict if it doesn't fit."""
+    try:
+        return cls(**_typed_fields(cls, data))
+    except (TypeError, ValueError):
+        return data
+
+
+def _typed_fields(cls: type, data: Dict[str, Any]) -> Dict[str, Any]:
+    """Convert a dataclass's JSON fields using its annotations."""
+    types = _field_types(cls)
+    return {
+        k: _from_typed(v, types[k]) if k in types else v
+        for k, v in data.items()
+    }
+
 
 class PersistenceService(ABC):
     """Abstract interface for artifact persistence."""
@@ -54,53 +128,71 @@ class FilePersistenceService(PersistenceService):
 
     def save_artifact(self, artifact: Any, project_id: str, artifact_type: str) -> None:
         artifact_path = self._get_artifact_path(project_id, artifact_type)
-        artifact_dict = self._serialize_dataclass(artifact)
-        with open(artifact_path, "w", encoding="utf-8") as f:
-            json.dump(artifact_dict, f, indent=2, ensure_ascii=False)
+        if orjson is not None:
+            payload = orjson.dumps(artifact, option=_ORJSON_OPTIONS)
+        else:
+            payload = json.dumps(
+                self._to_serializable(artifact), indent=2, ensure_ascii=False
+            ).encode("utf-8")
+
+        # Write the whole payload to a sibling temp file, then rename over the
+        # artifact: a crash mid-save never leaves a truncated JSON file behind
+        tmp_path = artifact_path.with_name(artifact_path.name + ".tmp")
+        tmp_path.write_bytes(payload)
+        os.replace(tmp_path, artifact_path)
 
     def load_artifact(self, artifact_type: str, project_id: str, artifact_class: Type[T]) -> Optional[T]:
         artifact_path = self._get_artifact_path(project_id, artifact_type)
         if not artifact_path.exists():
             return None
-        with open(artifact_path, "r", encoding="utf-8") as f:
-            data = json.load(f)
-        data = self._deserialize_fields(data)
+        if orjson is not None:
+            data = orjson.loads(artifact_path.read_bytes())
+        else:
+            with open(artifact_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
         try:
+            if is_dataclass(artifact_class):
+                # Field annotations say exactly which values need converting
+                data = _typed_fields(artifact_class, data)
+            else:
+                data = self._deserialize_fields(data)
             return artifact_class(**data)
-        except TypeError:
+        except (TypeError, ValueError):
             return None
 
     def list_projects(self) -> List[str]:
         if not self.base_dir.exists():
             return []
-        return [d.name for d in self.base_dir.iterdir() if d.is_dir()]
+        # scandir entries carry the file type, so no extra stat() per project
+        with os.scandir(self.base_dir) as entries:
+            return [entry.name for entry in entries if entry.is_dir()]
 
     def project_exists(self, project_id: str) -> bool:
         project_dir = self._get_project_dir(project_id, create=False)
-        if not project_dir.exists():
+        if not project_dir.is_dir():
             return False
-        return any(project_dir.glob("*.json"))
+        with os.scandir(project_dir) as entries:
+            return any(entry.name.endswith(".json") and entry.is_file() for entry in entries)
 
     # ----------------------------
     # Serialization helpers
     # ----------------------------
 
-    def _serialize_dataclass(self, obj: Any) -> Any:
-        if is_dataclass(obj):
-            raw = asdict(obj)
-            return self._serialize_datetimes_and_enums(raw)
-        if isinstance(obj, list):
-            return [self._serialize_dataclass(o) for o in obj]
-        if isinstance(obj, dict):
-            return {k: self._serialize_dataclass(v) for k, v in obj.items()}
-        return obj
-
-    def _serialize_datetimes_and_enums(self, obj: Any) -> Any:
-        if isinstance(obj, dict):
-            return {k: self._serialize_datetimes_and_enums(v) for k, v in obj.items()}
-        if isinstance(obj, list):
-            return [self._serialize_datetimes_and_enums(v) for v in obj]
-        if hasattr(obj, "isoformat") and isinstance(obj, datetime):
+    def _to_serializable(self, obj: Any) -> Any:
+        """Convert an artifact to JSON-compatible values in a single pass.
+
+        Walks dataclass fields directly (no ``asdict`` deep copy) and converts
+        datetimes and ApprovalStatus on the way. Only used when orjson is
+        unavailable.
+        """
+        obj_type = type(obj)
+        if obj_type is dict:
+            return {k: self._to_serializable(v) for k, v in obj.items()}
+        if obj_type is list or obj_type is tuple:
+            return [self._to_serializable(v) for v in obj]
+        if is_dataclass(obj) and not isinstance(obj, type):
+            return {f.name: self._to_serializable(getattr(obj, f.name)) for f in fields(obj)}
+        if isinstance(obj, datetime):
             return obj.isoformat()
         if isinstance(obj, ApprovalStatus):
             return obj.value
@@ -110,19 +202,8 @@ class FilePersistenceService(PersistenceService):
         converted: Dict[str, Any] = {}
         for k, v in data.items():
             if isinstance(v, str):
-                # Try datetime parse
-                try:
-                    converted[k] = datetime.fromisoformat(v)
-                    continue
-                except ValueError:
-                    pass
-                # Try enum by value
-                try:
-                    converted[k] = ApprovalStatus(v)
-                    continue
-                except ValueError:
-                    pass
-            if isinstance(v, list):
+                converted[k] = self._deserialize_string(v)
+            elif isinstance(v, list):
                 converted[k] = [self._deserialize_list_item(item) for item in v]
             else:
                 converted[k] = v
@@ -132,12 +213,17 @@ class FilePersistenceService(PersistenceService):
         if isinstance(item, dict):
             return {k: self._deserialize_list_item(v) for k, v in item.items()}
         if isinstance(item, str):
+            return self._deserialize_string(item)
+        return item
+
+    @staticmethod
+    def _deserialize_string(value: str) -> Any:
+        """Restore datetimes and ApprovalStatus values; other strings pass through."""
+        if _ISO_DATETIME_RE.match(value):
             try:
-                return datetime.fromisoformat(item)
+                return datetime.fromisoformat(value)
             except ValueError:
-                # Enum value attempt
-                try:
-                    return ApprovalStatus(item)
-                except ValueError:
-                    return item
-        return item
+                return value
+        if value in _APPROVAL_VALUES:
+            return ApprovalStatus(value)
+        return value
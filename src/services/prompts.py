@@ -107,6 +107,49 @@ Return JSON with:
 Be harsh but constructive. A score of 10 means "publication-ready framing".
 """
 
+# ==============================================================================
+# STAGE 0 + STAGE 1 CRITIQUE (FUSED, NON-INTERACTIVE)
+# ==============================================================================
+
+PROMPT_STAGE0_AND_CRITIQUE = """From this raw research idea, produce a structured project context and critique it for research quality.
+
+Raw idea:
+{raw_idea}
+
+First, build the context. Be specific, avoid vague terms, and extract exact constraints from the text.
+
+Then critique the context you built on these dimensions:
+1. CLARITY: Are concepts clearly defined? Are there vague terms?
+2. SPECIFICITY: Is the scope narrow enough to be feasible?
+3. MEASURABILITY: Can outcomes be measured/evaluated?
+4. NOVELTY: Is there an implied research gap?
+
+Return JSON with exactly these two top-level keys and no others:
+{{
+  "context": {{
+    "title": "Academic-style title (concise, descriptive)",
+    "discipline": "Primary academic field (e.g., Computer Science, Medicine, Psychology)",
+    "short_description": "2-3 sentence description of the research focus",
+    "initial_keywords": ["keyword1", "keyword2", "keyword3"],
+    "constraints": {{
+      "time": "estimated timeline if mentioned",
+      "budget": "funding constraints if mentioned",
+      "access": "data/resource access constraints if mentioned"
+    }}
+  }},
+  "critique": {{
+    "critique_summary": "2-3 paragraph detailed critique",
+    "feasibility_score": <integer 1-10>,
+    "specific_issues": [
+      "Issue 1: Vague term 'X' should specify...",
+      "Issue 2: Scope too broad because..."
+    ]
+  }}
+}}
+
+Be harsh but constructive in the critique. A score of 10 means "publication-ready framing".
+"""
+
 # ==============================================================================
 # STAGE 1: PROBLEM FRAMING - REFINE
 # ==============================================================================
@@ -151,6 +194,52 @@ Make goals SMART (Specific, Measurable, Achievable, Relevant, Time-bound).
 Address EVERY issue from the critique.
 """
 
+# ==============================================================================
+# STAGE 1: PROBLEM FRAMING - CRITIQUE + REFINE (FUSED)
+# ==============================================================================
+
+PROMPT_STAGE1_FUSED = """Critique and refine this draft project context in a single pass.
+
+Title: {title}
+Description: {description}
+
+First, critique the context on these dimensions:
+1. CLARITY: Are concepts clearly defined? Are there vague terms?
+2. SPECIFICITY: Is the scope narrow enough to be feasible?
+3. MEASURABILITY: Can outcomes be measured/evaluated?
+4. NOVELTY: Is there an implied research gap?
+
+Then generate a refined problem framing that addresses every issue you raised.
+
+Return JSON with:
+{{
+  "critique_summary": "2-3 paragraph detailed critique",
+  "feasibility_score": <integer 1-10>,
+  "specific_issues": [
+    "Issue 1: Vague term 'X' should specify...",
+    "Issue 2: Scope too broad because..."
+  ],
+  "problem_statement": "Clear 2-3 sentence statement of the problem",
+  "research_gap": "What is missing in current literature/practice",
+  "goals": [
+    "Specific goal 1 (use action verbs: evaluate, design, compare, etc.)",
+    "Specific goal 2"
+  ],
+  "scope_in": ["What IS included (be specific about domains, methods, timeframes)"],
+  "scope_out": ["What is explicitly EXCLUDED"],
+  "key_concepts": [
+    {{
+      "label": "Concept Name",
+      "type": "Population|Intervention|Outcome|Methodology|Context",
+      "description": "Brief description of this concept"
+    }}
+  ]
+}}
+
+Be harsh but constructive in the critique. A score of 10 means "publication-ready framing".
+Make goals SMART (Specific, Measurable, Achievable, Relevant, Time-bound).
+"""
+
 # ==============================================================================
 # STAGE 2: RESEARCH QUESTIONS
 # ==============================================================================
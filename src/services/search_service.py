@@ -5,29 +5,169 @@ Wraps SLR providers without modifying them.
 This service connects our syntax generation (from dialects.py) with
 actual query execution using the SLR provider infrastructure.
 """
-from typing import List, Dict, Optional
+from typing import List, Dict, Iterable, Iterator, Mapping, Optional, Tuple
 from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import nullcontext
+from itertools import chain, count, islice
 from pathlib import Path
+from types import MappingProxyType
 import time
 import logging
+import hashlib
 import json
 import os
-from datetime import datetime
+import shutil
+import threading
+from datetime import UTC, datetime
+
 
 # Import from vendor library (SLR)
 from src.slr.providers.openalex import OpenAlexProvider
 from src.slr.providers.arxiv import ArxivProvider
 from src.slr.providers.crossref import CrossrefProvider
 from src.slr.providers.s2 import SemanticScholarProvider
-from src.slr.core.models import Document, Query, Author, ExternalIds, DocumentCluster
+from src.slr.core.models import Document, Query, DocumentCluster
 from src.slr.core.config import ProviderConfig, DeduplicationConfig
 from src.slr.dedup.deduplicator import Deduplicator
+from src.slr.dedup.strategies import DeduplicationStrategy
 from src.slr.export.csv_exporter import CSVExporter
 from src.slr.export.bibtex_exporter import BibTeXExporter
 from src.slr.export.jsonl_exporter import JSONLExporter
 
+try:
+    import orjson
+except ImportError:  # optional speed-up; stdlib json is used otherwise
+    orjson = None
+
+try:
+    import ijson
+except ImportError:  # optional; result files are parsed whole otherwise
+    ijson = None
+
 logger = logging.getLogger(__name__)
 
+# Characters that are unsafe in file names (on any OS) map to "_" in one pass
+_FILENAME_TABLE = str.maketrans({c: '_' for c in ' /\\:*?"<>|'})
+
+# Provider instances shared by every SearchService in the process, so rate
+# limiter state and client setup survive services being constructed directly
+_PROVIDER_CACHE: Dict[str, object] = {}
+_provider_cache_lock = threading.Lock()
+
+
+def _dumps(obj, indent: bool = False) -> bytes:
+    """Serialize to UTF-8 JSON bytes, with orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+    return json.dumps(obj, indent=2 if indent else None, ensure_ascii=False).encode('utf-8')
+
+
+def _loads(data: bytes):
+    return orjson.loads(data) if orjson is not None else json.loads(data)
+
+
+def _dict_to_document(doc_dict: Dict) -> Document:
+    """Rebuild an SLR Document from the dict stored in a results file.
+
+    Nested authors and identifiers are passed as plain dicts, so pydantic-core
+    builds them in the same validation call instead of one Python-level
+    constructor per Author/ExternalIds.
+    """
+    return Document.model_validate({
+        'title': doc_dict['title'],
+        'abstract': doc_dict.get('abstract'),
+        'authors': [
+            a if 'family_name' in a else {**a, 'family_name': 'Unknown'}
+            for a in doc_dict.get('authors') or ()
+        ],
+        'year': doc_dict.get('year'),
+        'external_ids': {
+            'doi': doc_dict.get('doi'),
+            'pubmed_id': doc_dict.get('pmid'),
+            'arxiv_id': doc_dict.get('arxiv_id'),
+        },
+        'url': doc_dict.get('url'),
+        'venue': doc_dict.get('venue'),
+        'cited_by_count': doc_dict.get('cited_by_count'),
+        'provider': doc_dict.get('provider', 'unknown'),
+        'provider_id': doc_dict.get('provider_id', ''),
+    })
+
+
+def _titled_rows(doc_dicts: Iterable[Dict]) -> List[Dict]:
+    """Keep the result dicts that can be rebuilt as Documents.
+
+    Rows without a title are filtered out up front. Every remaining row is a
+    well-formed results-file entry, so any error while rebuilding it is a
+    real bug and propagates instead of being logged and dropped.
+    """
+    rows = doc_dicts if isinstance(doc_dicts, list) else list(doc_dicts)
+    valid = [d for d in rows if d.get('title')]
+    if len(valid) != len(rows):
+        logger.warning(f"Skipping {len(rows) - len(valid)} documents without a title")
+    return valid
+
+
+# Mirrors DeduplicationStrategy._pick_representative's preference order
+_PROVIDER_PRIORITY = {"crossref": 4, "openalex": 3, "semantic_scholar": 2, "s2": 2, "arxiv": 1}
+
+
+def _row_score(doc_dict: Dict) -> Tuple[int, int, int]:
+    """Representative score of a result dict (completeness, citations, provider)."""
+    completeness = (
+        (10 if doc_dict.get('abstract') else 0)
+        + (5 if doc_dict.get('authors') else 0)
+        + (3 if doc_dict.get('venue') else 0)
+        + (2 if doc_dict.get('doi') else 0)
+    )
+    return (
+        completeness,
+        doc_dict.get('cited_by_count') or 0,
+        _PROVIDER_PRIORITY.get((doc_dict.get('provider') or '').lower(), 0),
+    )
+
+
+def _settle_shared_dois(doc_dicts: Iterable[Dict]) -> Tuple[List[Dict], List[Dict]]:
+    """Resolve exact-DOI duplicate groups on raw rows, before any Document is built.
+
+    SLR's conservative strategy clusters every DOI shared by two or more
+    documents first and never revisits those documents, so the group's
+    representative can be chosen here (same scoring) and the duplicates never
+    need rebuilding or clustering.
+
+    Returns:
+        (representatives of shared-DOI groups in first-seen order,
+         remaining rows in input order - to be clustered by SLR as usual)
+    """
+    groups: Dict[str, List] = {}  # doi -> [best score, best row, group size]
+    ordered: List = []  # residue rows, or the DOI key at its first occurrence
+    for doc_dict in doc_dicts:
+        doi = DeduplicationStrategy.normalize_doi(doc_dict.get('doi'))
+        if not doi or not doc_dict.get('title'):
+            ordered.append(doc_dict)
+            continue
+        score = _row_score(doc_dict)
+        group = groups.get(doi)
+        if group is None:
+            groups[doi] = [score, doc_dict, 1]
+            ordered.append(doi)
+        else:
+            group[2] += 1
+            if score > group[0]:  # ties keep the earliest row, like SLR
+                group[0], group[1] = score, doc_dict
+
+    settled = [group[1] for group in groups.values() if group[2] > 1]
+    residue = []
+    for item in ordered:
+        if isinstance(item, str):
+            group = groups[item]
+            if group[2] == 1:
+                residue.append(group[1])
+        else:
+            residue.append(item)
+    return settled, residue
+
 
 @dataclass
 class SearchResultsSummary:
@@ -43,7 +183,7 @@ class SearchResultsSummary:
 
     def __post_init__(self):
         if self.timestamp is None:
-            self.timestamp = datetime.now().isoformat()
+            self.timestamp = datetime.now(UTC).isoformat()
         # Ensure file_path is synchronized with result_file
         if self.file_path is None and self.result_file is not None:
             self.file_path = self.result_file
@@ -51,6 +191,65 @@ class SearchResultsSummary:
             self.result_file = self.file_path
 
 
+# Constant framing of a results file; only documents and metadata are encoded per save
+_RESULTS_HEAD = b'{\n  "documents": [\n    '
+_RESULTS_SEP = b',\n    '
+_RESULTS_METADATA = b'\n  ],\n  "metadata": '
+_RESULTS_TAIL = b'\n}\n'
+
+# The metadata block is a single line at the end of a streamed results file
+_SUMMARY_TAIL_BYTES = 64 * 1024
+
+
+class _ResultWriter:
+    """Stream search results into a JSON file one document at a time.
+
+    Documents are written as they arrive from the provider, so memory stays
+    flat regardless of ``max_results``. The file is opened on the first
+    document (empty searches leave nothing on disk) and the metadata block,
+    which needs the final count, is written last. A search that fails part
+    way discards its partial file.
+    """
+
+    def __init__(self, filepath: Path, metadata: Dict):
+        self.filepath = filepath
+        self.metadata = metadata
+        self.count = 0
+        self._file = None
+
+    def write(self, document: Dict) -> None:
+        if self._file is None:
+            self._file = open(self.filepath, 'wb')
+            separator = _RESULTS_HEAD
+        else:
+            separator = _RESULTS_SEP
+        self._file.write(separator + _dumps(document))
+        self.count += 1
+
+    def close(self) -> Optional[str]:
+        """Finish the file and return its path, or None if nothing was written."""
+        if self._file is None:
+            return None
+        metadata = {**self.metadata, 'total_results': self.count}
+        self._file.write(b''.join((_RESULTS_METADATA, _dumps(metadata), _RESULTS_TAIL)))
+        self._file.close()
+        self._file = None
+        return str(self.filepath)
+
+    def discard(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+            self.filepath.unlink(missing_ok=True)
+
+    def __enter__(self) -> "_ResultWriter":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if exc_type is not None:
+            self.discard()
+
+
 class SearchService:
     """
     Execute searches across multiple databases using SLR providers.
@@ -61,27 +260,37 @@ class SearchService:
 
     # Map our database names to SLR providers
     # NOTE: PubMed and Scopus are NOT here (no SLR connectors yet)
-    PROVIDERS = {
+    # Read-only views: the sets are closed, and callers can't mutate them by accident
+    PROVIDERS = MappingProxyType({
         'openalex': OpenAlexProvider,
         'arxiv': ArxivProvider,
         'crossref': CrossrefProvider,
         'semanticscholar': SemanticScholarProvider,
         's2': SemanticScholarProvider,  # Alias
-    }
+    })
 
     # Databases we generate syntax for but CAN'T execute yet
-    SYNTAX_ONLY = {
+    SYNTAX_ONLY = MappingProxyType({
         'pubmed': 'PubMed connector requires E-utilities authentication. Use copy/paste for now.',
         'scopus': 'Scopus connector requires API key. Use copy/paste for now.',
         'wos': 'Web of Science connector requires API key. Use copy/paste for now.',
-    }
+    })
 
-    def __init__(self, base_dir: str = "data", project_id: Optional[str] = None):
+    DEFAULT_CACHE_TTL = 24 * 3600  # seconds a cached search stays fresh
+
+    def __init__(
+        self,
+        base_dir: str = "data",
+        project_id: Optional[str] = None,
+        cache_ttl: Optional[float] = DEFAULT_CACHE_TTL
+    ):
         """Initialize search service with optional project scoping.
 
         Args:
             base_dir: Base directory for data storage
             project_id: Optional project ID for scoped file organization
+            cache_ttl: Seconds an identical (database, query, max_results)
+                search is served from the on-disk cache; None disables it
         """
         self.base_dir = Path(base_dir)
         self.project_id = project_id
@@ -93,18 +302,20 @@ class SearchService:
             self.results_dir = self.base_dir / "search_results"  # Legacy/backward compatible
 
         self.results_dir.mkdir(parents=True, exist_ok=True)
+        self._ensured_dirs = {self.results_dir}
+        self.cache_ttl = cache_ttl
+        self.cache_dir = self.results_dir / "_cache"
 
         dedup_config = DeduplicationConfig()
         self.deduplicator = Deduplicator(config=dedup_config)
         self._provider_instances = {}
-        self._provider_configs = {}
         logger.info(f"SearchService initialized (adapter layer) - results dir: {self.results_dir}")
 
     def get_available_databases(self) -> List[str]:
         """Return databases we can actually execute (not just generate syntax for)."""
         return list(self.PROVIDERS.keys())
 
-    def get_syntax_only_databases(self) -> Dict[str, str]:
+    def get_syntax_only_databases(self) -> Mapping[str, str]:
         """Return databases we can't execute yet with reasons."""
         return self.SYNTAX_ONLY
 
@@ -113,30 +324,34 @@ class SearchService:
         return database.lower() in self.PROVIDERS
 
     def _get_provider(self, database: str):
-        """Get or create provider instance (cached)."""
+        """Get or create provider instance (cached per service and process-wide)."""
         db_lower = database.lower()
 
-        if db_lower not in self.PROVIDERS:
-            raise ValueError(f"Database '{database}' not supported. Available: {list(self.PROVIDERS.keys())}")
+        # Fast path: one dict probe for an already-created provider
+        provider = self._provider_instances.get(db_lower)
+        if provider is not None:
+            return provider
 
-        # Create instance if not cached
-        if db_lower not in self._provider_instances:
-            provider_class = self.PROVIDERS[db_lower]
+        provider_class = self.PROVIDERS.get(db_lower)
+        if provider_class is None:
+            raise ValueError(f"Database '{database}' not supported. Available: {list(self.PROVIDERS.keys())}")
 
-            # Create provider config with sensible defaults
-            if db_lower not in self._provider_configs:
+        with _provider_cache_lock:
+            provider = _PROVIDER_CACHE.get(db_lower)
+            if provider is None:
+                # Create provider config with sensible defaults
                 config = ProviderConfig(
                     enabled=True,
                     rate_limit=1.0,  # Conservative default
                     timeout=30,
                     mailto=os.environ.get('SLR_MAILTO', 'researcher@example.com')
                 )
-                self._provider_configs[db_lower] = config
-
-            self._provider_instances[db_lower] = provider_class(config=self._provider_configs[db_lower])
-            logger.info(f"Created {provider_class.__name__} instance")
+                provider = provider_class(config=config)
+                _PROVIDER_CACHE[db_lower] = provider
+                logger.info(f"Created {provider_class.__name__} instance")
 
-        return self._provider_instances[db_lower]
+        self._provider_instances[db_lower] = provider
+        return provider
 
     def execute_search(
         self,
@@ -160,6 +375,11 @@ class SearchService:
         """
         logger.info(f"Executing search: database={database}, query={query[:50]}..., max={max_results}")
 
+        cache_path = self._cache_path(database, query, max_results)
+        cached = self._cached_summary(database, query, cache_path, save_to_disk)
+        if cached is not None:
+            return cached
+
         try:
             start_time = time.time()
 
@@ -172,27 +392,37 @@ class SearchService:
                 max_results=max_results
             )
 
-            # Execute search using SLR provider
-            documents: List[Document] = []
-            for doc in provider.search(query_obj):
-                documents.append(doc)
-                if len(documents) >= max_results:
-                    break
+            # Execute search using SLR provider, streaming each document to disk
+            total_hits = 0
+            result_file = None
+            writer = self._result_writer(database, query) if save_to_disk else None
+            # islice caps the stream at max_results; closing the generator
+            # right away stops providers from fetching another page
+            results = provider.search(query_obj)
+            try:
+                with writer or nullcontext():
+                    for total_hits, doc in enumerate(islice(results, max_results), 1):
+                        if writer is not None:
+                            writer.write(self._document_to_dict(doc))
+                    if writer is not None:
+                        result_file = writer.close()
+            finally:
+                close = getattr(results, 'close', None)
+                if close is not None:
+                    close()
 
             execution_time = time.time() - start_time
 
-            logger.info(f"Search completed: {len(documents)} results in {execution_time:.2f}s")
-
-            # Save results to disk immediately
-            result_file = None
-            if save_to_disk and documents:
-                result_file = self._save_results(database, query, documents)
+            logger.info(f"Search completed: {total_hits} results in {execution_time:.2f}s")
+            if result_file:
+                logger.info(f"Saved {total_hits} results to {result_file}")
+                self._store_in_cache(result_file, cache_path)
 
             # Return lightweight summary
             return SearchResultsSummary(
                 database=database,
                 query=query,
-                total_hits=len(documents),
+                total_hits=total_hits,
                 execution_time=execution_time,
                 result_file=result_file
             )
@@ -207,47 +437,205 @@ class SearchService:
                 error=str(e)
             )
 
-    def _save_results(self, database: str, query: str, documents: List[Document]) -> str:
+    def execute_searches(
+        self,
+        searches: Iterable[Tuple],
+        max_results: int = 100,
+        save_to_disk: bool = True
+    ) -> List[SearchResultsSummary]:
         """
-        Save results to disk, return filepath.
+        Execute several (database, query) searches concurrently.
 
-        Saves in JSON format with metadata for later loading.
+        Searches are I/O-bound, so databases are queried in parallel threads and
+        the batch takes roughly as long as the slowest database instead of the
+        sum of all of them. Queries against the same database run one after
+        another in a single worker, so each provider keeps its own pacing.
+
+        Args:
+            searches: (database, query) pairs, e.g. ``queries_by_db.items()``,
+                or (database, query, max_results) triples to override the
+                limit for individual searches
+            max_results: Maximum number of results to fetch per search
+            save_to_disk: Whether to save full results to disk
+
+        Returns:
+            One SearchResultsSummary per search, in input order. Failures are
+            reported via ``error`` exactly as in ``execute_search``.
         """
-        # Create sanitized filename
-        query_short = query[:30].replace(' ', '_').replace('/', '_')
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-        filename = f"{database}_{query_short}_{timestamp}.json"
-        filepath = self.results_dir / filename
+        jobs = [
+            (index, search[0], search[1], search[2] if len(search) > 2 else max_results)
+            for index, search in enumerate(searches)
+        ]
+        if len(jobs) <= 1:
+            return [self.execute_search(db, q, limit, save_to_disk) for _, db, q, limit in jobs]
+
+        # Group by database; each job keeps its position for ordering
+        by_database: Dict[str, List[Tuple[int, str, str, int]]] = {}
+        for job in jobs:
+            by_database.setdefault(job[1].lower(), []).append(job)
+
+        # Create providers up front so workers never mutate the instance cache
+        for db_lower in by_database:
+            if db_lower in self.PROVIDERS:
+                self._get_provider(db_lower)
+
+        def run_database(db_jobs: List[Tuple[int, str, str, int]]) -> List[Tuple[int, SearchResultsSummary]]:
+            return [
+                (index, self.execute_search(database, query, limit, save_to_disk))
+                for index, database, query, limit in db_jobs
+            ]
+
+        results: List[Optional[SearchResultsSummary]] = [None] * len(jobs)
+        with ThreadPoolExecutor(max_workers=min(8, len(by_database))) as executor:
+            futures = [executor.submit(run_database, db_jobs) for db_jobs in by_database.values()]
+            for future in as_completed(futures):
+                for index, summary in future.result():
+                    results[index] = summary
+
+        return results
+
+    def _cache_path(self, database: str, query: str, max_results: int) -> Path:
+        key = hashlib.blake2b(
+            f"{database.lower()}|{query}|{max_results}".encode('utf-8'), digest_size=16
+        ).hexdigest()
+        return self.cache_dir / f"{key}.json"
+
+    def _cached_summary(
+        self, database: str, query: str, cache_path: Path, save_to_disk: bool = True
+    ) -> Optional[SearchResultsSummary]:
+        """Return a summary for a fresh cached search, or None on a miss.
+
+        Like a live search, the summary only carries a result file when
+        ``save_to_disk`` is set.
+        """
+        if self.cache_ttl is None:
+            return None
+        try:
+            if time.time() - cache_path.stat().st_mtime > self.cache_ttl:
+                return None
+            metadata = self.load_results_summary(str(cache_path))
+            # Hand out a results_dir path, so invalidating the cache later
+            # never deletes a file a caller still holds
+            result_file = (
+                self._link_from_cache(database, query, cache_path) if save_to_disk else None
+            )
+        except (OSError, ValueError):
+            return None
+
+        logger.info(f"Search cache hit: database={database}, query={query[:50]}...")
+        return SearchResultsSummary(
+            database=database,
+            query=query,
+            total_hits=metadata.get('total_results', 0),
+            execution_time=0.0,
+            result_file=result_file
+        )
+
+    def _link_from_cache(self, database: str, query: str, cache_path: Path) -> str:
+        """Expose a cached result file in results_dir (hard link, copy as fallback).
+
+        Reuses the original result file if it is still linked to the cache
+        entry under the same name; otherwise picks a free file name.
+        """
+        stem = self._result_stem(database, query, datetime.now(UTC))
+        for n in count():
+            target = self.results_dir / (f"{stem}.json" if n == 0 else f"{stem}_{n}.json")
+            if target.exists():
+                if os.path.samefile(target, cache_path):
+                    return str(target)
+                continue
+            try:
+                os.link(cache_path, target)
+            except FileExistsError:
+                continue
+            except OSError:  # filesystem without hard links
+                shutil.copyfile(cache_path, target)
+            return str(target)
+
+    def _store_in_cache(self, result_file: str, cache_path: Path) -> None:
+        """Add a saved result file to the cache (hard link, copy as fallback)."""
+        if self.cache_ttl is None:
+            return
+        try:
+            self._ensure_dir(self.cache_dir)
+            cache_path.unlink(missing_ok=True)
+            try:
+                os.link(result_file, cache_path)
+            except OSError:  # filesystem without hard links
+                shutil.copyfile(result_file, cache_path)
+        except OSError as e:
+            # The directory may have been removed underneath us; re-check next time
+            self._ensured_dirs.discard(self.cache_dir)
+            logger.warning(f"Could not cache search results: {e}")
+
+    def _ensure_dir(self, path: Path) -> None:
+        """Create a directory once per service; later calls skip the syscall."""
+        if path not in self._ensured_dirs:
+            path.mkdir(parents=True, exist_ok=True)
+            self._ensured_dirs.add(path)
+
+    def invalidate_cache(self, database: Optional[str] = None, query: Optional[str] = None) -> int:
+        """
+        Drop cached searches.
 
-        # Serialize documents
-        # Convert SLR Document objects to dicts
-        data = {
-            'metadata': {
-                'database': database,
-                'query': query,
-                'timestamp': datetime.now().isoformat(),
-                'total_results': len(documents)
-            },
-            'documents': [self._document_to_dict(doc) for doc in documents]
-        }
+        Args:
+            database: Only drop searches against this database
+            query: Only drop searches for this exact query string
 
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        Returns:
+            Number of cache entries removed
+        """
+        if not self.cache_dir.is_dir():
+            return 0
+
+        removed = 0
+        for entry in self.cache_dir.glob("*.json"):
+            if database is not None or query is not None:
+                try:
+                    metadata = self.load_results_summary(str(entry))
+                except (OSError, ValueError):
+                    metadata = {}
+                if database is not None and metadata.get('database', '').lower() != database.lower():
+                    continue
+                if query is not None and metadata.get('query') != query:
+                    continue
+            entry.unlink(missing_ok=True)
+            removed += 1
+
+        logger.info(f"Invalidated {removed} cached searches")
+        return removed
+
+    def _result_writer(self, database: str, query: str) -> _ResultWriter:
+        """
+        Create a streaming writer for one search's results.
 
-        logger.info(f"Saved {len(documents)} results to {filepath}")
-        return str(filepath)
+        Saves in JSON format with metadata for later loading.
+        """
+        now = datetime.now(UTC)  # one clock read for filename and metadata
+        filename = f"{self._result_stem(database, query, now)}.json"
+        return _ResultWriter(self.results_dir / filename, {
+            'database': database,
+            'query': query,
+            'timestamp': now.isoformat(),
+        })
+
+    def _result_stem(self, database: str, query: str, now: datetime) -> str:
+        """Build the sanitized file name stem for one search's results."""
+        query_short = query[:30].translate(_FILENAME_TABLE)
+        return f"{database}_{query_short}_{now:%Y%m%d_%H%M%S}"
 
     def _document_to_dict(self, doc: Document) -> dict:
         """Convert SLR Document to JSON-serializable dict."""
+        ext = doc.external_ids  # looked up once, not per ID field
         return {
             'title': doc.title,
             'abstract': doc.abstract,
             'authors': [{'family_name': a.family_name, 'given_name': a.given_name, 'orcid': a.orcid}
-                       for a in (doc.authors or [])],
+                       for a in doc.authors or ()],
             'year': doc.year,
-            'doi': doc.external_ids.doi if doc.external_ids else None,
-            'pmid': doc.external_ids.pubmed_id if doc.external_ids else None,
-            'arxiv_id': doc.external_ids.arxiv_id if doc.external_ids else None,
+            'doi': ext.doi if ext else None,
+            'pmid': ext.pubmed_id if ext else None,
+            'arxiv_id': ext.arxiv_id if ext else None,
             'url': doc.url,
             'venue': doc.venue,
             'cited_by_count': doc.cited_by_count,
@@ -261,70 +649,153 @@ class SearchService:
 
         Returns list of document dicts (not full Document objects to keep it simple).
         """
-        with open(result_file, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        data = _loads(Path(result_file).read_bytes())
 
         return data.get('documents', [])
 
+    def load_results_summary(self, result_file: str) -> Dict:
+        """
+        Load only the metadata block of a results file.
+
+        Streamed result files end with their metadata, so only the tail of
+        the file is read and no document is parsed. Files in any other layout
+        (e.g. deduplicated results) fall back to ijson, then to a full load.
+
+        Args:
+            result_file: Path to a results JSON file
+
+        Returns:
+            The file's metadata dict (empty if it has none)
+        """
+        with open(result_file, 'rb') as f:
+            size = f.seek(0, os.SEEK_END)
+            f.seek(max(0, size - _SUMMARY_TAIL_BYTES))
+            tail = f.read()
+
+        # Encoded strings never contain a raw newline, so the framing can't
+        # appear inside a document and the last match is the metadata block
+        start = tail.rfind(_RESULTS_METADATA)
+        if start != -1 and tail.endswith(_RESULTS_TAIL):
+            try:
+                return _loads(tail[start + len(_RESULTS_METADATA):-len(_RESULTS_TAIL)])
+            except ValueError:
+                pass
+
+        if ijson is not None:
+            with open(result_file, 'rb') as f:
+                for key, value in ijson.kvitems(f, '', use_float=True):
+                    if key == 'metadata':
+                        return value
+            return {}
+        return _loads(Path(result_file).read_bytes()).get('metadata', {})
+
+    def iter_results(self, result_file: str) -> Iterator[Dict]:
+        """
+        Iterate over the document dicts in a results file.
+
+        With ijson installed the file is parsed incrementally, so only one
+        document is in memory at a time; otherwise falls back to load_results.
+        """
+        if ijson is None:
+            yield from self.load_results(result_file)
+            return
+        with open(result_file, 'rb') as f:
+            yield from ijson.items(f, 'documents.item', use_float=True)
+
     def deduplicate_results(self, result_files: List[str]) -> List[Dict]:
         """
         Deduplicate results from multiple searches.
 
         Uses SLR's deduplication logic (DOI, title similarity, fingerprint).
+        The output is cached against the input files' paths, sizes and
+        modification times, so re-running on unchanged (e.g. cache-hit)
+        result files skips clustering entirely.
         """
         logger.info(f"Deduplicating {len(result_files)} result sets")
 
-        # Load all documents
-        all_docs = []
-        for result_file in result_files:
-            docs = self.load_results(result_file)
-            all_docs.extend(docs)
-
-        logger.info(f"Total documents before dedup: {len(all_docs)}")
+        cache_path = self._dedup_cache_path(result_files)
+        if cache_path is not None:
+            cached = self._cached_dedup(cache_path)
+            if cached is not None:
+                return cached
+
+        unique = self._deduplicate_files(result_files)
+        if cache_path is not None:
+            self._store_dedup(cache_path, unique)
+        return unique
+
+    def _dedup_cache_path(self, result_files: List[str]) -> Optional[Path]:
+        """Cache file for deduplicating exactly these file versions, in this order."""
+        if self.cache_ttl is None:
+            return None
+        try:
+            stamps = [(f, st.st_mtime_ns, st.st_size) for f, st in ((f, os.stat(f)) for f in result_files)]
+        except OSError:
+            return None
+        key = hashlib.blake2b(repr(stamps).encode('utf-8'), digest_size=16).hexdigest()
+        return self.cache_dir / f"dedup_{key}.json"
 
-        # Convert back to Document objects for deduplication
-        doc_objects = []
-        for doc_dict in all_docs:
-            try:
-                # Reconstruct Document object (simplified)
-                authors = [Author(
-                    family_name=a.get('family_name', 'Unknown'),
-                    given_name=a.get('given_name'),
-                    orcid=a.get('orcid')
-                ) for a in doc_dict.get('authors', [])]
-
-                external_ids = ExternalIds(
-                    doi=doc_dict.get('doi'),
-                    pubmed_id=doc_dict.get('pmid'),
-                    arxiv_id=doc_dict.get('arxiv_id')
-                )
+    def _cached_dedup(self, cache_path: Path) -> Optional[List[Dict]]:
+        try:
+            if time.time() - cache_path.stat().st_mtime > self.cache_ttl:
+                return None
+            documents = self.load_results(str(cache_path))
+        except (OSError, ValueError):
+            return None
+        logger.info(f"Deduplication cache hit: {len(documents)} documents")
+        return documents
+
+    def _store_dedup(self, cache_path: Path, documents: List[Dict]) -> None:
+        """Write deduplicated rows to the cache in the streamed results layout."""
+        tmp_path = cache_path.with_name(cache_path.name + '.tmp')
+        try:
+            self._ensure_dir(self.cache_dir)
+            writer = _ResultWriter(tmp_path, {'deduplicated': True})
+            with writer:
+                for document in documents:
+                    writer.write(document)
+                if writer.close() is not None:
+                    os.replace(tmp_path, cache_path)
+        except OSError as e:
+            self._ensured_dirs.discard(self.cache_dir)
+            logger.warning(f"Could not cache deduplicated results: {e}")
+
+    def _deduplicate_files(self, result_files: List[str]) -> List[Dict]:
+        """Load, settle and cluster the rows of the given result files."""
+        # Read files on worker threads so disk reads overlap with parsing
+        def load_rows(result_file: str) -> List[Dict]:
+            return list(self.iter_results(result_file))
+
+        if len(result_files) > 1:
+            with ThreadPoolExecutor(max_workers=min(8, len(result_files))) as executor:
+                per_file = list(executor.map(load_rows, result_files))
+        else:
+            per_file = [load_rows(f) for f in result_files]
 
-                doc = Document(
-                    title=doc_dict['title'],
-                    abstract=doc_dict.get('abstract'),
-                    authors=authors,
-                    year=doc_dict.get('year'),
-                    external_ids=external_ids,
-                    url=doc_dict.get('url'),
-                    venue=doc_dict.get('venue'),
-                    cited_by_count=doc_dict.get('cited_by_count'),
-                    provider=doc_dict.get('provider', 'unknown'),
-                    provider_id=doc_dict.get('provider_id', '')
-                )
-                doc_objects.append(doc)
-            except Exception as e:
-                logger.warning(f"Skipping invalid document: {e}")
+        total_rows = sum(len(file_rows) for file_rows in per_file)
+        logger.info(f"Total documents before dedup: {total_rows}")
 
-        # Deduplicate using SLR deduplicator
-        clusters = self.deduplicator.deduplicate(doc_objects)
+        # Shared-DOI groups are resolved on the raw rows and skip clustering
+        settled, residue = _settle_shared_dois(chain.from_iterable(per_file))
+        del per_file
+        if settled:
+            logger.info(f"DOI pre-pass settled {len(settled)} groups before clustering")
 
-        logger.info(f"Documents after dedup: {len(clusters)} clusters")
+        # Deduplicate the rest using SLR deduplicator
+        rows = _titled_rows(residue)
+        documents = [_dict_to_document(row) for row in rows]
+        clusters = self.deduplicator.deduplicate(documents)
 
-        # Extract representative documents from clusters
-        unique_docs = [cluster.representative for cluster in clusters]
+        logger.info(f"Documents after dedup: {len(settled) + len(clusters)} clusters")
 
-        # Convert back to dicts
-        return [self._document_to_dict(doc) for doc in unique_docs]
+        # Representatives are the Documents we built, so hand back the rows
+        # they came from instead of converting each one back to a dict
+        source_rows = dict(zip(map(id, documents), rows))
+        return settled + [
+            source_rows.get(id(cluster.representative))
+            or self._document_to_dict(cluster.representative)
+            for cluster in clusters
+        ]
 
     def export_results(
         self,
@@ -336,7 +807,7 @@ class SearchService:
         Export results to various formats.
 
         Args:
-            documents: List of document dicts
+            documents: List of document dicts (or SLR Documents)
             format: Export format ('csv', 'bibtex', 'jsonl')
             output_path: Path to save the export
 
@@ -345,36 +816,7 @@ class SearchService:
         """
         logger.info(f"Exporting {len(documents)} documents to {format}")
 
-        # Convert dicts back to Document objects
-        doc_objects = []
-        for doc_dict in documents:
-            authors = [Author(
-                family_name=a.get('family_name', 'Unknown'),
-                given_name=a.get('given_name'),
-                orcid=a.get('orcid')
-            ) for a in doc_dict.get('authors', [])]
-
-            external_ids = ExternalIds(
-                doi=doc_dict.get('doi'),
-                pubmed_id=doc_dict.get('pmid'),
-                arxiv_id=doc_dict.get('arxiv_id')
-            )
-
-            doc = Document(
-                title=doc_dict['title'],
-                abstract=doc_dict.get('abstract'),
-                authors=authors,
-                year=doc_dict.get('year'),
-                external_ids=external_ids,
-                url=doc_dict.get('url'),
-                venue=doc_dict.get('venue'),
-                cited_by_count=doc_dict.get('cited_by_count'),
-                provider=doc_dict.get('provider', 'unknown'),
-                provider_id=doc_dict.get('provider_id', '')
-            )
-            doc_objects.append(doc)
-
-        # Select exporter
+        # Select exporter (before converting anything)
         if format == 'csv':
             exporter = CSVExporter()
         elif format == 'bibtex':
@@ -384,6 +826,16 @@ class SearchService:
         else:
             raise ValueError(f"Unsupported format: {format}. Use csv, bibtex, or jsonl")
 
+        # Convert dicts back to Document objects (unless given Documents already).
+        # JSONL writes row by row, so it gets a generator and no list is built;
+        # the CSV and BibTeX exporters need a sequence.
+        if documents and isinstance(documents[0], Document):
+            doc_objects = documents
+        elif format == 'jsonl':
+            doc_objects = (_dict_to_document(d) for d in documents)
+        else:
+            doc_objects = [_dict_to_document(d) for d in documents]
+
         # Export using the appropriate method
         exporter.export_documents(doc_objects, output_path)
 
@@ -404,21 +856,19 @@ class SearchService:
         Returns:
             Path to saved file
         """
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-        db_label = "_".join(databases[:3])  # Limit filename length
-        filename = f"deduplicated_{db_label}_{timestamp}.json"
+        now = datetime.now(UTC)  # one clock read for filename and metadata
+        db_label = "_".join(databases[:3]).translate(_FILENAME_TABLE)  # Limit filename length
+        filename = f"deduplicated_{db_label}_{now:%Y%m%d_%H%M%S}.json"
         filepath = self.results_dir / filename
 
-        # Save using existing save mechanism
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump({
-                'metadata': {
-                    'databases_merged': databases,
-                    'timestamp': datetime.now().isoformat(),
-                    'total_documents': len(documents)
-                },
-                'documents': documents
-            }, f, indent=2, ensure_ascii=False)
+        filepath.write_bytes(_dumps({
+            'metadata': {
+                'databases_merged': databases,
+                'timestamp': now.isoformat(),
+                'total_documents': len(documents)
+            },
+            'documents': documents
+        }, indent=True))
 
         logger.info(f"Saved {len(documents)} deduplicated results to {filepath}")
         return str(filepath)
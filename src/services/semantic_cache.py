@@ -0,0 +1,199 @@
+"""Semantic similarity cache for near-duplicate LLM inputs.
+
+Researchers often resubmit the same idea with small edits (a typo fix, an
+extra sentence). This cache embeds the input text and returns a previously
+stored payload when a new input is close enough in cosine similarity,
+skipping a full LLM round-trip.
+
+Embeddings come from ``fastembed`` when it is installed; otherwise a
+dependency-free hashed bag-of-words vector is used, which still catches
+lightly edited text but cannot tell reordered text apart (see
+:func:`has_semantic_embedder`).
+"""
+
+import copy
+import json
+import logging
+import math
+import os
+import re
+import zlib
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+Embedder = Callable[[str], List[float]]
+
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+_HASH_DIMS = 512
+
+
+def _hashed_bow_embedding(text: str) -> List[float]:
+    """Embed text as an L2-normalised hashed bag of words.
+
+    Uses crc32 rather than ``hash()`` so vectors are stable across
+    processes and can be persisted.
+    """
+    vec = [0.0] * _HASH_DIMS
+    for token in _TOKEN_RE.findall(text.lower()):
+        vec[zlib.crc32(token.encode("utf-8")) % _HASH_DIMS] += 1.0
+    return _normalize(vec)
+
+
+def _normalize(vec: List[float]) -> List[float]:
+    norm = math.sqrt(sum(v * v for v in vec))
+    if norm == 0:
+        return vec
+    return [v / norm for v in vec]
+
+
+@lru_cache(maxsize=None)
+def has_semantic_embedder() -> bool:
+    """Return True if a real embedding model (fastembed) is importable.
+
+    The hashed bag-of-words fallback ignores word order, so callers whose
+    inputs can differ only in order should not rely on it. Logged once.
+    """
+    try:
+        import fastembed  # noqa: F401
+    except ImportError:
+        logger.info("fastembed not installed, semantic caches that need word order are disabled")
+        return False
+    return True
+
+
+def _default_embedder() -> Embedder:
+    """Return the best available embedding function."""
+    try:
+        from fastembed import TextEmbedding
+    except ImportError:
+        logger.debug("fastembed not installed, using hashed bag-of-words embeddings")
+        return _hashed_bow_embedding
+
+    model = TextEmbedding("BAAI/bge-small-en-v1.5")
+
+    def embed(text: str) -> List[float]:
+        return _normalize([float(v) for v in next(iter(model.embed([text])))])
+
+    return embed
+
+
+class SemanticCache:
+    """Nearest-neighbour cache from free text to a JSON-serializable payload.
+
+    Entries are persisted to ``<cache_dir>/<name>.json`` so the cache
+    survives restarts. Lookup is a linear cosine scan, which is plenty for
+    the few hundred ideas a single installation accumulates.
+
+    Example:
+        >>> cache = SemanticCache(Path(".cache/llm"), threshold=0.93)
+        >>> cache.add("LLM hallucinations in clinical notes", {"title": "..."})
+        >>> cache.lookup("LLM hallucinations in clinical notes.")
+        {'title': '...'}
+    """
+
+    def __init__(
+        self,
+        cache_dir: Path,
+        threshold: float = 0.93,
+        name: str = "semantic_cache",
+        embedder: Optional[Embedder] = None,
+    ):
+        """Initialize the cache and load any persisted entries.
+
+        Args:
+            cache_dir: Directory for the on-disk index
+            threshold: Minimum cosine similarity for a hit (0-1)
+            name: File stem for the persisted index
+            embedder: Optional embedding function (defaults to fastembed or
+                hashed bag-of-words)
+        """
+        self.threshold = threshold
+        self.path = Path(cache_dir) / f"{name}.json"
+        self._embed = embedder or _default_embedder()
+        self._entries: List[Dict[str, Any]] = []
+        self._load()
+
+    def lookup(self, text: str) -> Optional[Any]:
+        """Return the payload of the most similar cached text, if close enough.
+
+        Args:
+            text: Input text to match
+
+        Returns:
+            Copy of the cached payload (safe to mutate), or None on a miss
+        """
+        if not self._entries:
+            return None
+
+        query = self._embed(text)
+        best_score, best_entry = -1.0, None
+        for entry in self._entries:
+            if len(entry["vector"]) != len(query):
+                continue  # written by a different embedder
+            score = sum(a * b for a, b in zip(query, entry["vector"]))
+            if score > best_score:
+                best_score, best_entry = score, entry
+
+        if best_entry is not None and best_score >= self.threshold:
+            logger.info(f"Semantic cache hit (similarity={best_score:.3f})")
+            return copy.deepcopy(best_entry["payload"])
+        return None
+
+    def add(self, text: str, payload: Any) -> None:
+        """Store a payload for the given text and persist the index.
+
+        Args:
+            text: Input text the payload was generated from
+            payload: JSON-serializable value to return on future hits
+        """
+        self._entries.append({"vector": self._embed(text), "payload": payload})
+        self._save()
+
+    def discard(self, text: str) -> None:
+        """Remove every entry that ``lookup(text)`` could return.
+
+        Args:
+            text: Input text whose cached payload turned out to be unusable
+        """
+        query = self._embed(text)
+        kept = [
+            entry for entry in self._entries
+            if len(entry["vector"]) != len(query)
+            or sum(a * b for a, b in zip(query, entry["vector"])) < self.threshold
+        ]
+        if len(kept) != len(self._entries):
+            self._entries = kept
+            self._save()
+
+    def clear(self) -> None:
+        """Remove all entries (in memory and on disk)."""
+        self._entries = []
+        if self.path.exists():
+            self.path.unlink()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _load(self) -> None:
+        if not self.path.exists():
+            return
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                self._entries = json.load(f)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable semantic cache {self.path}: {e}")
+            self._entries = []
+
+    def _save(self) -> None:
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            # Write-then-rename so a crash never leaves a truncated index
+            tmp_path = self.path.with_suffix(".tmp")
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(self._entries, f, ensure_ascii=False)
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            logger.warning(f"Could not persist semantic cache {self.path}: {e}")
@@ -4,6 +4,7 @@ This implementation doesn't call any external APIs. It generates reasonable
 placeholders to enable an end-to-end demo.
 """
 from datetime import UTC, datetime
+from functools import lru_cache
 from typing import List, Optional, Tuple
 import re
 import uuid
@@ -12,6 +13,7 @@ from .model_service import ModelService
 from ..models import (
     Concept,
     ConceptModel,
+    DatabaseQuery,
     DatabaseQueryPlan,
     ModelMetadata,
     ProblemFraming,
@@ -20,30 +22,51 @@ from ..models import (
     ResearchQuestion,
     ScreeningChecklist,
     ScreeningCriteria,
+    SearchConceptBlock,
     SearchConceptBlocks,
     StrategyPackage,
 )
-
-
-def _title_from_text(text: str) -> str:
-    # Naive title generator: take first sentence, title-case it, truncate
-    first_sentence = re.split(r"[.!?]", text.strip())[0]
-    words = first_sentence.strip()[:120]
-    title = words.title()
-    return title[:80] or "Untitled Project"
-
-
-def _extract_keywords(text: str) -> list[str]:
-    # Very naive keyword extraction: select alphanumeric words longer than 4 chars
-    tokens = re.findall(r"[A-Za-z][A-Za-z0-9_-]{4,}", text.lower())
-    # Deduplicate preserving order
-    seen = set()
-    keywords: list[str] = []
-    for t in tokens:
-        if t not in seen:
-            seen.add(t)
-            keywords.append(t)
-    return keywords[:10]
+from ..search.builder import get_builder
+from ..search.models import ConceptBlock as SyntaxConceptBlock, FieldTag, QueryPlan as SyntaxQueryPlan
+from ..utils.ids import fast_id
+
+
+_KEYWORD_RE = re.compile(r"[A-Za-z][A-Za-z0-9_-]{4,}")
+_MAX_KEYWORDS = 10
+_TITLE_SCAN = 120
+
+# Database-specific usage notes attached to generated queries
+_DATABASE_NOTES = {
+    "pubmed": "Syntax-only: Copy to PubMed UI. Consider adding MeSH terms.",
+    "scopus": "Syntax-only: Requires Scopus API key. Copy to Scopus UI.",
+    "wos": "Syntax-only: Requires Web of Science access. Copy to WoS UI.",
+    "openalex": "Executable via SearchService",
+    "arxiv": "Executable via SearchService",
+    "semanticscholar": "Executable via SearchService",
+    "crossref": "Executable via SearchService"
+}
+
+
+@lru_cache(maxsize=256)
+def _analyze_idea(text: str) -> tuple[str, tuple[str, ...]]:
+    """Derive a naive title and keywords from a raw idea in one pass.
+
+    The title is the first sentence, title-cased and truncated. Keywords are
+    the first 10 distinct alphanumeric words longer than 4 chars, in order
+    (a tuple, so cached results can't be mutated).
+    """
+    stripped = text.strip()
+    # Only the first 120 chars can reach the title, so never scan past them
+    ends = [i for i in (stripped.find(mark, 0, _TITLE_SCAN) for mark in ".!?") if i != -1]
+    first_sentence = stripped[:min(ends, default=_TITLE_SCAN)]
+    title = first_sentence.strip().title()[:80] or "Untitled Project"
+    # Stop scanning once 10 distinct keywords are found; long ideas needn't be read in full
+    keywords: dict[str, None] = {}
+    for match in _KEYWORD_RE.finditer(stripped.lower()):
+        keywords[match.group()] = None
+        if len(keywords) == _MAX_KEYWORDS:
+            break
+    return title, tuple(keywords)
 
 
 class SimpleModelService(ModelService):
@@ -60,8 +83,7 @@ class SimpleModelService(ModelService):
 
     def suggest_project_context(self, raw_idea: str) -> Tuple[ProjectContext, ModelMetadata]:
         project_id = f"project_{uuid.uuid4().hex[:8]}"
-        title = _title_from_text(raw_idea)
-        keywords = _extract_keywords(raw_idea)
+        title, keywords = _analyze_idea(raw_idea)
         ctx = ProjectContext(
             id=project_id,
             title=title,
@@ -70,7 +92,7 @@ class SimpleModelService(ModelService):
             subfield=None,
             application_area=None,
             constraints={},
-            initial_keywords=keywords,
+            initial_keywords=list(keywords),
             model_metadata=None,
         )
         meta = self._meta("Initial ProjectContext suggested from raw idea")
@@ -163,9 +185,6 @@ class SimpleModelService(ModelService):
 
     def expand_search_terms(self, concepts: ConceptModel, rqs: ResearchQuestionSet) -> Tuple[SearchConceptBlocks, ModelMetadata]:
         """Heuristic search term expansion."""
-        from ..models import SearchConceptBlock
-        import uuid
-
         blocks_list = []
         for concept in concepts.concepts[:6]:  # Limit to 6 main concepts
             # Simple heuristic: use concept label + basic variations
@@ -177,10 +196,10 @@ class SimpleModelService(ModelService):
                 terms.append(label + 's')
 
             block = SearchConceptBlock(
-                id=str(uuid.uuid4()),
+                id=fast_id("block"),
                 label=label,
                 description=concept.description,
-                terms_included=list(set(terms)),  # Deduplicate
+                terms_included=list(dict.fromkeys(terms)),  # Deduplicate, keeping order
                 terms_excluded=[]
             )
             blocks_list.append(block)
@@ -196,11 +215,6 @@ class SimpleModelService(ModelService):
 
     def build_database_queries(self, blocks: SearchConceptBlocks, db_names: List[str]) -> Tuple[DatabaseQueryPlan, ModelMetadata]:
         """Generate database queries using Anti-Hallucination syntax engine."""
-        from ..models import DatabaseQuery, DatabaseQueryPlan
-        from ..search.models import QueryPlan as SyntaxQueryPlan, ConceptBlock as SyntaxConceptBlock, FieldTag
-        from ..search.builder import get_builder
-        import uuid
-
         queries = []
 
         # Convert SearchConceptBlocks to syntax engine format
@@ -219,27 +233,26 @@ class SimpleModelService(ModelService):
             syntax_plan.blocks.append(syntax_block)
 
         # Generate queries using syntax engine (guaranteed valid syntax)
+        block_ids = [b.id for b in blocks.blocks]
         for db_name in db_names:
+            db_lower = db_name.lower()
             try:
-                builder = get_builder(db_name.lower())
-                query_string = builder.build(syntax_plan)
-
-                # Add database-specific notes
-                notes = self._get_database_notes(db_name.lower())
+                # Builders are created once per database and shared
+                query_string = get_builder(db_lower).build(syntax_plan)
 
                 queries.append(DatabaseQuery(
-                    id=f"query_{db_name}_{uuid.uuid4().hex[:6]}",
-                    database_name=db_name.lower(),
-                    query_blocks=[b.id for b in blocks.blocks],
+                    id=fast_id(f"query_{db_name}"),
+                    database_name=db_lower,
+                    query_blocks=list(block_ids),
                     boolean_query_string=query_string,
-                    notes=notes
+                    notes=self._get_database_notes(db_lower)
                 ))
             except ValueError as e:
                 # Database not supported by syntax engine
                 queries.append(DatabaseQuery(
-                    id=f"query_{db_name}_{uuid.uuid4().hex[:6]}",
-                    database_name=db_name.lower(),
-                    query_blocks=[b.id for b in blocks.blocks],
+                    id=fast_id(f"query_{db_name}"),
+                    database_name=db_lower,
+                    query_blocks=list(block_ids),
                     boolean_query_string=f"# Unsupported database: {db_name}",
                     notes=f"Syntax engine doesn't support {db_name}: {str(e)}"
                 ))
@@ -251,16 +264,7 @@ class SimpleModelService(ModelService):
 
     def _get_database_notes(self, db_name: str) -> str:
         """Return database-specific usage notes."""
-        notes_map = {
-            "pubmed": "Syntax-only: Copy to PubMed UI. Consider adding MeSH terms.",
-            "scopus": "Syntax-only: Requires Scopus API key. Copy to Scopus UI.",
-            "wos": "Syntax-only: Requires Web of Science access. Copy to WoS UI.",
-            "openalex": "Executable via SearchService",
-            "arxiv": "Executable via SearchService",
-            "semanticscholar": "Executable via SearchService",
-            "crossref": "Executable via SearchService"
-        }
-        return notes_map.get(db_name, "Generated using syntax engine")
+        return _DATABASE_NOTES.get(db_name, "Generated using syntax engine")
 
     def draft_screening_criteria(self, rqs: ResearchQuestionSet, blocks: SearchConceptBlocks) -> Tuple[ScreeningCriteria, Optional[ScreeningChecklist], ModelMetadata]:
         raise NotImplementedError
@@ -5,17 +5,35 @@ to verify that suggested terms/concepts actually exist in academic literature.
 Helps prevent LLM hallucinations.
 """
 
+import asyncio
+import json
 import logging
+import os
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from dataclasses import dataclass
-from typing import Dict, List, Optional
+from pathlib import Path
+from typing import Dict, FrozenSet, Iterable, List, Optional, Union
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import httpx
+except ImportError:  # only needed for validate_concept_list_async / injected clients
+    httpx = None
 
 from src.utils.exceptions import NetworkError, ValidationError
 
 logger = logging.getLogger(__name__)
 
+# Transport errors from either requests or an injected httpx client
+_TIMEOUT_ERRORS = (requests.Timeout,) + ((httpx.TimeoutException,) if httpx else ())
+_REQUEST_ERRORS = (requests.RequestException,) + ((httpx.HTTPError,) if httpx else ())
+
 
 @dataclass
 class ValidationResult:
@@ -62,6 +80,28 @@ class ValidationReport:
     summary: str
 
 
+def _normalize_term(term: str) -> str:
+    """Lower-case a term and collapse internal whitespace."""
+    return " ".join(term.lower().split())
+
+
+def load_known_terms(path: Union[str, Path]) -> FrozenSet[str]:
+    """Load a known-terms list (one term per line, ``#`` starts a comment).
+
+    Args:
+        path: Text file of established terms, e.g. exported OpenAlex concepts
+
+    Returns:
+        Normalized terms, ready to pass to ``ValidationService``
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        return frozenset(
+            _normalize_term(line)
+            for line in f
+            if line.strip() and not line.lstrip().startswith("#")
+        )
+
+
 class ValidationService:
     """Validates research terms against OpenAlex API.
 
@@ -78,22 +118,90 @@ class ValidationService:
     BASE_URL = "https://api.openalex.org/works"
     TIMEOUT = 5  # seconds
     RATE_LIMIT_DELAY = 0.1  # 100ms between requests (10 req/sec)
+    MAX_WORKERS = 10  # Concurrent lookups in validate_concept_list
+    USER_AGENT = "HITL-Research-Pipeline/1.0 (mailto:research@example.com)"
+    SAMPLE_WORKS = 3  # Sample titles kept per term for reviewer context
 
     # Validation thresholds
     CRITICAL_THRESHOLD = 0  # No hits = hallucination
     WARNING_THRESHOLD = 100  # Less than 100 hits = rare term
+    KNOWN_TERM_HITS = -1  # hit_count for terms accepted from the known-terms list
 
-    def __init__(self):
-        """Initialize validation service."""
-        self._last_request_time = 0
+    def __init__(
+        self,
+        http_client=None,
+        known_terms: Optional[Iterable[str]] = None,
+        cache_path: Optional[Union[str, Path]] = None,
+        cache_ttl: float = 7 * 24 * 3600,
+    ):
+        """Initialize validation service.
+
+        Args:
+            http_client: Optional pooled ``httpx.Client`` to send OpenAlex
+                requests through (e.g. the client shared with the LLM
+                provider, so both reuse kept-alive connections). Defaults to
+                a keep-alive ``requests.Session`` owned by this service.
+            known_terms: Established terms (see ``load_known_terms``) that
+                are accepted as valid without a network lookup
+            cache_path: Optional JSON file that persists successful lookups
+                across runs, keyed by normalized term
+            cache_ttl: Seconds before a persisted lookup is fetched again
+        """
+        self.http_client = http_client
+        self._session = self._build_session() if http_client is None else None
+        self._known_terms = frozenset(_normalize_term(t) for t in known_terms or ())
+        self._next_slot = 0.0  # time.monotonic() at which the next request may go out
+        self._rate_lock = threading.Lock()
         self._cache: Dict[str, ValidationResult] = {}
 
+        # normalized term -> {"hit_count", "sample_works", "ts"}
+        self.cache_path = Path(cache_path) if cache_path is not None else None
+        self.cache_ttl = cache_ttl
+        self._store_lock = threading.Lock()
+        self._stored: Dict[str, dict] = self._load_store() if self.cache_path else {}
+        self._store_dirty = False
+        self._store_batches = 0  # open _batched_store() blocks; saving waits for the last
+
+    def _build_session(self) -> requests.Session:
+        """Create a pooled session so lookups reuse one TLS connection.
+
+        Transient statuses (429/5xx) are retried with a short backoff; the
+        final response is returned rather than raised, so it is reported
+        with its status code like any other API error.
+        """
+        session = requests.Session()
+        session.headers["User-Agent"] = self.USER_AGENT
+        adapter = HTTPAdapter(
+            pool_connections=1,
+            pool_maxsize=self.MAX_WORKERS,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.2,
+                status_forcelist=(429, 500, 502, 503, 504),
+                raise_on_status=False,
+            ),
+        )
+        session.mount("https://", adapter)
+        return session
+
+    def _reserve_request_slot(self) -> float:
+        """Reserve the next request slot and return how long to wait for it.
+
+        Thread-safe: each caller reserves a slot under the lock and waits
+        outside it, so concurrent lookups are spaced by RATE_LIMIT_DELAY
+        without serializing their network time.
+        """
+        with self._rate_lock:
+            now = time.monotonic()
+            wait = self._next_slot - now
+            self._next_slot = max(now, self._next_slot) + self.RATE_LIMIT_DELAY
+        return wait
+
     def _rate_limit(self):
         """Enforce rate limiting between requests."""
-        elapsed = time.time() - self._last_request_time
-        if elapsed < self.RATE_LIMIT_DELAY:
-            time.sleep(self.RATE_LIMIT_DELAY - elapsed)
-        self._last_request_time = time.time()
+        wait = self._reserve_request_slot()
+        if wait > 0:
+            time.sleep(wait)
 
     def validate_term(self, term: str, use_cache: bool = True) -> ValidationResult:
         """Validate a single term against OpenAlex.
@@ -113,23 +221,27 @@ class ValidationService:
             logger.debug(f"Using cached validation for: {term}")
             return self._cache[term]
 
+        known = self._known_result(term)
+        if known is not None:
+            return known
+
+        stored = self._stored_result(term) if use_cache else None
+        if stored is not None:
+            return stored
+
         # Rate limit
         self._rate_limit()
 
         try:
             # Query OpenAlex
-            # Search in title and abstract for relevance
-            params = {
-                "search": term,
-                "per_page": 5  # Get a few samples for reference
-            }
-
             logger.info(f"Validating term '{term}' against OpenAlex...")
-            response = requests.get(
+            client = self.http_client if self.http_client is not None else self._session
+            get = client.get
+            response = get(
                 self.BASE_URL,
-                params=params,
+                params=self._search_params(term),
                 timeout=self.TIMEOUT,
-                headers={"User-Agent": "HITL-Research-Pipeline/1.0 (mailto:research@example.com)"}
+                headers={"User-Agent": self.USER_AGENT}
             )
 
             if response.status_code != 200:
@@ -139,51 +251,21 @@ class ValidationService:
                     details={"term": term, "status": response.status_code}
                 )
 
-            data = response.json()
-            count = data.get('meta', {}).get('count', 0)
-
-            # Extract sample work titles for context
-            sample_works = []
-            for work in data.get('results', [])[:3]:
-                title = work.get('title', 'Untitled')
-                sample_works.append(title)
-
-            # Determine validity and severity
-            if count == self.CRITICAL_THRESHOLD:
-                severity = "critical"
-                is_valid = False
-                suggestion = f"Term '{term}' not found in literature. Check spelling or use more established terminology."
-            elif count < self.WARNING_THRESHOLD:
-                severity = "warning"
-                is_valid = True  # Valid but rare
-                suggestion = f"Rare term ({count} works). Verify this is the correct terminology for your field."
-            else:
-                severity = "ok"
-                is_valid = True
-                suggestion = None
-
-            result = ValidationResult(
-                term=term,
-                hit_count=count,
-                is_valid=is_valid,
-                severity=severity,
-                suggestion=suggestion,
-                sample_works=sample_works
-            )
+            result = self._result_from_response(term, response.json())
 
             # Cache the result
-            self._cache[term] = result
+            self._remember(term, result)
 
-            logger.info(f"Validation complete: {term} -> {count} hits ({severity})")
+            logger.info(f"Validation complete: {term} -> {result.hit_count} hits ({result.severity})")
             return result
 
-        except requests.Timeout:
+        except _TIMEOUT_ERRORS:
             logger.error(f"Timeout validating term: {term}")
             raise NetworkError(
                 f"OpenAlex API timeout for term: {term}",
                 details={"term": term, "timeout": self.TIMEOUT}
             )
-        except requests.RequestException as e:
+        except _REQUEST_ERRORS as e:
             logger.error(f"Network error validating term {term}: {e}")
             raise NetworkError(
                 f"Network error during validation: {str(e)}",
@@ -199,9 +281,174 @@ class ValidationService:
                 details={"term": term, "error": str(e)}
             )
 
+    def _known_result(self, term: str) -> Optional[ValidationResult]:
+        """Return an "ok" result if the term is on the known-terms list."""
+        if not self._known_terms or _normalize_term(term) not in self._known_terms:
+            return None
+        logger.debug(f"Known term, skipping OpenAlex lookup: {term}")
+        return ValidationResult(
+            term=term,
+            hit_count=self.KNOWN_TERM_HITS,
+            is_valid=True,
+            severity="ok",
+        )
+
+    def _search_params(self, term: str) -> Dict[str, Union[str, int]]:
+        """OpenAlex query for a term's hit count plus a few sample titles.
+
+        ``meta.count`` comes back regardless of page size, so only the sample
+        works are fetched, and ``select`` trims each one to its title instead
+        of the full work record (authorships, concepts, references, ...).
+        """
+        # Search in title and abstract for relevance
+        return {"search": term, "per_page": self.SAMPLE_WORKS, "select": "id,title"}
+
+    def _result_from_response(self, term: str, data: dict) -> ValidationResult:
+        """Classify an OpenAlex search response for a term.
+
+        Args:
+            term: The term that was searched
+            data: Parsed OpenAlex JSON response
+
+        Returns:
+            ValidationResult with hit count, severity and sample titles
+        """
+        count = data.get('meta', {}).get('count', 0)
+
+        # Extract sample work titles for context
+        sample_works = []
+        for work in data.get('results', [])[:self.SAMPLE_WORKS]:
+            title = work.get('title', 'Untitled')
+            sample_works.append(title)
+
+        return self._classify(term, count, sample_works)
+
+    def _classify(self, term: str, count: int, sample_works: List[str]) -> ValidationResult:
+        """Turn a hit count into a ValidationResult using the thresholds."""
+        # Determine validity and severity
+        if count == self.CRITICAL_THRESHOLD:
+            severity = "critical"
+            is_valid = False
+            suggestion = f"Term '{term}' not found in literature. Check spelling or use more established terminology."
+        elif count < self.WARNING_THRESHOLD:
+            severity = "warning"
+            is_valid = True  # Valid but rare
+            suggestion = f"Rare term ({count} works). Verify this is the correct terminology for your field."
+        else:
+            severity = "ok"
+            is_valid = True
+            suggestion = None
+
+        return ValidationResult(
+            term=term,
+            hit_count=count,
+            is_valid=is_valid,
+            severity=severity,
+            suggestion=suggestion,
+            sample_works=sample_works
+        )
+
+    def _stored_result(self, term: str) -> Optional[ValidationResult]:
+        """Return a fresh persisted lookup for the term, if any."""
+        entry = self._stored.get(_normalize_term(term))
+        if entry is None or time.time() - entry.get("ts", 0) > self.cache_ttl:
+            return None
+        logger.debug(f"Using persisted validation for: {term}")
+        result = self._classify(term, entry["hit_count"], entry.get("sample_works") or [])
+        self._cache[term] = result
+        return result
+
+    def _remember(self, term: str, result: ValidationResult) -> None:
+        """Cache a looked-up result in memory and, if enabled, on disk."""
+        self._cache[term] = result
+        if self.cache_path is None:
+            return
+        with self._store_lock:
+            self._stored[_normalize_term(term)] = {
+                "hit_count": result.hit_count,
+                "sample_works": result.sample_works,
+                "ts": time.time(),
+            }
+            self._store_dirty = True
+            if not self._store_batches:
+                self._save_store()
+
+    @contextmanager
+    def _batched_store(self):
+        """Defer persisting lookups until the enclosing batch finishes.
+
+        The store is rewritten once per batch instead of once per term.
+        """
+        with self._store_lock:
+            self._store_batches += 1
+        try:
+            yield
+        finally:
+            with self._store_lock:
+                self._store_batches -= 1
+                if not self._store_batches and self._store_dirty:
+                    self._save_store()
+
+    def _load_store(self) -> Dict[str, dict]:
+        if not self.cache_path.exists():
+            return {}
+        try:
+            with open(self.cache_path, "r", encoding="utf-8") as f:
+                stored = json.load(f)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable validation cache {self.cache_path}: {e}")
+            return {}
+        if not isinstance(stored, dict):
+            logger.warning(f"Ignoring malformed validation cache {self.cache_path}")
+            return {}
+        return stored
+
+    def _save_store(self) -> None:
+        """Write the store (caller holds ``_store_lock``)."""
+        if self.cache_path is None:
+            return
+        try:
+            self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+            # Write-then-rename so a crash never leaves a truncated store
+            tmp_path = self.cache_path.with_suffix(".tmp")
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(self._stored, f, ensure_ascii=False)
+            os.replace(tmp_path, self.cache_path)
+            self._store_dirty = False
+        except OSError as e:
+            logger.warning(f"Could not persist validation cache {self.cache_path}: {e}")
+
+    def validate_one(self, term: str) -> ValidationResult:
+        """Validate a single term, converting failures into a critical result.
+
+        Unlike ``validate_term`` this never raises, which makes it safe to
+        map over a thread pool.
+
+        Args:
+            term: The research term to validate
+
+        Returns:
+            ValidationResult (severity "critical" if validation failed)
+        """
+        try:
+            return self.validate_term(term)
+        except Exception as e:
+            # Log error but continue validation
+            logger.error(f"Failed to validate '{term}': {e}")
+            return ValidationResult(
+                term=term,
+                hit_count=0,
+                is_valid=False,
+                severity="critical",
+                suggestion=f"Validation error: {str(e)}"
+            )
+
     def validate_concept_list(self, concepts: List[str]) -> ValidationReport:
         """Batch validate a list of concepts.
 
+        Lookups are I/O-bound, so they run on a small thread pool (bounded
+        by MAX_WORKERS) while ``_rate_limit`` keeps the request rate polite.
+
         Args:
             concepts: List of concept/term strings to validate
 
@@ -210,52 +457,130 @@ class ValidationService:
         """
         logger.info(f"Validating {len(concepts)} concepts...")
 
-        results = {}
-        valid_count = 0
-        warning_count = 0
-        critical_count = 0
+        if concepts:
+            workers = min(self.MAX_WORKERS, len(concepts))
+            with self._batched_store(), ThreadPoolExecutor(max_workers=workers) as executor:
+                validated = list(executor.map(self.validate_one, concepts))
+        else:
+            validated = []
 
-        for concept in concepts:
-            try:
-                result = self.validate_term(concept)
-                results[concept] = result
+        report = self.build_report(dict(zip(concepts, validated)))
+
+        logger.info(f"Validation complete: {report.summary}")
+        return report
+
+    async def validate_concept_list_async(self, concepts: List[str]) -> ValidationReport:
+        """Async variant of ``validate_concept_list`` for event-loop callers.
+
+        All lookups share one ``httpx.AsyncClient`` and run concurrently,
+        bounded by MAX_WORKERS and spaced by the same rate limiter as the
+        synchronous path. Results populate the shared term cache.
+
+        Args:
+            concepts: List of concept/term strings to validate
 
-                if result.severity == "ok":
-                    valid_count += 1
-                elif result.severity == "warning":
-                    warning_count += 1
-                else:  # critical
-                    critical_count += 1
+        Returns:
+            ValidationReport with results for all terms
+        """
+        if httpx is None:
+            raise ValidationError("httpx is required for async validation. Run: pip install httpx")
+
+        logger.info(f"Validating {len(concepts)} concepts (async)...")
+
+        semaphore = asyncio.Semaphore(self.MAX_WORKERS)
+        with self._batched_store():
+            async with httpx.AsyncClient(
+                timeout=self.TIMEOUT, headers={"User-Agent": self.USER_AGENT}
+            ) as client:
+                validated = await asyncio.gather(
+                    *(self._validate_one_async(term, client, semaphore) for term in concepts)
+                )
 
+        report = self.build_report(dict(zip(concepts, validated)))
+
+        logger.info(f"Validation complete: {report.summary}")
+        return report
+
+    async def _validate_one_async(
+        self, term: str, client, semaphore: asyncio.Semaphore
+    ) -> ValidationResult:
+        """Validate one term on the event loop; failures become critical results."""
+        if term in self._cache:
+            logger.debug(f"Using cached validation for: {term}")
+            return self._cache[term]
+
+        known = self._known_result(term)
+        if known is not None:
+            return known
+
+        stored = self._stored_result(term)
+        if stored is not None:
+            return stored
+
+        async with semaphore:
+            wait = self._reserve_request_slot()
+            if wait > 0:
+                await asyncio.sleep(wait)
+
+            try:
+                logger.info(f"Validating term '{term}' against OpenAlex...")
+                response = await client.get(
+                    self.BASE_URL, params=self._search_params(term)
+                )
+                if response.status_code != 200:
+                    raise NetworkError(
+                        f"OpenAlex API error: HTTP {response.status_code}",
+                        details={"term": term, "status": response.status_code}
+                    )
+                result = self._result_from_response(term, response.json())
             except Exception as e:
-                # Log error but continue validation
-                logger.error(f"Failed to validate '{concept}': {e}")
-                results[concept] = ValidationResult(
-                    term=concept,
+                logger.error(f"Failed to validate '{term}': {e}")
+                return ValidationResult(
+                    term=term,
                     hit_count=0,
                     is_valid=False,
                     severity="critical",
                     suggestion=f"Validation error: {str(e)}"
                 )
+
+        self._remember(term, result)
+        return result
+
+    def build_report(self, results: Dict[str, ValidationResult]) -> ValidationReport:
+        """Aggregate per-term results into a ValidationReport.
+
+        Args:
+            results: Dictionary mapping terms to their validation results
+
+        Returns:
+            ValidationReport with severity counts and summary
+        """
+        valid_count = 0
+        warning_count = 0
+        critical_count = 0
+
+        for result in results.values():
+            if result.severity == "ok":
+                valid_count += 1
+            elif result.severity == "warning":
+                warning_count += 1
+            else:  # critical
                 critical_count += 1
 
         # Generate summary
         summary = self._generate_summary(
-            len(concepts), valid_count, warning_count, critical_count
+            len(results), valid_count, warning_count, critical_count
         )
 
-        report = ValidationReport(
+        return ValidationReport(
             results=results,
-            total_terms=len(concepts),
+            total_terms=len(results),
             valid_count=valid_count,
             warning_count=warning_count,
             critical_count=critical_count,
             summary=summary
         )
 
-        logger.info(f"Validation complete: {summary}")
-        return report
-
     def _generate_summary(
         self, total: int, valid: int, warning: int, critical: int
     ) -> str:
@@ -284,7 +609,12 @@ class ValidationService:
             return f"✅ All {total} terms validated successfully in academic literature."
 
     def clear_cache(self):
-        """Clear the validation cache."""
+        """Clear the validation cache (in memory and on disk)."""
         self._cache.clear()
+        with self._store_lock:
+            self._stored.clear()
+            self._store_dirty = False
+            if self.cache_path is not None and self.cache_path.exists():
+                self.cache_path.unlink()
         logger.info("Validation cache cleared")
 
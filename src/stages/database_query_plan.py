@@ -129,7 +129,7 @@ class DatabaseQueryPlanStage(BaseStage):
         )
         return plan
 
-    def _calculate_complexity(self, blocks: SearchConceptBlocks, query: DatabaseQuery) -> dict:
+    def _calculate_complexity(self, blocks: SearchConceptBlocks, query: "DatabaseQuery") -> dict:
         """Calculate query complexity metrics and provide guidance.
 
         Complexity factors:
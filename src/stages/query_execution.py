@@ -108,6 +108,7 @@ class QueryExecutionStage(BaseStage):
         warnings = []
         databases_executed = []
 
+        runnable = []
         for query in query_plan.queries:
             db_name = query.database_name.lower()
 
@@ -122,29 +123,32 @@ class QueryExecutionStage(BaseStage):
                 warnings.append(warning_msg)
                 continue
 
-            # Execute search
-            provider_key = self.SUPPORTED_DATABASES[db_name]
-            try:
-                logger.info(f"Executing search on {query.database_name}...")
-                result_summary = search_service.execute_search(
-                    database=provider_key,
-                    query=query.boolean_query_string,
-                    max_results=max_results_per_db
-                )
-
-                executed_results.append(result_summary)
-                databases_executed.append(query.database_name)
-
-                logger.info(
-                    f"Retrieved {result_summary.total_hits} results from "
-                    f"{query.database_name} (saved to {result_summary.file_path})"
-                )
+            runnable.append(query)
 
-            except Exception as e:
-                error_msg = f"Failed to execute search on {query.database_name}: {str(e)}"
-                logger.error(error_msg, exc_info=True)
-                warnings.append(error_msg)
-                continue
+        # Execute searches (databases are queried concurrently)
+        try:
+            logger.info(f"Executing {len(runnable)} searches...")
+            summaries = search_service.execute_searches(
+                [
+                    (self.SUPPORTED_DATABASES[q.database_name.lower()], q.boolean_query_string)
+                    for q in runnable
+                ],
+                max_results=max_results_per_db
+            )
+        except Exception as e:
+            error_msg = f"Failed to execute searches: {str(e)}"
+            logger.error(error_msg, exc_info=True)
+            warnings.append(error_msg)
+            summaries = []
+
+        for query, result_summary in zip(runnable, summaries):
+            executed_results.append(result_summary)
+            databases_executed.append(query.database_name)
+
+            logger.info(
+                f"Retrieved {result_summary.total_hits} results from "
+                f"{query.database_name} (saved to {result_summary.file_path})"
+            )
 
         # Handle case where no databases executed successfully
         if not executed_results:
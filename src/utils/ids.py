@@ -0,0 +1,37 @@
+"""Identifier helpers for pipeline artifacts."""
+
+import base64
+import os
+from itertools import count
+
+
+def short_id(nbytes: int = 10) -> str:
+    """Return a short random identifier (lowercase base32, no padding).
+
+    Cheaper than formatting a full ``uuid4()`` and safe for use in file
+    and directory names on case-insensitive filesystems.
+    """
+    return base64.b32encode(os.urandom(nbytes)).decode("ascii").rstrip("=").lower()
+
+
+def new_project_id() -> str:
+    """Return a new project ID: ``project_`` plus 8 lowercase hex characters.
+
+    Same format as the ``uuid4().hex[:8]`` IDs made elsewhere, which
+    ``interfaces/cli.py`` matches with ``PROJECT_ID_PATTERN``.
+    """
+    return f"project_{os.urandom(4).hex()}"
+
+
+# Per-process salt + counter for the many short-lived artifact IDs
+_PROCESS_SALT = short_id(5)
+_id_counter = count()
+
+
+def fast_id(prefix: str) -> str:
+    """Return an ID unique within this process and, via the salt, across runs.
+
+    No syscall per ID, unlike ``uuid4()``/``os.urandom``; used for concepts,
+    blocks and queries, which are created in bulk.
+    """
+    return f"{prefix}_{_PROCESS_SALT}_{next(_id_counter):x}"
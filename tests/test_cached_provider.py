@@ -0,0 +1,119 @@
+"""Unit tests for CachedProvider."""
+
+from unittest.mock import Mock
+
+from src.services.cached_provider import CachedProvider
+
+
+def _inner(response="generated"):
+    provider = Mock(spec=["generate"])
+    provider.generate.return_value = response
+    return provider
+
+
+class TestCachedProvider:
+    """Test CachedProvider functionality."""
+
+    def test_exact_hit_skips_inner_provider(self, tmp_path):
+        """Test an identical prompt is served from the cache."""
+        inner = _inner()
+        provider = CachedProvider(inner, tmp_path)
+
+        assert provider.generate("system", "user") == "generated"
+        assert provider.generate("system", "user") == "generated"
+
+        inner.generate.assert_called_once()
+        assert provider.hits == 1
+        assert provider.misses == 1
+
+    def test_system_prompt_is_part_of_key(self, tmp_path):
+        """Test the same user prompt under another persona misses."""
+        inner = _inner()
+        provider = CachedProvider(inner, tmp_path)
+
+        provider.generate("critic", "user")
+        provider.generate("methodologist", "user")
+
+        assert inner.generate.call_count == 2
+
+    def test_responses_persist(self, tmp_path):
+        """Test a new instance reuses responses stored on disk."""
+        CachedProvider(_inner(), tmp_path).generate("system", "user")
+
+        inner = _inner("other")
+        assert CachedProvider(inner, tmp_path).generate("system", "user") == "generated"
+        inner.generate.assert_not_called()
+
+    def test_semantic_tier_is_opt_in(self, tmp_path):
+        """Test near-identical prompts only hit when a threshold is set."""
+        inner = _inner()
+        exact_only = CachedProvider(inner, tmp_path / "exact")
+        exact_only.generate("system", "LLM hallucinations in clinical notes")
+        exact_only.generate("system", "LLM hallucinations in clinical notes.")
+        assert inner.generate.call_count == 2
+
+        inner = _inner()
+        semantic = CachedProvider(inner, tmp_path / "semantic", semantic_threshold=0.9)
+        semantic.generate("system", "LLM hallucinations in clinical notes")
+        semantic.generate("system", "LLM hallucinations in clinical notes.")
+        inner.generate.assert_called_once()
+
+    def test_model_settings_are_part_of_key(self, tmp_path):
+        """Test a different temperature does not reuse a cached response."""
+        CachedProvider(_inner(), tmp_path).generate("system", "user")
+
+        inner = _inner("other")
+        inner.temperature = 0.0
+        assert CachedProvider(inner, tmp_path).generate("system", "user") == "other"
+
+    def test_unparseable_json_is_not_cached(self, tmp_path):
+        """Test a truncated JSON-mode response is retried, not replayed."""
+        inner = _inner('{"title": "trunc')
+        provider = CachedProvider(inner, tmp_path)
+
+        provider.generate("system", "user", json_mode=True)
+        provider.generate("system", "user", json_mode=True)
+
+        assert inner.generate.call_count == 2
+        assert not (tmp_path / "llm_responses.jsonl").exists()
+
+    def test_discard_drops_cached_response(self, tmp_path):
+        """Test a response rejected by the caller is not served again."""
+        inner = _inner('["not", "an", "object"]')
+        provider = CachedProvider(inner, tmp_path)
+
+        provider.generate("system", "user", json_mode=True)
+        provider.discard("system", "user")
+
+        assert CachedProvider(_inner(), tmp_path).generate("system", "user") == "generated"
+        provider.generate("system", "user", json_mode=True)
+        assert inner.generate.call_count == 2
+
+    def test_json_mode_is_part_of_key(self, tmp_path):
+        """Test a free-text response is not served to a JSON-mode call."""
+        CachedProvider(_inner("plain prose"), tmp_path).generate("system", "user")
+
+        inner = _inner('{"ok": true}')
+        assert CachedProvider(inner, tmp_path).generate("system", "user", json_mode=True) == '{"ok": true}'
+        inner.generate.assert_called_once()
+
+    def test_oldest_entries_evicted(self, tmp_path):
+        """Test the cache keeps only the newest max_entries responses."""
+        provider = CachedProvider(_inner(), tmp_path, max_entries=2)
+        for prompt in ("a", "b", "c"):
+            provider.generate("system", prompt)
+
+        inner = _inner("other")
+        reloaded = CachedProvider(inner, tmp_path, max_entries=2)
+        assert reloaded.generate("system", "c") == "generated"
+        assert reloaded.generate("system", "a") == "other"
+
+    def test_log_is_compacted(self, tmp_path):
+        """Test the on-disk log stays bounded by the live entries."""
+        provider = CachedProvider(_inner(), tmp_path, max_entries=3)
+        for i in range(20):
+            provider.generate("system", f"prompt {i}")
+
+        lines = (tmp_path / "llm_responses.jsonl").read_text(encoding="utf-8").splitlines()
+        assert len(lines) <= 2 * 3
+        assert len(CachedProvider(_inner(), tmp_path, max_entries=3)._exact) == 3
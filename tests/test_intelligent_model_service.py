@@ -0,0 +1,90 @@
+"""Unit tests for IntelligentModelService (offline, with a patched provider)."""
+
+import json
+from unittest.mock import Mock, patch
+
+import pytest
+
+from interfaces.cli import PROJECT_ID_PATTERN
+from src.models import Concept, ConceptModel, ProblemFraming, ProjectContext
+from src.services import IntelligentModelService
+from src.services.cached_provider import CachedProvider
+
+
+@pytest.fixture
+def service():
+    service = IntelligentModelService()
+    service.validator = Mock()  # never reach OpenAlex
+    return service
+
+
+@pytest.fixture
+def context():
+    return ProjectContext(
+        id="project_0000abcd",
+        title="LLM hallucinations in clinical notes",
+        short_description="Measuring factual errors of LLM summaries of clinical notes.",
+        initial_keywords=["LLM", "hallucination"],
+    )
+
+
+def test_project_ids_match_cli_pattern(service):
+    """Test LLM and fallback project IDs use the format the CLI accepts."""
+    draft, _ = service.suggest_project_context("LLM hallucinations in clinical notes")
+    fallback, _ = service._fallback_project_context("idea", "Idea")
+
+    assert PROJECT_ID_PATTERN.fullmatch(draft.id)
+    assert PROJECT_ID_PATTERN.fullmatch(fallback.id)
+
+
+def _framing_with(service, context, **fields):
+    response = json.dumps({"critique_summary": "Too broad.", "feasibility_score": 6, **fields})
+    with patch.object(service.provider, "generate", return_value=response):
+        return service.generate_problem_framing(context)
+
+
+def test_null_key_concepts_falls_back(service, context):
+    """Test a framing with "key_concepts": null uses the fallback framing."""
+    framing, concepts, meta = _framing_with(service, context, key_concepts=None)
+
+    assert meta.model_name == "fallback"
+    assert concepts.concepts == []
+
+
+def test_non_string_critique_falls_back(service, context):
+    """Test a non-string critique_summary uses the fallback framing."""
+    framing, _, meta = _framing_with(service, context, critique_summary=3, key_concepts=[])
+
+    assert meta.model_name == "fallback"
+    assert framing.problem_statement == f"Investigate {context.title}"
+
+
+def test_rejected_reply_not_replayed_from_cache(service, tmp_path):
+    """Test a parsed but unusable Stage 2 reply is retried on the next run."""
+    inner = service.provider
+    service.provider = CachedProvider(inner, tmp_path)
+    framing = ProblemFraming(project_id="project_0000abcd", problem_statement="x", goals=["g"])
+    concepts = ConceptModel(project_id="project_0000abcd", concepts=[])
+
+    with patch.object(inner, "generate", return_value='{"questions": []}') as generate:
+        service.generate_research_questions(framing, concepts)
+        service._stage_cache.clear()
+        _, meta = service.generate_research_questions(framing, concepts)
+
+    assert meta.mode == "fallback-heuristic"
+    assert generate.call_count == 2
+
+
+def test_non_string_concept_fields_reach_llm(service):
+    """Test a concept with a list description still gets LLM questions."""
+    framing = ProblemFraming(project_id="project_0000abcd", problem_statement="x", goals=["g"])
+    concepts = ConceptModel(project_id="project_0000abcd", concepts=[
+        Concept(id="concept_1", label="LLM", description=["model", "AI"], type="Intervention"),
+    ])
+
+    reply = '{"questions": [{"text": "How often do LLMs hallucinate?"}]}'
+    with patch.object(service.provider, "generate", return_value=reply) as generate:
+        _, meta = service.generate_research_questions(framing, concepts)
+
+    generate.assert_called_once()
+    assert meta.mode == "generation"
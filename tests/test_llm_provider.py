@@ -8,7 +8,8 @@ from src.services.llm_provider import (
     LLMProvider,
     MockProvider,
     OpenAIProvider,
-    get_llm_provider
+    get_llm_provider,
+    _retry_after
 )
 from src.utils.exceptions import (
     LLMProviderError,
@@ -77,6 +78,50 @@ class TestMockProvider:
         assert "goals" in data
         assert "key_concepts" in data
 
+    def test_generate_context_and_critique(self):
+        """Test generating fused Stage 0 context and critique."""
+        from src.services.prompts import PROMPT_STAGE0_AND_CRITIQUE
+
+        provider = MockProvider()
+
+        response = provider.generate(
+            "You are a methodologist",
+            PROMPT_STAGE0_AND_CRITIQUE.format(raw_idea="LLM hallucinations")
+        )
+
+        data = json.loads(response)
+        assert "title" in data["context"]
+        assert "feasibility_score" in data["critique"]
+
+    def test_generate_fused_framing(self):
+        """Test generating fused Stage 1 critique and refinement."""
+        from src.services.prompts import PROMPT_STAGE1_FUSED
+
+        provider = MockProvider()
+
+        response = provider.generate(
+            "You are a methodologist",
+            PROMPT_STAGE1_FUSED.format(title="T", description="D")
+        )
+
+        data = json.loads(response)
+        assert "feasibility_score" in data
+        assert "key_concepts" in data
+
+    def test_generate_batch_preserves_order(self):
+        """Test batched generation returns one response per prompt, in order."""
+        provider = MockProvider()
+
+        responses = provider.generate_batch(
+            "You are a methodologist",
+            ["Critique this project", "Refine based on critique", "Critique this project"]
+        )
+
+        assert len(responses) == 3
+        assert "critique_summary" in json.loads(responses[0])
+        assert "problem_statement" in json.loads(responses[1])
+        assert responses[2] == responses[0]
+
     def test_clean_json_response(self):
         """Test JSON cleaning."""
         provider = MockProvider()
@@ -91,6 +136,20 @@ class TestMockProvider:
         cleaned = provider.clean_json_response(response)
         assert cleaned == {"test": "value"}
 
+    def test_clean_json_response_with_prose(self):
+        """Test JSON is extracted from a fenced block surrounded by prose."""
+        provider = MockProvider()
+
+        response = 'Here is the result:\n```JSON\n{"test": "value"}\n```\nLet me know!'
+        assert provider.clean_json_response(response) == {"test": "value"}
+
+    def test_clean_json_response_backticks_in_value(self):
+        """Test bare JSON is parsed as-is even if a value contains a fence."""
+        provider = MockProvider()
+
+        response = '  {"query": "use ```code``` here"}\n'
+        assert provider.clean_json_response(response) == {"query": "use ```code``` here"}
+
     def test_clean_json_invalid(self):
         """Test JSON cleaning with invalid JSON."""
         provider = MockProvider()
@@ -98,6 +157,38 @@ class TestMockProvider:
         with pytest.raises(LLMProviderError):
             provider.clean_json_response("not json at all")
 
+    # (system prompt, task prompt) as sent by the pipeline -> canned reply
+    @pytest.mark.parametrize("system_name, prompt_name, reply_name", [
+        ("SYSTEM_PROMPT_METHODOLOGIST", "PROMPT_STAGE0_CONTEXT", "_MOCK_PROJECT_CONTEXT_JSON"),
+        ("SYSTEM_PROMPT_METHODOLOGIST", "PROMPT_STAGE0_AND_CRITIQUE", "_MOCK_CONTEXT_AND_CRITIQUE_JSON"),
+        ("SYSTEM_PROMPT_CRITIC", "PROMPT_STAGE1_CRITIQUE", "_MOCK_PROJECT_CONTEXT_JSON"),
+        ("SYSTEM_PROMPT_METHODOLOGIST", "PROMPT_STAGE1_REFINE", "_MOCK_REFINED_FRAMING_JSON"),
+        ("SYSTEM_PROMPT_METHODOLOGIST", "PROMPT_STAGE1_FUSED", "_MOCK_FUSED_FRAMING_JSON"),
+        ("SYSTEM_PROMPT_METHODOLOGIST", "PROMPT_STAGE2_RESEARCH_QUESTIONS", "_MOCK_REFINED_FRAMING_JSON"),
+        ("SYSTEM_PROMPT_LIBRARIAN", "PROMPT_STAGE3_SEARCH_EXPANSION", None),
+        ("SYSTEM_PROMPT_LIBRARIAN", "PROMPT_STAGE4_QUERY_GENERATION", "_MOCK_STRATEGY_HALLUCINATION_JSON"),
+        ("SYSTEM_PROMPT_METHODOLOGIST", "PROMPT_VALIDATE_TERM", "_MOCK_DEFAULT_JSON"),
+    ])
+    def test_prompt_templates_dispatch(self, system_name, prompt_name, reply_name):
+        """Test which canned reply each prompt template receives."""
+        from src.services import llm_provider, prompts
+
+        response = MockProvider().generate(
+            getattr(prompts, system_name), getattr(prompts, prompt_name)
+        )
+
+        if reply_name is None:  # generic search strategy built from the prompt
+            assert json.loads(response)["databases"] == ["openalex"]
+        else:
+            assert response == getattr(llm_provider, reply_name)
+
+    def test_single_prompt_markers_stay_in_their_prompt(self):
+        """Test user-only and system-only markers are not matched elsewhere."""
+        provider = MockProvider()
+
+        assert provider.generate("Start from the raw idea", "Anything") != provider.generate("", "raw idea")
+        assert provider.generate("", "Report to your supervisor") == provider.generate("", "Anything")
+
 
 class TestOpenAIProvider:
     """Test OpenAIProvider functionality."""
@@ -156,6 +247,41 @@ class TestOpenAIProvider:
                 assert result == "Generated text"
                 mock_client.chat.completions.create.assert_called_once()
 
+    @pytest.mark.skipif(not HAS_OPENAI, reason="openai package not installed")
+    def test_generate_json_mode(self):
+        """Test json_mode requests a JSON-object response format."""
+        with patch('src.services.llm_provider.get_config') as mock_config:
+            config = Mock()
+            config.llm.openai_api_key = "sk-test-key"
+            config.llm.openai_base_url = None
+            config.llm.max_retries = 3
+            config.llm.timeout = 30
+            mock_config.return_value = config
+
+            with patch('openai.OpenAI') as mock_openai_class:
+                mock_client = mock_openai_class.return_value
+                mock_client.chat.completions.create.return_value = Mock(
+                    choices=[Mock(message=Mock(content='{"ok": true}'))]
+                )
+
+                provider = OpenAIProvider()
+                provider.generate("system", "Respond in JSON", json_mode=True)
+                provider.generate("system", "plain text")
+
+        json_call, text_call = mock_client.chat.completions.create.call_args_list
+        assert json_call.kwargs["response_format"] == {"type": "json_object"}
+        assert "response_format" not in text_call.kwargs
+
+    def test_rate_limit_retry_after_from_headers(self):
+        """Test Retry-After is taken from the API response when present."""
+        error = Exception("429")
+        error.response = Mock(headers={"retry-after": "7"})
+        assert _retry_after(error) == 7.0
+
+        error.response = Mock(headers={"retry-after": "Wed, 21 Oct 2026 07:28:00 GMT"})
+        assert _retry_after(error) == 20.0
+        assert _retry_after(Exception("no response")) == 20.0
+
 
 class TestGetLLMProvider:
     """Test provider factory function."""
@@ -187,14 +313,61 @@ class TestGetLLMProvider:
                 provider = get_llm_provider()
                 assert isinstance(provider, OpenAIProvider)
 
-    def test_get_cached_provider_fallback(self):
-        """Test cached provider falls back to mock."""
-        with patch('src.config.get_config') as mock_config:
+    def test_get_cached_provider(self, tmp_path):
+        """Test cached provider wraps the OpenAI provider."""
+        from src.services.cached_provider import CachedProvider
+
+        with patch('src.services.llm_provider.get_config') as mock_config:
             config = Mock()
             config.llm.provider = ProviderEnum.CACHED
+            config.llm.cache_dir = tmp_path
+            config.llm.response_semantic_threshold = None
+            mock_config.return_value = config
+
+            with patch('src.services.llm_provider.OpenAIProvider') as mock_openai_provider:
+                provider = get_llm_provider()
+
+            assert isinstance(provider, CachedProvider)
+            assert provider.provider is mock_openai_provider.return_value
+
+    def test_provider_reused_per_config(self):
+        """Test the provider is built once per config object."""
+        with patch('src.services.llm_provider.get_config') as mock_config:
+            config = Mock()
+            config.llm.provider = ProviderEnum.MOCK
             mock_config.return_value = config
 
             provider = get_llm_provider()
-            # Should fall back to Mock since Cached not implemented
-            assert isinstance(provider, MockProvider)
+            assert get_llm_provider() is provider
+
+            reloaded = Mock()
+            reloaded.llm.provider = ProviderEnum.MOCK
+            mock_config.return_value = reloaded
+            assert get_llm_provider() is not provider
+
+
+class TestSharedHttpClient:
+    """Test the pooled HTTP client shared by LLM providers."""
+
+    def test_client_is_reused(self):
+        """Test repeated calls return the same pooled client."""
+        from src.services.llm_provider import get_http_client
+
+        client = get_http_client()
+        if client is None:
+            pytest.skip("httpx not installed")
+
+        assert get_http_client() is client
+
+
+class TestPromptCacheKey:
+    """Test prompt-cache routing keys."""
+
+    def test_key_is_stable_per_system_prompt(self):
+        """Same persona maps to the same key; different personas differ."""
+        from src.services.llm_provider import _prompt_cache_key
+        from src.services.prompts import SYSTEM_PROMPT_METHODOLOGIST, SYSTEM_PROMPT_CRITIC
 
+        key = _prompt_cache_key(SYSTEM_PROMPT_METHODOLOGIST)
+        assert key == _prompt_cache_key(SYSTEM_PROMPT_METHODOLOGIST)
+        assert key != _prompt_cache_key(SYSTEM_PROMPT_CRITIC)
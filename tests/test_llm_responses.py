@@ -0,0 +1,41 @@
+"""Unit tests for typed LLM response models."""
+
+import pytest
+from pydantic import ValidationError
+
+from src.services.llm_responses import Stage0Response, QuestionItem, BlockItem
+
+
+class TestStage0Response:
+    """Test Stage 0 response parsing."""
+
+    def test_defaults_fill_missing_keys(self):
+        """Test omitted keys take the documented defaults."""
+        parsed = Stage0Response.model_validate({"discipline": "Medicine", "extra": 1})
+
+        assert parsed.title == "Untitled Research Project"
+        assert parsed.short_description is None
+        assert parsed.discipline == "Medicine"
+        assert parsed.initial_keywords == []
+        assert parsed.constraints == {}
+
+    def test_wrong_type_rejected(self):
+        """Test a malformed field raises so callers can fall back."""
+        with pytest.raises(ValidationError):
+            Stage0Response.model_validate({"initial_keywords": "not a list"})
+
+
+class TestItems:
+    """Test Stage 2/3 item parsing."""
+
+    def test_question_defaults(self):
+        """Test a sparse question gets default type and priority."""
+        q = QuestionItem.model_validate({"text": "Why?"})
+        assert q.type == "descriptive"
+        assert q.priority == "must_have"
+        assert q.linked_concepts == []
+
+    def test_block_rejects_non_object(self):
+        """Test non-object entries are rejected."""
+        with pytest.raises(ValidationError):
+            BlockItem.model_validate("just a string")
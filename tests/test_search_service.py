@@ -0,0 +1,248 @@
+"""Unit tests for SearchService (offline, with stub providers)."""
+
+import json
+from pathlib import Path
+
+import pytest
+
+from src.services.search_service import SearchService
+from src.slr.core.models import Author, Document, ExternalIds
+
+
+class StubProvider:
+    """Yields canned documents, optionally failing part way."""
+
+    def __init__(self, count, fail_after=None):
+        self.count = count
+        self.fail_after = fail_after
+
+    def search(self, query):
+        for i in range(self.count):
+            if self.fail_after is not None and i == self.fail_after:
+                raise RuntimeError("connection reset")
+            yield Document(
+                title=f"Paper {i}",
+                year=2020 + i,
+                provider="openalex",
+                provider_id=f"W{i}",
+                external_ids=ExternalIds(doi=f"10.1000/{i}"),
+                authors=[Author(family_name="Doe", given_name="Jane")],
+            )
+
+
+@pytest.fixture
+def service(tmp_path):
+    return SearchService(base_dir=str(tmp_path))
+
+
+def test_execute_search_streams_results_to_disk(service):
+    """Test results are written incrementally and load back as dicts."""
+    service._provider_instances["openalex"] = StubProvider(5)
+
+    summary = service.execute_search("openalex", "llm hallucination", max_results=3)
+
+    assert summary.error is None
+    assert summary.total_hits == 3
+    with open(summary.result_file, encoding="utf-8") as f:
+        data = json.load(f)
+    assert data["metadata"]["total_results"] == 3
+    assert data["metadata"]["database"] == "openalex"
+    assert [d["title"] for d in service.load_results(summary.result_file)] == [
+        "Paper 0", "Paper 1", "Paper 2"
+    ]
+
+
+def test_execute_search_closes_provider_stream_at_limit(service):
+    """Test the provider generator is closed once max_results is reached."""
+    closed = []
+
+    class PagingProvider(StubProvider):
+        def search(self, query):
+            try:
+                yield from super().search(query)
+            finally:
+                closed.append(True)
+
+    service._provider_instances["openalex"] = PagingProvider(10, fail_after=3)
+
+    summary = service.execute_search("openalex", "q", max_results=3, save_to_disk=False)
+
+    assert summary.error is None
+    assert summary.total_hits == 3
+    assert closed == [True]
+
+
+def test_failed_search_leaves_no_partial_file(service):
+    """Test a provider error mid-stream discards the partial results file."""
+    service._provider_instances["openalex"] = StubProvider(5, fail_after=2)
+
+    summary = service.execute_search("openalex", "llm hallucination")
+
+    assert summary.error == "connection reset"
+    assert summary.result_file is None
+    assert list(service.results_dir.iterdir()) == []
+
+
+def test_execute_searches_preserves_input_order(service):
+    """Test concurrent searches return one summary per input pair, in order."""
+    service._provider_instances["openalex"] = StubProvider(2)
+    service._provider_instances["arxiv"] = StubProvider(1)
+
+    summaries = service.execute_searches(
+        [("openalex", "q1"), ("arxiv", "q2"), ("openalex", "q3")],
+        save_to_disk=False,
+    )
+
+    assert [(s.database, s.query, s.total_hits) for s in summaries] == [
+        ("openalex", "q1", 2), ("arxiv", "q2", 1), ("openalex", "q3", 2)
+    ]
+
+
+def test_execute_searches_per_search_limit(service):
+    """Test a third tuple element overrides max_results for that search only."""
+    service._provider_instances["openalex"] = StubProvider(5)
+    service._provider_instances["arxiv"] = StubProvider(5)
+
+    summaries = service.execute_searches(
+        [("openalex", "q1", 1), ("arxiv", "q2")], max_results=3, save_to_disk=False
+    )
+
+    assert [s.total_hits for s in summaries] == [1, 3]
+
+
+def test_deduplicate_results_skips_untitled_rows(service):
+    """Test dedup merges shared DOIs and drops rows that can't be rebuilt."""
+    service._provider_instances["openalex"] = StubProvider(3)
+    service._provider_instances["arxiv"] = StubProvider(2)
+    first = service.execute_search("openalex", "q1").result_file
+    second = service.execute_search("arxiv", "q2").result_file
+
+    with open(second, encoding="utf-8") as f:
+        data = json.load(f)
+    data["documents"].append({"abstract": "no title"})
+    with open(second, "w", encoding="utf-8") as f:
+        json.dump(data, f)
+
+    unique = service.deduplicate_results([first, second])
+
+    assert sorted(d["doi"] for d in unique) == ["10.1000/0", "10.1000/1", "10.1000/2"]
+
+
+def test_repeated_dedup_served_from_cache(service, monkeypatch):
+    """Test deduplicating unchanged files again skips clustering."""
+    service._provider_instances["openalex"] = StubProvider(3)
+    service._provider_instances["arxiv"] = StubProvider(2)
+    files = [service.execute_search("openalex", "q1").result_file,
+             service.execute_search("arxiv", "q2").result_file]
+    first = service.deduplicate_results(files)
+
+    def fail(*args, **kwargs):
+        raise AssertionError("clustering should not run on a cache hit")
+
+    monkeypatch.setattr(service.deduplicator, "deduplicate", fail)
+    assert service.deduplicate_results(files) == first
+
+
+def test_repeated_search_served_from_cache(service):
+    """Test identical searches reuse the cached result file until invalidated."""
+    provider = StubProvider(2)
+    service._provider_instances["openalex"] = provider
+    first = service.execute_search("openalex", "llm hallucination")
+
+    provider.fail_after = 0  # any real call would now error
+    second = service.execute_search("openalex", "llm hallucination")
+
+    assert second.error is None
+    assert second.total_hits == 2
+    assert service.load_results(second.result_file) == service.load_results(first.result_file)
+
+    assert service.invalidate_cache(database="arxiv") == 0
+    assert service.invalidate_cache(database="openalex") == 1
+    assert service.execute_search("openalex", "llm hallucination").error == "connection reset"
+
+
+def test_cache_hit_survives_invalidation(service):
+    """Test a cached result file stays loadable after the cache is dropped."""
+    service._provider_instances["openalex"] = StubProvider(2)
+    first = service.execute_search("openalex", "llm hallucination")
+    Path(first.result_file).unlink()
+
+    second = service.execute_search("openalex", "llm hallucination")
+    assert "_cache" not in Path(second.result_file).parts
+
+    service.invalidate_cache()
+    assert len(service.load_results(second.result_file)) == 2
+
+
+def test_cache_hit_without_saving_writes_nothing(service):
+    """Test a cache hit with save_to_disk=False returns no result file."""
+    service._provider_instances["openalex"] = StubProvider(2)
+    service.execute_search("openalex", "llm hallucination")
+    before = sorted(service.results_dir.glob("*.json"))
+
+    summary = service.execute_search("openalex", "llm hallucination", save_to_disk=False)
+
+    assert (summary.total_hits, summary.result_file) == (2, None)
+    assert sorted(service.results_dir.glob("*.json")) == before
+
+
+def test_providers_shared_across_services(service, tmp_path):
+    """Test separately constructed services reuse the same provider instance."""
+    other = SearchService(base_dir=str(tmp_path / "other"))
+
+    assert other._get_provider("crossref") is service._get_provider("crossref")
+
+
+def test_result_filenames_are_sanitized(service):
+    """Test query characters unsafe in file names are replaced."""
+    service._provider_instances["openalex"] = StubProvider(1)
+
+    summary = service.execute_search("openalex", 'title:"llm" OR a/b?')
+
+    name = summary.result_file.rsplit("/", 1)[-1]
+    assert name.startswith('openalex_title__llm__OR_a_b__')
+
+
+def test_export_results_jsonl_from_dicts(service, tmp_path):
+    """Test exporting stored result dicts to JSONL."""
+    service._provider_instances["openalex"] = StubProvider(2)
+    papers = service.load_results(service.execute_search("openalex", "q").result_file)
+    output = tmp_path / "papers.jsonl"
+
+    service.export_results(papers, "jsonl", str(output))
+
+    lines = output.read_text(encoding="utf-8").splitlines()
+    assert [json.loads(line)["title"] for line in lines] == ["Paper 0", "Paper 1"]
+    with pytest.raises(ValueError, match="Unsupported format"):
+        service.export_results(papers, "xml", str(tmp_path / "papers.xml"))
+
+
+def test_dedup_doi_prepass_keeps_richest_row(service, tmp_path):
+    """Test shared-DOI rows collapse to the most complete record."""
+    def write(name, documents):
+        path = tmp_path / name
+        path.write_text(json.dumps({"documents": documents}), encoding="utf-8")
+        return str(path)
+
+    sparse = {"title": "LLM Hallucination", "doi": "10.1/x", "provider": "arxiv"}
+    rich = {"title": "LLM hallucination.", "doi": "https://doi.org/10.1/X",
+            "abstract": "We measure...", "provider": "crossref"}
+    other = {"title": "Unrelated", "provider": "openalex"}
+
+    unique = service.deduplicate_results([write("a.json", [sparse, other]), write("b.json", [rich])])
+
+    assert [d["title"] for d in unique] == ["LLM hallucination.", "Unrelated"]
+    assert unique[0]["abstract"] == "We measure..."
+
+
+def test_load_results_summary_reads_metadata_only(service):
+    """Test the summary comes from the metadata block for both file layouts."""
+    service._provider_instances["openalex"] = StubProvider(3)
+    result_file = service.execute_search("openalex", "q").result_file
+
+    summary = service.load_results_summary(result_file)
+    assert summary["total_results"] == 3
+    assert summary["query"] == "q"
+
+    deduplicated = service.save_deduplicated_results(service.load_results(result_file), ["openalex"])
+    assert service.load_results_summary(deduplicated)["total_documents"] == 3
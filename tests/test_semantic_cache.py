@@ -0,0 +1,43 @@
+"""Unit tests for SemanticCache."""
+
+from src.services.semantic_cache import SemanticCache, _hashed_bow_embedding
+
+
+class TestSemanticCache:
+    """Test SemanticCache functionality."""
+
+    def test_miss_on_empty_cache(self, tmp_path):
+        """Test lookup on an empty cache returns None."""
+        cache = SemanticCache(tmp_path, embedder=_hashed_bow_embedding)
+        assert cache.lookup("anything") is None
+
+    def test_near_duplicate_hit(self, tmp_path):
+        """Test lightly edited text returns the cached payload."""
+        cache = SemanticCache(tmp_path, threshold=0.9, embedder=_hashed_bow_embedding)
+        cache.add("LLM hallucinations in clinical decision support", {"title": "A"})
+
+        assert cache.lookup("LLM hallucinations in clinical decision support!") == {"title": "A"}
+
+    def test_unrelated_text_misses(self, tmp_path):
+        """Test unrelated text does not hit."""
+        cache = SemanticCache(tmp_path, threshold=0.9, embedder=_hashed_bow_embedding)
+        cache.add("LLM hallucinations in clinical decision support", {"title": "A"})
+
+        assert cache.lookup("Soil microbiome diversity in arid regions") is None
+
+    def test_entries_persist(self, tmp_path):
+        """Test entries are reloaded by a new instance."""
+        SemanticCache(tmp_path, embedder=_hashed_bow_embedding).add("idea", {"title": "A"})
+
+        reloaded = SemanticCache(tmp_path, embedder=_hashed_bow_embedding)
+        assert len(reloaded) == 1
+        assert reloaded.lookup("idea") == {"title": "A"}
+
+    def test_lookup_returns_copy(self, tmp_path):
+        """Test mutating a returned payload does not change the cache."""
+        cache = SemanticCache(tmp_path, embedder=_hashed_bow_embedding)
+        cache.add("idea", {"keywords": ["a"]})
+
+        cache.lookup("idea")["keywords"].append("b")
+
+        assert cache.lookup("idea") == {"keywords": ["a"]}
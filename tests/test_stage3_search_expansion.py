@@ -66,3 +66,6 @@ def test_search_expansion_terms_quality(controller):
         # Should have at least the base term
         assert len(terms_lower) >= 1
 
+        # Deduplicated in a stable order, starting from the concept label
+        assert block.terms_included[0] == block.label
+        assert len(set(block.terms_included)) == len(block.terms_included)
@@ -209,3 +209,28 @@ def test_complexity_analysis_present(controller):
         assert "total_terms" in query.complexity_analysis
 
 
+
+
+def test_query_plan_round_trip_restores_dataclasses(tmp_path):
+    """Test loaded plans rebuild nested queries from field annotations."""
+    from src.models import DatabaseQuery, ModelMetadata
+
+    persistence = FilePersistenceService(base_dir=str(tmp_path))
+    plan = DatabaseQueryPlan(
+        project_id="p1",
+        queries=[DatabaseQuery(
+            id="q1",
+            database_name="pubmed",
+            boolean_query_string="aspirin",
+            complexity_analysis={"note": "2024-01-01T00:00 is not a date field"},
+        )],
+        status=ApprovalStatus.APPROVED,
+        model_metadata=ModelMetadata(model_name="m", mode="llm"),
+    )
+    persistence.save_artifact(plan, "p1", "DatabaseQueryPlan")
+
+    loaded = persistence.load_artifact("DatabaseQueryPlan", "p1", DatabaseQueryPlan)
+
+    assert loaded == plan
+    assert isinstance(loaded.queries[0], DatabaseQuery)
+    assert isinstance(loaded.model_metadata, ModelMetadata)
@@ -89,6 +89,11 @@ class TestSyntaxEngine:
         with pytest.raises(ValueError, match="Unknown database"):
             get_builder("google_scholar")
 
+    def test_factory_reuses_builders(self):
+        """Test builders are cached per database, case-insensitively."""
+        assert get_builder("pubmed") is get_builder("PubMed")
+        assert get_builder("pubmed") is not get_builder("scopus")
+
     def test_empty_plan(self):
         """Test handling of empty query plan."""
         empty_plan = QueryPlan()
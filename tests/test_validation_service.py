@@ -7,7 +7,8 @@ import requests
 from src.services.validation_service import (
     ValidationService,
     ValidationResult,
-    ValidationReport
+    ValidationReport,
+    load_known_terms
 )
 from src.utils.exceptions import NetworkError, ValidationError
 
@@ -21,7 +22,7 @@ class TestValidationService:
         assert service is not None
         assert service._cache == {}
 
-    @patch('src.services.validation_service.requests.get')
+    @patch('src.services.validation_service.requests.Session.get')
     def test_validate_term_success(self, mock_get):
         """Test successful term validation."""
         # Mock OpenAlex response
@@ -45,8 +46,10 @@ class TestValidationService:
         assert result.is_valid is True
         assert result.severity == "ok"
         assert len(result.sample_works) == 3
+        params = mock_get.call_args.kwargs['params']
+        assert (params['per_page'], params['select']) == (3, "id,title")
 
-    @patch('src.services.validation_service.requests.get')
+    @patch('src.services.validation_service.requests.Session.get')
     def test_validate_term_hallucination(self, mock_get):
         """Test validation of hallucinated term (0 hits)."""
         mock_response = Mock()
@@ -65,7 +68,7 @@ class TestValidationService:
         assert result.severity == "critical"
         assert "not found" in result.suggestion.lower()
 
-    @patch('src.services.validation_service.requests.get')
+    @patch('src.services.validation_service.requests.Session.get')
     def test_validate_term_rare(self, mock_get):
         """Test validation of rare term (< 100 hits)."""
         mock_response = Mock()
@@ -84,7 +87,7 @@ class TestValidationService:
         assert result.severity == "warning"
         assert "rare" in result.suggestion.lower()
 
-    @patch('src.services.validation_service.requests.get')
+    @patch('src.services.validation_service.requests.Session.get')
     def test_validate_term_caching(self, mock_get):
         """Test result caching."""
         mock_response = Mock()
@@ -107,7 +110,7 @@ class TestValidationService:
 
         assert result1.hit_count == result2.hit_count
 
-    @patch('src.services.validation_service.requests.get')
+    @patch('src.services.validation_service.requests.Session.get')
     def test_validate_term_api_error(self, mock_get):
         """Test handling of API errors."""
         mock_response = Mock()
@@ -119,7 +122,7 @@ class TestValidationService:
         with pytest.raises(NetworkError):
             service.validate_term("test")
 
-    @patch('src.services.validation_service.requests.get')
+    @patch('src.services.validation_service.requests.Session.get')
     def test_validate_term_timeout(self, mock_get):
         """Test handling of timeouts."""
         mock_get.side_effect = requests.Timeout("Connection timeout")
@@ -129,7 +132,19 @@ class TestValidationService:
         with pytest.raises(NetworkError):
             service.validate_term("test")
 
-    @patch('src.services.validation_service.requests.get')
+    @patch('src.services.validation_service.requests.Session.get')
+    def test_validate_one_converts_errors(self, mock_get):
+        """Test validate_one returns a critical result instead of raising."""
+        mock_get.side_effect = requests.Timeout("Connection timeout")
+
+        service = ValidationService()
+        result = service.validate_one("test")
+
+        assert result.severity == "critical"
+        assert result.is_valid is False
+        assert "Validation error" in result.suggestion
+
+    @patch('src.services.validation_service.requests.Session.get')
     def test_validate_concept_list(self, mock_get):
         """Test batch validation."""
         # Mock different responses for different terms
@@ -162,6 +177,159 @@ class TestValidationService:
         assert report.critical_count == 1  # "hallucinated term"
         assert len(report.results) == 3
 
+    def test_validate_concept_list_async(self):
+        """Test async batch validation against a mocked transport."""
+        httpx = pytest.importorskip("httpx")
+        import asyncio
+
+        counts = {"valid term": 1000, "rare term": 50}
+
+        def handler(request):
+            term = request.url.params["search"]
+            return httpx.Response(200, json={"meta": {"count": counts.get(term, 0)}, "results": []})
+
+        real_client = httpx.AsyncClient
+
+        def mock_client(**kwargs):
+            return real_client(transport=httpx.MockTransport(handler), **kwargs)
+
+        service = ValidationService()
+        with patch('src.services.validation_service.httpx.AsyncClient', mock_client):
+            report = asyncio.run(service.validate_concept_list_async([
+                "valid term",
+                "rare term",
+                "hallucinated term"
+            ]))
+
+        assert report.total_terms == 3
+        assert report.valid_count == 1
+        assert report.warning_count == 1
+        assert report.critical_count == 1
+        assert service._cache["valid term"].hit_count == 1000
+
+    def test_lookups_share_pooled_session(self):
+        """Test sequential lookups reuse the service's keep-alive session."""
+        service = ValidationService()
+        sessions = []
+
+        def fake_get(session, url, **kwargs):
+            sessions.append(session)
+            response = Mock(status_code=200)
+            response.json.return_value = {"meta": {"count": 1000}, "results": []}
+            return response
+
+        with patch.object(requests.Session, "get", autospec=True, side_effect=fake_get):
+            service.validate_term("machine learning")
+            service.validate_term("deep learning")
+
+        assert sessions == [service._session, service._session]
+        assert service._session.headers["User-Agent"] == ValidationService.USER_AGENT
+
+    @patch('src.services.validation_service.requests.Session.get')
+    def test_persisted_cache_survives_restart(self, mock_get, tmp_path):
+        """Test lookups persisted to disk are reused by a new service until stale."""
+        mock_response = Mock(status_code=200)
+        mock_response.json.return_value = {'meta': {'count': 42}, 'results': [{'title': 'A'}]}
+        mock_get.return_value = mock_response
+        cache_path = tmp_path / "openalex.json"
+
+        ValidationService(cache_path=cache_path).validate_term("Rare  Term")
+
+        restarted = ValidationService(cache_path=cache_path)
+        result = restarted.validate_term("rare term")
+        assert mock_get.call_count == 1
+        assert (result.hit_count, result.severity, result.sample_works) == (42, "warning", ["A"])
+
+        stale = ValidationService(cache_path=cache_path, cache_ttl=-1)
+        stale.validate_term("rare term")
+        assert mock_get.call_count == 2
+
+        stale.clear_cache()
+        assert not cache_path.exists()
+
+    @patch('src.services.validation_service.requests.Session.get')
+    def test_batch_persists_store_once(self, mock_get, tmp_path):
+        """Test a batch rewrites the persisted store once, not per term."""
+        mock_response = Mock(status_code=200)
+        mock_response.json.return_value = {'meta': {'count': 500}, 'results': []}
+        mock_get.return_value = mock_response
+        cache_path = tmp_path / "openalex.json"
+        service = ValidationService(cache_path=cache_path)
+
+        with patch.object(service, "_save_store", wraps=service._save_store) as save:
+            service.validate_concept_list(["term a", "term b", "term c"])
+
+        save.assert_called_once()
+        assert len(ValidationService(cache_path=cache_path)._stored) == 3
+
+    def test_malformed_store_is_ignored(self, tmp_path):
+        """Test a persisted store that is not a JSON object is discarded."""
+        cache_path = tmp_path / "openalex.json"
+        cache_path.write_text('["not", "a", "store"]', encoding="utf-8")
+
+        assert ValidationService(cache_path=cache_path)._stored == {}
+
+    def test_request_slots_spaced_on_monotonic_clock(self):
+        """Test back-to-back reservations queue up RATE_LIMIT_DELAY apart."""
+        service = ValidationService()
+        delay = ValidationService.RATE_LIMIT_DELAY
+
+        with patch('src.services.validation_service.time.monotonic', return_value=100.0):
+            waits = [service._reserve_request_slot() for _ in range(3)]
+
+        assert waits[0] <= 0
+        assert waits[1:] == pytest.approx([delay, 2 * delay])
+
+    def test_validate_term_uses_injected_client(self):
+        """Test lookups go through an injected httpx client when given."""
+        httpx = pytest.importorskip("httpx")
+        seen = []
+
+        def handler(request):
+            seen.append(request.url.params["search"])
+            return httpx.Response(200, json={"meta": {"count": 1000}, "results": []})
+
+        client = httpx.Client(transport=httpx.MockTransport(handler))
+        service = ValidationService(http_client=client)
+
+        with patch('src.services.validation_service.requests.Session.get') as mock_get:
+            result = service.validate_term("machine learning")
+
+        mock_get.assert_not_called()
+        assert seen == ["machine learning"]
+        assert result.hit_count == 1000
+
+    def test_injected_client_timeout(self):
+        """Test httpx timeouts surface as NetworkError."""
+        httpx = pytest.importorskip("httpx")
+
+        def handler(request):
+            raise httpx.ReadTimeout("timed out", request=request)
+
+        client = httpx.Client(transport=httpx.MockTransport(handler))
+        service = ValidationService(http_client=client)
+
+        with pytest.raises(NetworkError):
+            service.validate_term("test")
+
+    @patch('src.services.validation_service.requests.Session.get')
+    def test_known_terms_skip_lookup(self, mock_get):
+        """Test known terms are accepted without calling OpenAlex."""
+        service = ValidationService(known_terms=["Machine  Learning"])
+        result = service.validate_term("machine learning")
+
+        mock_get.assert_not_called()
+        assert result.is_valid is True
+        assert result.severity == "ok"
+        assert result.hit_count == ValidationService.KNOWN_TERM_HITS
+
+    def test_load_known_terms(self, tmp_path):
+        """Test known-terms files skip comments and blank lines."""
+        path = tmp_path / "terms.txt"
+        path.write_text("# OpenAlex concepts\nDeep   Learning\n\nHealthcare\n", encoding="utf-8")
+
+        assert load_known_terms(path) == {"deep learning", "healthcare"}
+
     def test_clear_cache(self):
         """Test cache clearing."""
         service = ValidationService()